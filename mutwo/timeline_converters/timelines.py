@@ -1,5 +1,10 @@
+import asyncio
+import bisect
+import collections
+import itertools
 import random
 import typing
+import weakref
 
 import ranges
 
@@ -8,32 +13,221 @@ from mutwo import core_events
 from mutwo import core_parameters
 from mutwo import core_utilities
 from mutwo import timeline_interfaces
+from mutwo import timeline_utilities
 
 __all__ = (
     "TimeLineToEventPlacementDict",
     "TimeLineToConcurrence",
+    "IncrementalTimeLineToConcurrence",
     "TimeLineToEventPlacementTuple",
     "EventPlacementTupleToGaplessEventPlacementTuple",
     "EventPlacementTupleToSplitEventPlacementDict",
 )
 
 Tag: typing.TypeAlias = "str"
+OverlapPolicy: typing.TypeAlias = typing.Literal["ignore", "warn", "raise"]
 
 
 class TimeLineToEventPlacementDict(core_converters.abc.Converter):
+    """Get the sorted :class:`~mutwo.timeline_interfaces.EventPlacement` of each tag.
+
+    :param on_overlap: What happens if two placements with a common tag
+        are overlapping. ``"ignore"`` doesn't check for overlaps,
+        ``"warn"`` logs a
+        :class:`mutwo.timeline_utilities.OverlappingEventPlacementWarning`
+        for each overlap and ``"raise"`` raises a
+        :class:`mutwo.timeline_utilities.OverlappingEventPlacementError`.
+        Each placement which overlaps with an earlier placement of the
+        same tag is reported once. Default to ``"ignore"``.
+    :type on_overlap: OverlapPolicy
+
+    The placements of each tag are sorted by their start (and if equal by
+    their end), the converted :class:`~mutwo.timeline_interfaces.TimeLine`
+    itself isn't sorted. The converter keeps an index of the placements
+    of each tag of the last converted time line: if the same time line is
+    converted again and it didn't change (see
+    :attr:`mutwo.timeline_interfaces.TimeLine.version`), the result is
+    returned immediately. Otherwise only the changes of its change journal
+    are applied and only the tags which are touched by a change are
+    checked for overlaps again.
+    """
+
+    def __init__(self, on_overlap: OverlapPolicy = "ignore"):
+        if on_overlap not in ("ignore", "warn", "raise"):
+            raise ValueError(f"Unknown overlap policy '{on_overlap}'!")
+        self._on_overlap = on_overlap
+        self._reset()
+
+    def _reset(self, timeline: typing.Optional[timeline_interfaces.TimeLine] = None):
+        self._timeline_reference = None if timeline is None else weakref.ref(timeline)
+        self._version = 0
+        # For each tag the placements are sorted by their key (start, end
+        # and the order in which they were indexed, so that the order of
+        # equal placements is reproducible). We remember the indexed state
+        # (tags, key and how often it's registered) of each placement,
+        # because the placement itself may already have changed when it's
+        # removed.
+        self._counter = itertools.count()
+        self._tag_to_key_list: dict[Tag, list[tuple[float, float, int]]] = {}
+        self._tag_to_event_placement_list: dict[
+            Tag, list[timeline_interfaces.EventPlacement]
+        ] = {}
+        self._id_to_entry: dict[
+            int, tuple[tuple[Tag, ...], tuple[float, float, int], int]
+        ] = {}
+        self._tag_to_event_placement_tuple: dict[
+            Tag, tuple[timeline_interfaces.EventPlacement, ...]
+        ] = {}
+        self._tag_to_overlap_tuple: dict[
+            Tag, tuple[timeline_interfaces.Conflict, ...]
+        ] = {}
+
+    def _add(self, event_placement: timeline_interfaces.EventPlacement, count: int):
+        # A placement which is registered multiple times is also returned
+        # multiple times.
+        ep_id = id(event_placement)
+        try:
+            tag_tuple, key, old_count = self._id_to_entry[ep_id]
+        except KeyError:
+            tag_tuple = tuple(dict.fromkeys(event_placement.tag_tuple))
+            key = (
+                float(event_placement.min_start),
+                float(event_placement.max_end),
+                next(self._counter),
+            )
+            old_count = 0
+        for tag in tag_tuple:
+            key_list = self._tag_to_key_list.setdefault(tag, [])
+            i = bisect.bisect_left(key_list, key)
+            key_list[i:i] = [key] * count
+            self._tag_to_event_placement_list.setdefault(tag, [])[i:i] = [
+                event_placement
+            ] * count
+        self._id_to_entry[ep_id] = (tag_tuple, key, old_count + count)
+
+    def _remove(
+        self, event_placement: timeline_interfaces.EventPlacement, count: int
+    ) -> tuple[Tag, ...]:
+        ep_id = id(event_placement)
+        tag_tuple, key, old_count = self._id_to_entry[ep_id]
+        if count < old_count:
+            self._id_to_entry[ep_id] = (tag_tuple, key, old_count - count)
+        else:
+            del self._id_to_entry[ep_id]
+        for tag in tag_tuple:
+            key_list = self._tag_to_key_list[tag]
+            i = bisect.bisect_left(key_list, key)
+            del key_list[i : i + count]
+            del self._tag_to_event_placement_list[tag][i : i + count]
+            if not key_list:
+                del self._tag_to_key_list[tag]
+                del self._tag_to_event_placement_list[tag]
+        return tag_tuple
+
+    def _apply_change_tuple(
+        self, change_tuple: tuple[timeline_interfaces.TimeLineChange, ...]
+    ) -> set[Tag]:
+        changed_tag_set = set([])
+        for change in change_tuple:
+            event_placement = change.event_placement
+            if change.kind == "registered":
+                self._add(event_placement, 1)
+            elif change.kind == "unregistered":
+                changed_tag_set.update(self._remove(event_placement, 1))
+            # The placement moved or got a new event: it needs to be
+            # re-indexed with all its registrations.
+            else:
+                count = self._id_to_entry[id(event_placement)][-1]
+                changed_tag_set.update(self._remove(event_placement, count))
+                self._add(event_placement, count)
+            changed_tag_set.update(event_placement.tag_tuple)
+        return changed_tag_set
+
+    def _update(self, tag_set: set[Tag]):
+        for tag in tag_set:
+            try:
+                event_placement_list = self._tag_to_event_placement_list[tag]
+            except KeyError:
+                self._tag_to_event_placement_tuple.pop(tag, None)
+                self._tag_to_overlap_tuple.pop(tag, None)
+                continue
+            self._tag_to_event_placement_tuple[tag] = tuple(event_placement_list)
+            if self._on_overlap != "ignore":
+                self._tag_to_overlap_tuple[tag] = self._find_overlaps(tag)
+
+    def _find_overlaps(self, tag: Tag) -> tuple[timeline_interfaces.Conflict, ...]:
+        # One pass over the sorted placements: each placement is compared
+        # with the earlier placement which ends last.
+        overlap_list = []
+        last = None
+        for (start, end, _), event_placement in zip(
+            self._tag_to_key_list[tag], self._tag_to_event_placement_list[tag]
+        ):
+            if last is not None:
+                last_start, last_end, last_event_placement = last
+                if last_event_placement is event_placement:
+                    continue
+                # Empty placements only overlap with placements which
+                # start before them.
+                if start < last_end and last_start < end:
+                    overlap_list.append(
+                        timeline_interfaces.Conflict(
+                            last_event_placement, event_placement
+                        )
+                    )
+                if end <= last_end:
+                    continue
+            last = (start, end, event_placement)
+        return tuple(overlap_list)
+
+    def _handle_overlaps(self):
+        if self._on_overlap == "ignore":
+            return
+        key_set = set([])
+        conflict_list = []
+        for tag in sorted(self._tag_to_overlap_tuple):
+            for conflict in self._tag_to_overlap_tuple[tag]:
+                # Placements with multiple common tags only overlap once.
+                if (key := (id(conflict.left), id(conflict.right))) not in key_set:
+                    key_set.add(key)
+                    conflict_list.append(conflict)
+        if not conflict_list:
+            return
+        if self._on_overlap == "raise":
+            raise timeline_utilities.OverlappingEventPlacementError(
+                tuple(conflict_list)
+            )
+        for conflict in conflict_list:
+            self._logger.warning(
+                timeline_utilities.OverlappingEventPlacementWarning(conflict)
+            )
+
     def convert(
         self, timeline_to_convert: timeline_interfaces.TimeLine
     ) -> dict[Tag, tuple[timeline_interfaces.EventPlacement, ...]]:
-        timeline_to_convert.sort()
-        tag_to_event_placement_list = {tag: [] for tag in timeline_to_convert.tag_set}
-        for event_placement in timeline_to_convert.event_placement_tuple:
-            for tag in event_placement.tag_tuple:
-                # TODO(Add checks for overlaps!)
-                tag_to_event_placement_list[tag].append(event_placement)
-        return {
-            tag: tuple(event_placement_list)
-            for tag, event_placement_list in tag_to_event_placement_list.items()
-        }
+        version = timeline_to_convert.version
+        changed_tag_set = None
+        if (
+            self._timeline_reference is not None
+            and self._timeline_reference() is timeline_to_convert
+        ):
+            try:
+                change_tuple = timeline_to_convert.get_change_tuple(self._version)
+            except timeline_utilities.ForgottenChangesError:
+                pass
+            else:
+                changed_tag_set = self._apply_change_tuple(change_tuple)
+                if change_tuple:
+                    version = change_tuple[-1].version
+        if changed_tag_set is None:
+            self._reset(timeline_to_convert)
+            for event_placement in timeline_to_convert.event_placement_tuple:
+                self._add(event_placement, 1)
+            changed_tag_set = set(self._tag_to_event_placement_list)
+        self._version = version
+        self._update(changed_tag_set)
+        self._handle_overlaps()
+        return dict(self._tag_to_event_placement_tuple)
 
 
 class TimeLineToConcurrence(core_converters.abc.Converter):
@@ -45,6 +239,22 @@ class TimeLineToConcurrence(core_converters.abc.Converter):
         `ranges.Range` and :class:`TimeLineToConcurrence`
         needs to pick a value within the given range.
     :type random_seed: int
+    :param cache_size: How many converted events of
+        :class:`mutwo.timeline_interfaces.EventPlacement` are kept in a
+        least recently used cache. If this is bigger than ``0``, repeated
+        conversions of a :class:`~mutwo.timeline_interfaces.TimeLine`
+        only convert those placements which changed (or which got new
+        start or end times) and only re-create the events of those tags
+        which are touched by a changed placement. Only the conversion of
+        each placement (setting the duration of its event) is cached:
+        cached events are still copied each time a tag is re-created,
+        because events are changed when they are concatenated. Placements
+        with a start or end range get new random times in each conversion
+        and are therefore never cached. Changes inside the event of a
+        placement aren't detected (see
+        :attr:`mutwo.timeline_interfaces.EventPlacement.version`).
+        Default to ``0``.
+    :type cache_size: int
 
     The main intention of this converter is to convert a
     :class:`TimeLine` into a representation which is useable
@@ -69,26 +279,41 @@ class TimeLineToConcurrence(core_converters.abc.Converter):
     :class:`mutwo.midi_converters.EventToMidiFile`.
     """
 
-    def __init__(self, random_seed: int = 100):
+    def __init__(self, random_seed: int = 100, cache_size: int = 0):
         self._random = random.Random(random_seed)
+        self._cache_size = cache_size
+        self._key_to_event: collections.OrderedDict[
+            tuple[int, float, float], typing.Optional[core_events.Concurrence]
+        ] = collections.OrderedDict()
+        self._tag_to_signature_and_event: dict[
+            Tag, tuple[tuple, core_events.Concurrence]
+        ] = {}
 
     def _time_or_time_range_to_time(
-        self, time_or_time_range: ranges.Range | core_parameters.abc.Duration
+        self,
+        time_or_time_range: ranges.Range | core_parameters.abc.Duration,
+        random_generator: typing.Optional[random.Random] = None,
     ) -> core_parameters.abc.Duration:
         if isinstance(time_or_time_range, ranges.Range):
             return core_parameters.DirectDuration(
-                self._random.uniform(
+                (random_generator or self._random).uniform(
                     float(time_or_time_range.start), float(time_or_time_range.end)
                 )
             )
         return time_or_time_range
 
     def _event_placement_to_start_and_end(
-        self, event_placement: timeline_interfaces.EventPlacement
+        self,
+        event_placement: timeline_interfaces.EventPlacement,
+        random_generator: typing.Optional[random.Random] = None,
     ) -> tuple[core_parameters.abc.Duration, core_parameters.abc.Duration]:
         return (
-            self._time_or_time_range_to_time(event_placement.start_or_start_range),
-            self._time_or_time_range_to_time(event_placement.end_or_end_range),
+            self._time_or_time_range_to_time(
+                event_placement.start_or_start_range, random_generator
+            ),
+            self._time_or_time_range_to_time(
+                event_placement.end_or_end_range, random_generator
+            ),
         )
 
     def _append_to_simultaneous_event(
@@ -156,6 +381,33 @@ class TimeLineToConcurrence(core_converters.abc.Converter):
         except core_utilities.CannotSetDurationOfEmptyCompound:
             return None
 
+    def _event_placement_to_cached_event(
+        self,
+        event_placement: timeline_interfaces.EventPlacement,
+        start: core_parameters.abc.Duration,
+        end: core_parameters.abc.Duration,
+    ) -> typing.Optional[core_events.Concurrence]:
+        # Random times of ranges would never be found again: these
+        # placements would only push other placements out of the cache.
+        if isinstance(event_placement.start_or_start_range, ranges.Range) or (
+            isinstance(event_placement.end_or_end_range, ranges.Range)
+        ):
+            return self._event_placement_to_event(event_placement, start, end)
+        key = (event_placement.version, float(start), float(end))
+        try:
+            event = self._key_to_event[key]
+        except KeyError:
+            event = self._key_to_event[key] = self._event_placement_to_event(
+                event_placement, start, end
+            )
+            if len(self._key_to_event) > self._cache_size:
+                self._key_to_event.popitem(last=False)
+        else:
+            self._key_to_event.move_to_end(key)
+        # Events are changed when they are concatenated: the cached
+        # event itself can therefore never be part of the result.
+        return event.copy() if event is not None else None
+
     def convert(
         self, timeline_to_convert: timeline_interfaces.TimeLine
     ) -> core_events.Concurrence[
@@ -166,36 +418,558 @@ class TimeLineToConcurrence(core_converters.abc.Converter):
         duration = timeline_to_convert.duration
         tag_tuple = tuple(sorted(timeline_to_convert.tag_set))
 
-        tag_to_tagged_simultaneous_event = {
-            tag: core_events.Concurrence([], tag=tag) for tag in tag_tuple
-        }
+        timeline_to_convert.sort()
+        event_placement_and_time_list = [
+            (event_placement, *self._event_placement_to_start_and_end(event_placement))
+            for event_placement in timeline_to_convert.event_placement_tuple
+        ]
+
+        if self._cache_size:
+            tag_to_signature = self._get_tag_to_signature(
+                tag_tuple, event_placement_and_time_list, duration
+            )
+            # Only tags which are touched by a changed placement need to be
+            # re-created.
+            tag_set = {
+                tag
+                for tag in tag_tuple
+                if self._tag_to_signature_and_event.get(tag, (None,))[0]
+                != tag_to_signature[tag]
+            }
+            event_placement_to_event = self._event_placement_to_cached_event
+        else:
+            tag_set = set(tag_tuple)
+            event_placement_to_event = self._event_placement_to_event
+
+        tag_to_tagged_simultaneous_event = self._get_tag_to_tagged_simultaneous_event(
+            tag_set, event_placement_and_time_list, event_placement_to_event, duration
+        )
+
+        if self._cache_size:
+            for tag in tag_tuple:
+                if tag in tag_set:
+                    self._tag_to_signature_and_event[tag] = (
+                        tag_to_signature[tag],
+                        tag_to_tagged_simultaneous_event[tag].copy(),
+                    )
+                else:
+                    tag_to_tagged_simultaneous_event[tag] = (
+                        self._tag_to_signature_and_event[tag][1].copy()
+                    )
+
+        return core_events.Concurrence(
+            tuple(tag_to_tagged_simultaneous_event[tag] for tag in tag_tuple)
+        )
+
+    def convert_many(
+        self,
+        timeline_to_convert: timeline_interfaces.TimeLine,
+        random_seed_sequence: typing.Sequence[int],
+    ) -> tuple[
+        core_events.Concurrence[
+            core_events.Concurrence[core_events.Consecution[core_events.Chronon]]
+        ],
+        ...,
+    ]:
+        """Convert time line once for each random seed.
+
+        :param timeline_to_convert: The time line which is converted.
+        :type timeline_to_convert: timeline_interfaces.TimeLine
+        :param random_seed_sequence: For each seed one variant is created.
+        :type random_seed_sequence: typing.Sequence[int]
+
+        The variant of a seed is equal to the result of
+        ``TimeLineToConcurrence(random_seed=seed).convert(timeline_to_convert)``.
+        But all work which doesn't depend on the seed is only done once: the
+        time line is only sorted once, tags which aren't used by any
+        :class:`~mutwo.timeline_interfaces.EventPlacement` with ranges are
+        only converted once (and copied for each variant) and the random
+        times of all variants are drawn before any event is created. This
+        method neither uses nor changes the cache or the random state of
+        the converter.
+        """
+        duration = timeline_to_convert.duration
+        tag_tuple = tuple(sorted(timeline_to_convert.tag_set))
 
         timeline_to_convert.sort()
+        # For each placement either its fixed start and end or 'None' if it
+        # has any range and its times differ between the variants.
+        event_placement_and_time_tuple_list: list[
+            tuple[
+                timeline_interfaces.EventPlacement,
+                typing.Optional[
+                    tuple[core_parameters.abc.Duration, core_parameters.abc.Duration]
+                ],
+            ]
+        ] = []
+        ranged_event_placement_list = []
         for event_placement in timeline_to_convert.event_placement_tuple:
-            start, end = self._event_placement_to_start_and_end(event_placement)
+            if isinstance(
+                event_placement.start_or_start_range, ranges.Range
+            ) or isinstance(event_placement.end_or_end_range, ranges.Range):
+                ranged_event_placement_list.append(event_placement)
+                event_placement_and_time_tuple_list.append((event_placement, None))
+            else:
+                event_placement_and_time_tuple_list.append(
+                    (
+                        event_placement,
+                        (
+                            event_placement.start_or_start_range,
+                            event_placement.end_or_end_range,
+                        ),
+                    )
+                )
+        ranged_tag_set = {
+            tag
+            for event_placement in ranged_event_placement_list
+            for tag in event_placement.tag_tuple
+        }
+
+        # Tags without any ranged placement are equal in all variants.
+        fixed_tag_to_tagged_simultaneous_event = (
+            self._get_tag_to_tagged_simultaneous_event(
+                set(tag_tuple).difference(ranged_tag_set),
+                [
+                    (event_placement, *time_tuple)
+                    for event_placement, time_tuple in (
+                        event_placement_and_time_tuple_list
+                    )
+                    if time_tuple is not None
+                ],
+                self._event_placement_to_event,
+                duration,
+            )
+        )
+
+        # All other tags need to be created for each variant. Still the
+        # events of placements without ranges are only created once, but
+        # each variant needs copies (events are changed when they are
+        # concatenated).
+        event_placement_and_time_tuple_list = [
+            (event_placement, time_tuple)
+            for event_placement, time_tuple in event_placement_and_time_tuple_list
+            if not ranged_tag_set.isdisjoint(event_placement.tag_tuple)
+        ]
+        id_to_event = {
+            id(event_placement): self._event_placement_to_event(
+                event_placement, *time_tuple
+            )
+            for event_placement, time_tuple in event_placement_and_time_tuple_list
+            if time_tuple is not None
+        }
+
+        def event_placement_to_event(
+            event_placement: timeline_interfaces.EventPlacement,
+            start: core_parameters.abc.Duration,
+            end: core_parameters.abc.Duration,
+        ) -> typing.Optional[core_events.Concurrence]:
+            try:
+                event = id_to_event[id(event_placement)]
+            except KeyError:
+                return self._event_placement_to_event(event_placement, start, end)
+            return event.copy() if event is not None else None
+
+        # One row of random times for each seed. The times are drawn in the
+        # same order as in 'convert', so that the results are equal.
+        time_matrix = [
+            [
+                self._event_placement_to_start_and_end(
+                    event_placement, random_generator
+                )
+                for event_placement in ranged_event_placement_list
+            ]
+            for random_generator in map(random.Random, random_seed_sequence)
+        ]
+
+        concurrence_list = []
+        for time_list in time_matrix:
+            time_iterator = iter(time_list)
+            tag_to_tagged_simultaneous_event = (
+                self._get_tag_to_tagged_simultaneous_event(
+                    ranged_tag_set,
+                    [
+                        (
+                            event_placement,
+                            *(
+                                next(time_iterator)
+                                if time_tuple is None
+                                else time_tuple
+                            ),
+                        )
+                        for event_placement, time_tuple in (
+                            event_placement_and_time_tuple_list
+                        )
+                    ],
+                    event_placement_to_event,
+                    duration,
+                )
+            )
+            for tag, event in fixed_tag_to_tagged_simultaneous_event.items():
+                tag_to_tagged_simultaneous_event[tag] = event.copy()
+            concurrence_list.append(
+                core_events.Concurrence(
+                    tuple(tag_to_tagged_simultaneous_event[tag] for tag in tag_tuple)
+                )
+            )
+        return tuple(concurrence_list)
+
+    def _get_tag_to_tagged_simultaneous_event(
+        self,
+        tag_set: set[Tag],
+        event_placement_and_time_list: list[
+            tuple[
+                timeline_interfaces.EventPlacement,
+                core_parameters.abc.Duration,
+                core_parameters.abc.Duration,
+            ]
+        ],
+        event_placement_to_event: typing.Callable[
+            [
+                timeline_interfaces.EventPlacement,
+                core_parameters.abc.Duration,
+                core_parameters.abc.Duration,
+            ],
+            typing.Optional[core_events.Concurrence],
+        ],
+        duration: core_parameters.abc.Duration,
+    ) -> dict[Tag, core_events.Concurrence]:
+        tag_to_tagged_simultaneous_event = {
+            tag: core_events.Concurrence([], tag=tag) for tag in tag_set
+        }
+
+        for event_placement, start, end in event_placement_and_time_list:
+            if tag_set.isdisjoint(event_placement.tag_tuple):
+                continue
             # If the event of our event placement doesn't have any children,
             # this is `None` and we just need to ignore it.
-            if not (
-                event := self._event_placement_to_event(event_placement, start, end)
-            ):
+            if not (event := event_placement_to_event(event_placement, start, end)):
                 continue
             for tagged_event in event:
                 tag = tagged_event.tag
-                self._add_tagged_event_to_simultaneous_event(
-                    start,
-                    tag_to_tagged_simultaneous_event[tag],
-                    tagged_event,
+                if tag in tag_set:
+                    self._add_tagged_event_to_simultaneous_event(
+                        start,
+                        tag_to_tagged_simultaneous_event[tag],
+                        tagged_event,
+                    )
+
+        if tag_to_tagged_simultaneous_event:
+            duration = duration or max(
+                (e.duration for e in tag_to_tagged_simultaneous_event.values())
+            )
+        for e in tag_to_tagged_simultaneous_event.values():
+            # Tags without any event in the converted span are filled
+            # with a rest.
+            if not e:
+                e.append(core_events.Consecution([]))
+            e.extend_until(duration)
+        return tag_to_tagged_simultaneous_event
+
+    def _get_tag_to_signature(
+        self,
+        tag_tuple: tuple[Tag, ...],
+        event_placement_and_time_list: list[
+            tuple[
+                timeline_interfaces.EventPlacement,
+                core_parameters.abc.Duration,
+                core_parameters.abc.Duration,
+            ]
+        ],
+        duration: core_parameters.abc.Duration,
+    ) -> dict[Tag, tuple]:
+        # The signature of a tag describes all input which is necessary to
+        # create the event of this tag: if it's equal, the event is equal.
+        tag_to_signature_list: dict[Tag, list] = {tag: [] for tag in tag_tuple}
+        for event_placement, start, end in event_placement_and_time_list:
+            for tag in event_placement.tag_tuple:
+                tag_to_signature_list[tag].append(
+                    (event_placement.version, float(start), float(end))
                 )
+        return {
+            tag: (float(duration), tuple(signature_list))
+            for tag, signature_list in tag_to_signature_list.items()
+        }
+
+
+class IncrementalTimeLineToConcurrence(TimeLineToConcurrence):
+    """Convert a growing time line segment by segment while it's played.
+
+    :param random_seed: See :class:`TimeLineToConcurrence`.
+    :type random_seed: int
+    :param start: The initial position of the playhead. Default to ``0``.
+    :type start: core_parameters.abc.Duration.Type
+
+    Each call of :meth:`convert` moves the playhead forward and returns the
+    material between the previous and the new position of the playhead:
+    a :class:`mutwo.core_events.Concurrence` with one tagged
+    :class:`~mutwo.core_events.Concurrence` for each tag which is known
+    so far (sorted by tag), all of them with the duration of the segment.
+    Emitted segments are final. Placements which cross the end of a
+    segment are cut and continue in the next segments.
+
+    The converter follows the change journal of the converted
+    :class:`~mutwo.timeline_interfaces.TimeLine` (see
+    :meth:`mutwo.timeline_interfaces.TimeLine.get_change_tuple`), so that
+    each call only needs to handle new, changed and sounding placements.
+    Placements can therefore be registered (or changed) while the time
+    line is played: if a placement is registered before the playhead
+    passes its start, it's part of the next segment. Otherwise only its
+    part after the playhead is emitted. The latency between registering a
+    placement and its output is therefore bounded by the segment size.
 
-        duration = duration or max(
-            (e.duration for e in tag_to_tagged_simultaneous_event.values())
+    **Example:**
+
+    >>> from mutwo import core_events, timeline_converters, timeline_interfaces
+    >>> timeline = timeline_interfaces.TimeLine()
+    >>> converter = timeline_converters.IncrementalTimeLineToConcurrence()
+    >>> timeline.register(
+    ...     timeline_interfaces.EventPlacement(
+    ...         core_events.Concurrence([core_events.Chronon(2, tag="a")]), 1, 3
+    ...     )
+    ... )
+    >>> [float(e.duration) for e in converter.convert(timeline, 2)]
+    [2.0]
+    >>> [float(c.duration) for c in converter.convert(timeline, 4)[0][0]]
+    [1.0, 1.0]
+    """
+
+    def __init__(
+        self,
+        random_seed: int = 100,
+        start: core_parameters.abc.Duration.Type = 0,
+    ):
+        super().__init__(random_seed)
+        self._position = core_parameters.abc.Duration.from_any(start)
+        self._timeline_reference: typing.Optional[weakref.ref] = None
+        self._version = 0
+        self._id_to_count: dict[int, int] = {}
+        self._tag_set: set[Tag] = set([])
+        # Placements which didn't start yet are sorted by their start and
+        # the order in which they were added.
+        self._counter = itertools.count()
+        self._pending_key_list: list[tuple[float, int]] = []
+        self._key_to_pending: dict[
+            tuple[float, int],
+            tuple[
+                timeline_interfaces.EventPlacement,
+                core_parameters.abc.Duration,
+                core_parameters.abc.Duration,
+            ],
+        ] = {}
+        self._id_to_pending_key: dict[int, tuple[float, int]] = {}
+        # Placements which started, but which didn't end yet, and their
+        # converted events (which are cut for each segment).
+        self._id_to_active: dict[
+            int,
+            tuple[
+                tuple[float, int],
+                timeline_interfaces.EventPlacement,
+                core_parameters.abc.Duration,
+                core_parameters.abc.Duration,
+                typing.Optional[core_events.Concurrence],
+            ],
+        ] = {}
+
+    @property
+    def position(self) -> core_parameters.abc.Duration:
+        """The current position of the playhead."""
+        return self._position
+
+    def _add(self, event_placement: timeline_interfaces.EventPlacement):
+        start, end = self._event_placement_to_start_and_end(event_placement)
+        self._tag_set.update(event_placement.tag_tuple)
+        # Placements which are already over are never emitted.
+        if end <= self._position:
+            return
+        key = (float(start), next(self._counter))
+        bisect.insort(self._pending_key_list, key)
+        self._key_to_pending[key] = (event_placement, start, end)
+        self._id_to_pending_key[id(event_placement)] = key
+
+    def _discard(self, event_placement: timeline_interfaces.EventPlacement):
+        ep_id = id(event_placement)
+        if (key := self._id_to_pending_key.pop(ep_id, None)) is not None:
+            del self._pending_key_list[bisect.bisect_left(self._pending_key_list, key)]
+            del self._key_to_pending[key]
+        self._id_to_active.pop(ep_id, None)
+
+    def _synchronize(self, timeline: timeline_interfaces.TimeLine):
+        version = timeline.version
+        if (
+            self._timeline_reference is not None
+            and self._timeline_reference() is timeline
+        ):
+            try:
+                change_tuple = timeline.get_change_tuple(self._version)
+            except timeline_utilities.ForgottenChangesError:
+                pass
+            else:
+                for change in change_tuple:
+                    event_placement = change.event_placement
+                    ep_id = id(event_placement)
+                    if change.kind == "registered":
+                        self._id_to_count[ep_id] = self._id_to_count.get(ep_id, 0) + 1
+                        if self._id_to_count[ep_id] == 1:
+                            self._add(event_placement)
+                    elif change.kind == "unregistered":
+                        if (count := self._id_to_count[ep_id] - 1) > 0:
+                            self._id_to_count[ep_id] = count
+                        else:
+                            del self._id_to_count[ep_id]
+                            self._discard(event_placement)
+                    # The placement moved or got a new event: its rest
+                    # is emitted according to its new state.
+                    else:
+                        self._discard(event_placement)
+                        self._add(event_placement)
+                self._version = change_tuple[-1].version if change_tuple else version
+                return
+        # The converter doesn't know the time line (or its changes), so it
+        # needs to start from scratch.
+        self._timeline_reference = weakref.ref(timeline)
+        self._id_to_count = {}
+        self._pending_key_list = []
+        self._key_to_pending = {}
+        self._id_to_pending_key = {}
+        self._id_to_active = {}
+        for event_placement in timeline.event_placement_tuple:
+            ep_id = id(event_placement)
+            self._id_to_count[ep_id] = self._id_to_count.get(ep_id, 0) + 1
+            if self._id_to_count[ep_id] == 1:
+                self._add(event_placement)
+        self._version = version
+
+    def convert(
+        self,
+        timeline_to_convert: timeline_interfaces.TimeLine,
+        playhead: core_parameters.abc.Duration.Type,
+    ) -> core_events.Concurrence[
+        core_events.Concurrence[core_events.Consecution[core_events.Chronon]]
+    ]:
+        """Move playhead and get the material which it passed.
+
+        :param timeline_to_convert: The played time line. If another time
+            line than in the previous call is passed, the converter starts
+            from scratch (but it keeps the position of the playhead).
+        :type timeline_to_convert: timeline_interfaces.TimeLine
+        :param playhead: The new position of the playhead.
+        :type playhead: core_parameters.abc.Duration.Type
+        :raises ValueError: If the playhead would move backwards.
+        """
+        playhead = core_parameters.abc.Duration.from_any(playhead)
+        if playhead < self._position:
+            raise ValueError(
+                f"Can't move playhead backwards from '{self._position}' "
+                f"to '{playhead}'!"
+            )
+        self._synchronize(timeline_to_convert)
+
+        segment_start, segment_end = self._position, playhead
+        started_count = bisect.bisect_left(
+            self._pending_key_list, (float(segment_end),)
         )
-        [e.extend_until(duration) for e in tag_to_tagged_simultaneous_event.values()]
+        for key in self._pending_key_list[:started_count]:
+            event_placement, start, end = self._key_to_pending.pop(key)
+            del self._id_to_pending_key[id(event_placement)]
+            self._id_to_active[id(event_placement)] = (
+                key,
+                event_placement,
+                start,
+                end,
+                self._event_placement_to_event(event_placement, start, end),
+            )
+        del self._pending_key_list[:started_count]
+
+        event_placement_and_time_list = []
+        id_to_event = {}
+        for key, event_placement, start, end, event in sorted(
+            self._id_to_active.values(), key=lambda active: active[0]
+        ):
+            if end <= segment_end:
+                del self._id_to_active[id(event_placement)]
+            clipped_start = max(start, segment_start)
+            clipped_end = min(end, segment_end)
+            if event is None or clipped_end <= clipped_start:
+                continue
+            event = event.copy()
+            if clipped_start > start or clipped_end < end:
+                event.cut_out(clipped_start - start, clipped_end - start)
+            id_to_event[id(event_placement)] = event
+            event_placement_and_time_list.append(
+                (
+                    event_placement,
+                    clipped_start - segment_start,
+                    clipped_end - segment_start,
+                )
+            )
 
+        self._position = playhead
+        tag_to_tagged_simultaneous_event = self._get_tag_to_tagged_simultaneous_event(
+            set(self._tag_set),
+            event_placement_and_time_list,
+            lambda event_placement, *_: id_to_event[id(event_placement)],
+            segment_end - segment_start,
+        )
         return core_events.Concurrence(
-            tuple(tag_to_tagged_simultaneous_event.values())
+            tuple(
+                tag_to_tagged_simultaneous_event[tag] for tag in sorted(self._tag_set)
+            )
         )
 
+    async def stream(
+        self,
+        timeline_to_convert: timeline_interfaces.TimeLine,
+        segment_duration: core_parameters.abc.Duration.Type = 1,
+        end: typing.Optional[core_parameters.abc.Duration.Type] = None,
+        seconds_per_beat: float = 1,
+    ) -> typing.AsyncIterator[
+        core_events.Concurrence[
+            core_events.Concurrence[core_events.Consecution[core_events.Chronon]]
+        ]
+    ]:
+        """Play time line in real time and emit each passed segment.
+
+        :param timeline_to_convert: The played time line. It may be
+            changed while it's played (e.g. by other tasks of the event
+            loop).
+        :type timeline_to_convert: timeline_interfaces.TimeLine
+        :param segment_duration: The duration of each segment. This is the
+            maximum latency between registering a placement and its output.
+            Default to ``1``.
+        :type segment_duration: core_parameters.abc.Duration.Type
+        :param end: If set, the iterator stops when the playhead reaches
+            this position. Otherwise it runs until it's cancelled. Default
+            to ``None``.
+        :type end: typing.Optional[core_parameters.abc.Duration.Type]
+        :param seconds_per_beat: How many seconds of the event loop clock
+            pass for one beat of the time line. Default to ``1``.
+        :type seconds_per_beat: float
+
+        The playhead starts at the current :attr:`position` and moves with
+        the clock of the running event loop. Each segment is emitted (see
+        :meth:`convert`) as soon as the playhead passed it.
+        """
+        segment_duration = core_parameters.abc.Duration.from_any(segment_duration)
+        if segment_duration <= 0:
+            raise ValueError("Segment duration needs to be bigger than 0!")
+        if end is not None:
+            end = core_parameters.abc.Duration.from_any(end)
+        loop = asyncio.get_running_loop()
+        start, start_time = float(self._position), loop.time()
+        while end is None or self._position < end:
+            playhead = self._position + segment_duration
+            if end is not None:
+                playhead = min(playhead, end)
+            await asyncio.sleep(
+                max(
+                    start_time
+                    + (float(playhead) - start) * seconds_per_beat
+                    - loop.time(),
+                    0,
+                )
+            )
+            yield self.convert(timeline_to_convert, playhead)
+
 
 class TimeLineToEventPlacementTuple(core_converters.abc.Converter):
     """Fetch from :class:`~mutwo.timeline_interfaces.TimeLine` all :class:`~mutwo.timeline_interfaces.EventPlacement` which contains of user defined tags.
@@ -1,14 +1,25 @@
 from __future__ import annotations
 
 import abc
+import bisect
+import concurrent.futures
 import copy
 import dataclasses
+import hashlib
+import heapq
 import itertools
+import math
+import pickle
 import statistics
+import sys
+import threading
+import types
 import typing
+import weakref
 
 import ranges
 
+from mutwo import core_constants
 from mutwo import core_events
 from mutwo import core_parameters
 from mutwo import core_utilities
@@ -17,18 +28,79 @@ from mutwo import timeline_utilities
 UnspecificTime: typing.TypeAlias = core_parameters.abc.Duration.Type
 UnspecificTimeOrTimeRange: typing.TypeAlias = "UnspecificTime | ranges.Range"
 TimeOrTimeRange: typing.TypeAlias = "core_parameters.abc.Duration | ranges.Range"
+ChangeKind: typing.TypeAlias = typing.Literal[
+    "registered", "unregistered", "moved", "event_replaced"
+]
+SplitPolicy: typing.TypeAlias = typing.Literal["start", "clip", "duplicate"]
+IsConflict: typing.TypeAlias = (
+    "typing.Callable[[EventPlacement, EventPlacement], bool] | ConflictRuleSet"
+)
+
+# Versions are unique across all placements, so that a version identifies
+# a specific state of a specific placement.
+_version_counter = itertools.count()
 
 __all__ = (
     "EventPlacement",
     "TimeLine",
+    "ConcurrentTimeLine",
+    "TimeLineChange",
+    "EventDeduplicationReport",
+    "TimeLineMemoryReport",
     "Conflict",
+    "ConflictRuleSet",
     "ConflictResolutionStrategy",
     "AlwaysLeftStrategy",
     "AlternatingStrategy",
     "TagCountStrategy",
+    "WeightedIntervalSchedulingStrategy",
+    "ShiftWithinRangeStrategy",
+    "ShiftLaterStrategy",
 )
 
 
+# Defaults of callable parameters are module level functions instead of
+# lambdas, so that they can be pickled (and be sent to other processes).
+def _is_sharing_tag(
+    event_placement0: EventPlacement, event_placement1: EventPlacement
+) -> bool:
+    return bool(
+        set(event_placement0.tag_tuple).intersection(set(event_placement1.tag_tuple))
+    )
+
+
+def _get_duration_weight(event_placement: EventPlacement) -> float:
+    return float(event_placement.duration)
+
+
+def _get_sort_key(event_placement: EventPlacement) -> tuple[float, float]:
+    # Equal to the order of 'TimeLine.sort', but floats are compared much
+    # faster than durations.
+    return float(event_placement.min_start), float(event_placement.max_end)
+
+
+def _is_overlapping(
+    start: float, end: float, other_start: float, other_end: float
+) -> bool:
+    # The overlap rule of 'EventPlacement.is_overlapping', which is shared
+    # by all conflict detections: an empty placement overlaps with
+    # placements which start before and end after it and with empty
+    # placements at the same time.
+    return (start < other_end and other_start < end) or (
+        start == end == other_start == other_end
+    )
+
+
+def _get_resource_tuple(
+    event_placement: EventPlacement, rule_set: typing.Optional[ConflictRuleSet]
+) -> tuple[tuple[str | int, int], ...]:
+    # Without a rule set each tag is a resource which can only be used by
+    # one placement at the same time.
+    if rule_set is None:
+        return tuple((tag, 1) for tag in dict.fromkeys(event_placement.tag_tuple))
+    return rule_set._get_resource_tuple(event_placement.tag_tuple)
+
+
 class EventPlacement(core_utilities.MutwoObject):
     """Place any event at specific start and end times.
 
@@ -49,6 +121,13 @@ class EventPlacement(core_utilities.MutwoObject):
         :class:`ranges.Range` of two durations. In the second case
         the placement is flexible within the given area.
     :type end_or_end_range: UnspecificTimeOrTimeRange
+    :param share_event: If set to ``True``, the event is treated as
+        immutable and can therefore be shared with other placements (e.g.
+        a motif which is repeated many times). Copies of the placement
+        then reference the same event instead of copying it. To change
+        the event of one placement only, use :meth:`get_mutable_event`.
+        Default to ``False``.
+    :type share_event: bool
 
     **Warning:**
 
@@ -65,11 +144,129 @@ class EventPlacement(core_utilities.MutwoObject):
         ],
         start_or_start_range: UnspecificTimeOrTimeRange,
         end_or_end_range: UnspecificTimeOrTimeRange,
+        *,
+        share_event: bool = False,
     ):
+        # Callables which are called with the event placement and the kind
+        # of change after its start, end or event changed (e.g. used by
+        # 'TimeLine' to keep its indices up to date).
+        self._change_listener_list: list[
+            typing.Callable[[EventPlacement, ChangeKind], None]
+        ] = []
+        self._is_event_shared = share_event
+        # The structural hash and the digest of the event are cached for
+        # one specific version.
+        self._structural_hash_version: typing.Optional[int] = None
+        self._event_digest_version: typing.Optional[int] = None
         self.start_or_start_range = start_or_start_range
         self.end_or_end_range = end_or_end_range
         self.event = event
-        self._logger = core_utilities.get_cls_logger(type(self))
+
+    # ###################################################################### #
+    #                          public class methods                          #
+    # ###################################################################### #
+
+    @classmethod
+    def from_arrays(
+        cls,
+        event_sequence: typing.Sequence[core_events.Concurrence],
+        start_sequence: typing.Sequence[core_constants.Real],
+        end_sequence: typing.Sequence[core_constants.Real],
+        *,
+        max_start_sequence: typing.Optional[
+            typing.Sequence[core_constants.Real]
+        ] = None,
+        max_end_sequence: typing.Optional[typing.Sequence[core_constants.Real]] = None,
+        share_event: bool = False,
+    ) -> tuple[EventPlacement, ...]:
+        """Create many :class:`EventPlacement` at once.
+
+        :param event_sequence: The events of the placements.
+        :type event_sequence: typing.Sequence[core_events.Concurrence]
+        :param start_sequence: The start times (or the lower bounds of the
+            start ranges) of the placements as numbers.
+        :type start_sequence: typing.Sequence[core_constants.Real]
+        :param end_sequence: The end times (or the lower bounds of the
+            end ranges) of the placements as numbers.
+        :type end_sequence: typing.Sequence[core_constants.Real]
+        :param max_start_sequence: If set, the upper bounds of the start
+            ranges. If an upper bound is bigger than its start, the
+            placement gets a flexible start range. Default to ``None``.
+        :type max_start_sequence: typing.Optional[typing.Sequence[core_constants.Real]]
+        :param max_end_sequence: If set, the upper bounds of the end
+            ranges. Default to ``None``.
+        :type max_end_sequence: typing.Optional[typing.Sequence[core_constants.Real]]
+        :param share_event: See :class:`EventPlacement`. Default to ``False``.
+        :type share_event: bool
+        :raises ValueError: If the sequences have different lengths or if
+            the bounds of any range are in the wrong order. Like
+            :class:`EventPlacement` itself, placements are accepted
+            regardless of how their start and end are ordered.
+
+        This is much faster than initialising each :class:`EventPlacement`
+        separately: all sequences are validated at once and the
+        placements are created without notifying any listeners.
+        """
+        # We round in the same way as 'DirectDuration' does, so that we can
+        # compare the plain numbers.
+        digit_count = core_parameters.configurations.ROUND_DURATION_TO_N_DIGITS
+
+        def to_float_list(
+            time_sequence: typing.Sequence[core_constants.Real],
+        ) -> list[float]:
+            return [round(float(t), digit_count) for t in time_sequence]
+
+        start_list = to_float_list(start_sequence)
+        end_list = to_float_list(end_sequence)
+        max_start_list = (
+            start_list
+            if max_start_sequence is None
+            else to_float_list(max_start_sequence)
+        )
+        max_end_list = (
+            end_list if max_end_sequence is None else to_float_list(max_end_sequence)
+        )
+
+        event_placement_count = len(event_sequence)
+        if any(
+            len(time_list) != event_placement_count
+            for time_list in (start_list, end_list, max_start_list, max_end_list)
+        ):
+            raise ValueError("All sequences need to have the same length!")
+        if not all(
+            start <= max_start and end <= max_end
+            for start, max_start, end, max_end in zip(
+                start_list, max_start_list, end_list, max_end_list
+            )
+        ):
+            raise ValueError("Found start or end ranges with wrong order!")
+
+        # Each bound gets its own duration object, because durations can
+        # be changed in place.
+        to_duration = core_parameters.DirectDuration
+
+        def to_time_or_time_range(minimum: float, maximum: float) -> TimeOrTimeRange:
+            if maximum > minimum:
+                return ranges.Range(to_duration(minimum), to_duration(maximum))
+            return to_duration(minimum)
+
+        event_placement_list = []
+        for event, start, max_start, end, max_end in zip(
+            event_sequence, start_list, max_start_list, end_list, max_end_list
+        ):
+            event_placement = cls.__new__(cls)
+            event_placement._change_listener_list = []
+            event_placement._version = next(_version_counter)
+            event_placement._is_event_shared = share_event
+            event_placement._structural_hash_version = None
+            event_placement._event_digest_version = None
+            event_placement._event = event
+            event_placement._start_or_start_range = to_time_or_time_range(
+                start, max_start
+            )
+            event_placement._end_or_end_range = to_time_or_time_range(end, max_end)
+            event_placement_list.append(event_placement)
+        return tuple(event_placement_list)
 
     # ###################################################################### #
     #                       private static methods                           #
@@ -144,13 +341,58 @@ class EventPlacement(core_utilities.MutwoObject):
         else:
             return time_or_time_range + duration
 
+    # ###################################################################### #
+    #                          private methods                               #
+    # ###################################################################### #
+
+    def _notify_change(self, kind: ChangeKind):
+        self._version = next(_version_counter)
+        for change_listener in self._change_listener_list:
+            change_listener(self, kind)
+
+    def _get_event_digest(self) -> tuple[bytes, int]:
+        # Digest and size of the pickled event, see 'TimeLine.deduplicate_events'.
+        # As the structural hash it's only calculated once for each version.
+        if self._event_digest_version != self._version:
+            data = pickle.dumps(self.event)
+            self._event_digest = (hashlib.blake2b(data).digest(), len(data))
+            self._event_digest_version = self._version
+        return self._event_digest
+
     # ###################################################################### #
     #                          magic methods                                 #
     # ###################################################################### #
 
+    def __getstate__(self) -> dict[str, typing.Any]:
+        # Listeners belong to the time lines which host the placement and
+        # shouldn't be copied or pickled together with the placement.
+        state = self.__dict__.copy()
+        state["_change_listener_list"] = []
+        # Hashes of strings differ between processes.
+        state["_structural_hash_version"] = None
+        state["_event_digest_version"] = None
+        return state
+
     def __eq__(self, other: typing.Any) -> bool:
-        return core_utilities.test_if_objects_are_equal_by_parameter_tuple(
-            self, other, ("event", "start_or_start_range", "end_or_end_range")
+        if self is other:
+            return True
+        if not isinstance(other, EventPlacement):
+            return core_utilities.test_if_objects_are_equal_by_parameter_tuple(
+                self, other, ("event", "start_or_start_range", "end_or_end_range")
+            )
+        # Comparing mutwo events is expensive, so we first try cheaper
+        # ways to find out that both placements are different.
+        if (
+            self._structural_hash_version == self._version
+            and other._structural_hash_version == other._version
+            and self._structural_hash != other._structural_hash
+        ):
+            return False
+        return (
+            self.start_or_start_range == other.start_or_start_range
+            and self.end_or_end_range == other.end_or_end_range
+            and self.tag_tuple == other.tag_tuple
+            and (self.event is other.event or self.event == other.event)
         )
 
     def __str__(self) -> str:
@@ -164,6 +406,67 @@ class EventPlacement(core_utilities.MutwoObject):
     #                          public properties                             #
     # ###################################################################### #
 
+    @property
+    def version(self) -> int:
+        """Number which changes each time the placement changes.
+
+        The version is unique across all placements. Changes inside the
+        event of the placement can't be detected: in this case the
+        event needs to be set again to update the version (e.g.
+        ``event_placement.event = event_placement.event``).
+        """
+        return self._version
+
+    @property
+    def structural_hash(self) -> int:
+        """Hash of the start, end and event of the placement.
+
+        Equal placements always have an equal hash, so that placements
+        with different hashes are known to be different without comparing
+        their events. The hash is only calculated once for each
+        :attr:`version`: as for the version, changes inside the event
+        can't be detected.
+        """
+        if self._structural_hash_version != self._version:
+            self._structural_hash = hash(
+                (
+                    float(self.min_start),
+                    float(self.max_start),
+                    float(self.min_end),
+                    float(self.max_end),
+                    self.tag_tuple,
+                    float(self.event.duration),
+                )
+            )
+            self._structural_hash_version = self._version
+        return self._structural_hash
+
+    @property
+    def is_event_shared(self) -> bool:
+        """``True`` if the event may be shared with other placements.
+
+        See the ``share_event`` parameter of :class:`EventPlacement`.
+        """
+        return self._is_event_shared
+
+    @property
+    def event(
+        self,
+    ) -> core_events.Concurrence[
+        core_events.Chronon | core_events.Consecution | core_events.Concurrence
+    ]:
+        return self._event
+
+    @event.setter
+    def event(
+        self,
+        event: core_events.Concurrence[
+            core_events.Chronon | core_events.Consecution | core_events.Concurrence
+        ],
+    ):
+        self._event = event
+        self._notify_change("event_replaced")
+
     @property
     def tag_tuple(self) -> tuple[str, ...]:
         return tuple(event.tag for event in self.event)
@@ -177,6 +480,7 @@ class EventPlacement(core_utilities.MutwoObject):
         self._start_or_start_range = self._unspecified_to_specified_time_or_time_range(
             start_or_start_range
         )
+        self._notify_change("moved")
 
     @property
     def end_or_end_range(self) -> TimeOrTimeRange:
@@ -187,6 +491,7 @@ class EventPlacement(core_utilities.MutwoObject):
         self._end_or_end_range = self._unspecified_to_specified_time_or_time_range(
             end_or_end_range
         )
+        self._notify_change("moved")
 
     @property
     def duration(self) -> core_parameters.abc.Duration:
@@ -233,21 +538,47 @@ class EventPlacement(core_utilities.MutwoObject):
     # ###################################################################### #
 
     def is_overlapping(self, other: EventPlacement) -> bool:
-        return not self.time_range.isdisjoint(other.time_range)
+        return _is_overlapping(
+            self.min_start, self.max_end, other.min_start, other.max_end
+        )
 
     def move_by(self, duration: UnspecificTime) -> EventPlacement:
         duration = core_parameters.abc.Duration.from_any(duration)
-        self.start_or_start_range, self.end_or_end_range = (
+        # We set the private attributes to notify listeners only once.
+        self._start_or_start_range, self._end_or_end_range = (
             EventPlacement._move_time_or_time_range(time_or_time_range, duration)
             for time_or_time_range in (self.start_or_start_range, self.end_or_end_range)
         )
+        self._notify_change("moved")
         return self
 
+    def get_mutable_event(
+        self,
+    ) -> core_events.Concurrence[
+        core_events.Chronon | core_events.Consecution | core_events.Concurrence
+    ]:
+        """Get event of placement, which can be changed in place.
+
+        If the event is shared, the placement first gets its own copy of
+        the event (copy-on-write): other placements which share the event
+        aren't affected by any changes. Afterwards the event isn't shared
+        anymore.
+        """
+        if self._is_event_shared:
+            # We set '_is_event_shared' first, so that listeners already
+            # see the new state.
+            self._is_event_shared = False
+            self.event = self.event.copy()
+        # The event is probably changed in place afterwards.
+        self._event_digest_version = None
+        return self.event
+
     def copy(self) -> EventPlacement:
         return type(self)(
-            self.event.copy(),
+            self.event if self._is_event_shared else self.event.copy(),
             copy.copy(self.start_or_start_range),
             copy.copy(self.end_or_end_range),
+            share_event=self._is_event_shared,
         )
 
 
@@ -259,15 +590,239 @@ class Conflict(core_utilities.MutwoObject):
     :type left: EventPlacement
     :param right: The later :class:`EventPlacement`.
     :type right: EventPlacement
+    :param rule_set: The :class:`ConflictRuleSet` which defines the conflict
+        (if any), so that strategies can take its capacities into account.
+        Default to ``None``.
+    :type rule_set: typing.Optional[ConflictRuleSet]
 
     Two overlapping :class:`EventPlacement` are mostly only a problem
     if their instruments are the same. Nevertheless the precise definition
-    of a :class:`Conflict` depends on the callable passed to the 'is_conflict'
-    parameter of the :func:`TimeLine.resolve_conflicts` method.
+    of a :class:`Conflict` depends on the callable (or the
+    :class:`ConflictRuleSet`) passed to the 'is_conflict' parameter of the
+    :func:`TimeLine.resolve_conflicts` method.
     """
 
     left: EventPlacement
     right: EventPlacement
+    rule_set: typing.Optional[ConflictRuleSet] = dataclasses.field(
+        default=None, compare=False
+    )
+
+
+class ConflictRuleSet(core_utilities.MutwoObject):
+    """Declarative rules which define when placements are conflicting.
+
+    :param tag_to_capacity: How many :class:`EventPlacement` may use a tag
+        at the same time. Tags which aren't set have a capacity of 1.
+        Default to ``{}``.
+    :type tag_to_capacity: dict[str, int]
+    :param tag_group_sequence: Groups of tags which can't be used at the
+        same time, e.g. because one player doubles multiple instruments.
+        Only one :class:`EventPlacement` which uses any tag of a group
+        may sound at the same time. Default to ``()``.
+    :type tag_group_sequence: typing.Sequence[typing.Sequence[str]]
+    :raises ValueError: If any capacity is smaller than 1.
+
+    A rule set can be passed to the ``is_conflict`` parameter of
+    :meth:`TimeLine.find_conflicts` and :meth:`TimeLine.resolve_conflicts`
+    instead of a callable. Each tag and each group is a resource with a
+    capacity. Instead of testing pairs of placements, the placements are
+    swept in the order of their start and the number of active placements
+    is counted for each resource. If a placement starts while one of its
+    resources is already full, it conflicts with each placement which
+    fills this resource (the placement is always the right placement of
+    these conflicts, so that :class:`AlwaysLeftStrategy` drops it). The
+    conflicts refer to the rule set (see :attr:`Conflict.rule_set`), so
+    that strategies which resolve conflicts by looking at more than the
+    two conflicting placements (:class:`WeightedIntervalSchedulingStrategy`,
+    :class:`ShiftWithinRangeStrategy` and :class:`ShiftLaterStrategy`)
+    respect the capacities.
+
+    **Example:**
+
+    >>> from mutwo import core_events, timeline_interfaces
+    >>> timeline = timeline_interfaces.TimeLine(
+    ...     [
+    ...         timeline_interfaces.EventPlacement(
+    ...             core_events.Concurrence([core_events.Chronon(1, tag=tag)]),
+    ...             start,
+    ...             start + 2,
+    ...         )
+    ...         for tag, start in (
+    ...             ("piano", 0),
+    ...             ("piano", 1),
+    ...             ("flute", 0),
+    ...             ("piccolo", 1),
+    ...         )
+    ...     ]
+    ... )
+    >>> len(tuple(timeline.find_conflicts()))
+    1
+    >>> rule_set = timeline_interfaces.ConflictRuleSet(
+    ...     {"piano": 2}, [("flute", "piccolo")]
+    ... )
+    >>> [
+    ...     (c.left.tag_tuple, c.right.tag_tuple)
+    ...     for c in timeline.find_conflicts(rule_set)
+    ... ]
+    [(('flute',), ('piccolo',))]
+    """
+
+    def __init__(
+        self,
+        tag_to_capacity: dict[str, int] = {},
+        tag_group_sequence: typing.Sequence[typing.Sequence[str]] = (),
+    ):
+        if any(capacity < 1 for capacity in tag_to_capacity.values()):
+            raise ValueError("Each capacity needs to be at least 1!")
+        self._tag_to_capacity = dict(tag_to_capacity)
+        self._tag_group_tuple = tuple(tuple(group) for group in tag_group_sequence)
+        self._tag_to_group_index_list: dict[str, list[int]] = {}
+        for group_index, group in enumerate(self._tag_group_tuple):
+            for tag in group:
+                self._tag_to_group_index_list.setdefault(tag, []).append(group_index)
+        self._tag_tuple_to_resource_tuple: dict[
+            tuple[str, ...], tuple[tuple[str | int, int], ...]
+        ] = {}
+
+    @property
+    def tag_to_capacity(self) -> dict[str, int]:
+        return dict(self._tag_to_capacity)
+
+    @property
+    def tag_group_tuple(self) -> tuple[tuple[str, ...], ...]:
+        return self._tag_group_tuple
+
+    def get_capacity(self, tag: str) -> int:
+        """Get how many :class:`EventPlacement` may use a tag at once."""
+        return self._tag_to_capacity.get(tag, 1)
+
+    def _get_resource_tuple(
+        self, tag_tuple: tuple[str, ...]
+    ) -> tuple[tuple[str | int, int], ...]:
+        """Get each resource (a tag or a group index) and its capacity.
+
+        Each resource is only returned once, even if a placement uses
+        multiple tags of the same group.
+        """
+        try:
+            return self._tag_tuple_to_resource_tuple[tag_tuple]
+        except KeyError:
+            pass
+        resource_to_capacity: dict[str | int, int] = {}
+        for tag in tag_tuple:
+            resource_to_capacity[tag] = self.get_capacity(tag)
+            for group_index in self._tag_to_group_index_list.get(tag, ()):
+                resource_to_capacity[group_index] = 1
+        resource_tuple = self._tag_tuple_to_resource_tuple[tag_tuple] = tuple(
+            resource_to_capacity.items()
+        )
+        return resource_tuple
+
+
+@dataclasses.dataclass(frozen=True)
+class TimeLineChange(core_utilities.MutwoObject):
+    """A change of a :class:`TimeLine` as recorded in its change journal.
+
+    :param version: The version of the :class:`TimeLine` after the change.
+    :type version: int
+    :param kind: What happened: an :class:`EventPlacement` was either
+        ``"registered"``, ``"unregistered"``, ``"moved"`` (its start or
+        end changed) or its event was replaced (``"event_replaced"``).
+    :type kind: ChangeKind
+    :param event_placement: The changed :class:`EventPlacement`.
+    :type event_placement: EventPlacement
+    """
+
+    version: int
+    kind: ChangeKind
+    event_placement: EventPlacement
+
+
+@dataclasses.dataclass(frozen=True)
+class EventDeduplicationReport(core_utilities.MutwoObject):
+    """Summary of :meth:`TimeLine.deduplicate_events`.
+
+    :param event_count: How many different event objects were referenced
+        by the placements before the deduplication.
+    :type event_count: int
+    :param unique_event_count: How many different event objects are
+        referenced by the placements after the deduplication.
+    :type unique_event_count: int
+    :param saved_byte_count: The pickled size of all dropped event objects.
+        This is an estimate of how much smaller a stored :class:`TimeLine`
+        gets.
+    :type saved_byte_count: int
+    """
+
+    event_count: int
+    unique_event_count: int
+    saved_byte_count: int
+
+    @property
+    def dropped_event_count(self) -> int:
+        return self.event_count - self.unique_event_count
+
+
+@dataclasses.dataclass(frozen=True)
+class TimeLineMemoryReport(core_utilities.MutwoObject):
+    """Summary of :meth:`TimeLine.memory_report`.
+
+    All sizes are in bytes. Each object is only counted once, even if
+    it's referenced by multiple placements or events.
+
+    :param container_byte_count: The size of the list of placements and
+        of the bookkeeping dicts of the :class:`TimeLine`.
+    :type container_byte_count: int
+    :param event_placement_byte_count: The size of the
+        :class:`EventPlacement` objects themselves (without their events
+        and times).
+    :type event_placement_byte_count: int
+    :param bound_byte_count: The size of all start and end times
+        (including the bounds of ranges).
+    :type bound_byte_count: int
+    :param range_byte_count: The size of all ``ranges.Range`` objects
+        (without their bounds).
+    :type range_byte_count: int
+    :param event_byte_count: The size of all events.
+    :type event_byte_count: int
+    :param tag_to_event_byte_count: The size of the events of each tag.
+        Their sum is smaller than ``event_byte_count``, because the
+        containers which hold the tagged events aren't assigned to a tag.
+    :type tag_to_event_byte_count: dict[str, int]
+    :param shared_event_byte_count: The size of all events which are used
+        by more than one placement.
+    :type shared_event_byte_count: int
+    :param duplicated_event_byte_count: The size of all events which are
+        identical to another event object (see
+        :meth:`TimeLine.deduplicate_events`, which would drop them).
+    :type duplicated_event_byte_count: int
+    :param change_journal_byte_count: The size of the change journal (see
+        :meth:`TimeLine.get_change_tuple`), including all placements which
+        are only kept alive by the journal (e.g. unregistered placements).
+    :type change_journal_byte_count: int
+    """
+
+    container_byte_count: int
+    event_placement_byte_count: int
+    bound_byte_count: int
+    range_byte_count: int
+    event_byte_count: int
+    tag_to_event_byte_count: dict[str, int]
+    shared_event_byte_count: int
+    duplicated_event_byte_count: int
+    change_journal_byte_count: int
+
+    @property
+    def byte_count(self) -> int:
+        return (
+            self.container_byte_count
+            + self.event_placement_byte_count
+            + self.bound_byte_count
+            + self.range_byte_count
+            + self.event_byte_count
+            + self.change_journal_byte_count
+        )
 
 
 class ConflictResolutionStrategy(abc.ABC):
@@ -298,7 +853,10 @@ class ConflictResolutionStrategy(abc.ABC):
         The concrete strategy how the conflict is resolved is up to the
         resolution strategy class: either the conflicting event placements
         are removed, or the timeline is adjusted in other ways (e.g. stretched)
-        so that the event placements aren't overlapping anymore.
+        so that the event placements aren't overlapping anymore. Event
+        placements should only be changed via
+        :meth:`TimeLine.get_mutable_event_placement`, so that snapshots of
+        the timeline aren't affected.
         """
 
 
@@ -355,6 +913,415 @@ class TagCountStrategy(ConflictResolutionStrategy):
         return True
 
 
+class WeightedIntervalSchedulingStrategy(ConflictResolutionStrategy):
+    """Keep the heaviest set of non-overlapping :class:`EventPlacement` per tag.
+
+    :param weight: Function which takes an :class:`EventPlacement` and
+        returns its weight as a number. The strategy keeps those
+        placements whose summed weight is maximal. By default the
+        weight is the duration of an :class:`EventPlacement`, so that
+        as much time as possible is filled.
+    :type weight: typing.Callable[[EventPlacement], float]
+
+    Unlike the other strategies this strategy doesn't only decide between
+    the two :class:`EventPlacement` of the given :class:`Conflict`, but
+    resolves all conflicts of the :class:`TimeLine` at once: for each tag
+    it solves the weighted interval scheduling problem (in ``O(n log n)``)
+    and afterwards unregisters all losing placements in one batch.
+    Tags are processed in alphabetical order: if an :class:`EventPlacement`
+    with multiple tags is dropped for one tag, it is also gone for the
+    following tags.
+
+    If the conflict is defined by a :class:`ConflictRuleSet`, each tag
+    keeps as many simultaneous placements as its capacity allows and
+    each group of the rule set is processed like a tag with a capacity
+    of 1. Groups are processed before the tags: because a group already
+    allows only one placement of its tags at the same time, tags which
+    are part of any group aren't processed separately. For capacities bigger than 1 the problem is
+    solved as a minimum cost flow along the time axis: each unit of flow
+    is one voice of the tag, which can pick non-overlapping placements.
+    Otherwise this strategy assumes that a conflict is defined by two
+    overlapping placements which share a tag (the default
+    ``is_conflict`` of :meth:`TimeLine.resolve_conflicts`).
+    """
+
+    def __init__(
+        self,
+        weight: typing.Callable[[EventPlacement], float] = _get_duration_weight,
+    ):
+        self._weight = weight
+
+    def _get_loser_list(
+        self, event_placement_list: list[EventPlacement]
+    ) -> list[EventPlacement]:
+        event_placement_list = sorted(
+            event_placement_list,
+            key=lambda ep: (float(ep.max_end), float(ep.min_start)),
+        )
+        end_list = [float(ep.max_end) for ep in event_placement_list]
+        weight_list = [self._weight(ep) for ep in event_placement_list]
+        # 'previous_list[i]' is the count of placements which end before
+        # placement 'i' starts (= the index of its last compatible predecessor
+        # plus one).
+        previous_list = [
+            bisect.bisect_right(end_list, float(ep.min_start), hi=i)
+            for i, ep in enumerate(event_placement_list)
+        ]
+
+        best_list = [0.0]
+        for i, weight in enumerate(weight_list):
+            best_list.append(max(best_list[i], weight + best_list[previous_list[i]]))
+
+        # Backtrack to find the placements of the best solution. In case
+        # of equal weights we prefer to drop the later placement.
+        loser_list, i = [], len(event_placement_list)
+        while i > 0:
+            previous = previous_list[i - 1]
+            if weight_list[i - 1] + best_list[previous] > best_list[i - 1]:
+                # All placements between the last compatible predecessor
+                # and the picked placement overlap with the picked placement.
+                loser_list.extend(event_placement_list[previous : i - 1])
+                i = previous
+            else:
+                loser_list.append(event_placement_list[i - 1])
+                i -= 1
+        return loser_list
+
+    def _get_capacity_loser_list(
+        self, event_placement_list: list[EventPlacement], capacity: int
+    ) -> list[EventPlacement]:
+        # Each time has three nodes: placements end at the first node,
+        # empty placements lead from the first to the second node (so they
+        # can't be picked by a voice which is inside a longer placement)
+        # and placements start at the third node. 'capacity' units flow
+        # from the first to the last node. We look for the flow with the
+        # minimal cost, where picking a placement costs its negative weight.
+        if not event_placement_list:
+            return []
+        time_list = sorted(
+            {t for ep in event_placement_list for t in _get_sort_key(ep)}
+        )
+        time_to_index = {t: i for i, t in enumerate(time_list)}
+        node_count = 3 * len(time_list)
+        # For each node a list of residual edges [node, capacity, cost,
+        # index of the reverse edge].
+        graph: list[list[list]] = [[] for _ in range(node_count)]
+
+        def add_edge(node0: int, node1: int, edge_capacity: int, cost: float):
+            graph[node0].append([node1, edge_capacity, cost, len(graph[node1])])
+            graph[node1].append([node0, 0, -cost, len(graph[node0]) - 1])
+
+        for node in range(node_count - 1):
+            add_edge(node, node + 1, capacity, 0.0)
+        edge_list = []
+        for ep in event_placement_list:
+            start, end = _get_sort_key(ep)
+            if start < end:
+                node0, node1 = 3 * time_to_index[start] + 2, 3 * time_to_index[end]
+            else:
+                node0 = 3 * time_to_index[start]
+                node1 = node0 + 1
+            edge_list.append((node0, len(graph[node0])))
+            add_edge(node0, node1, 1, -self._weight(ep))
+
+        # All edges point forward in time, so that one pass over the nodes
+        # finds the initial potentials (the shortest distances). Afterwards
+        # the reduced costs are never negative and we can use Dijkstra.
+        potential_list = [0.0] + [math.inf] * (node_count - 1)
+        for node, edge_list_of_node in enumerate(graph):
+            for node1, edge_capacity, cost, _ in edge_list_of_node:
+                if edge_capacity and node1 > node:
+                    potential_list[node1] = min(
+                        potential_list[node1], potential_list[node] + cost
+                    )
+        sink = node_count - 1
+        for _ in range(capacity):
+            distance_list = [math.inf] * node_count
+            distance_list[0] = 0.0
+            previous_list: list[typing.Optional[tuple[int, int]]] = [None] * node_count
+            heap = [(0.0, 0)]
+            while heap:
+                distance, node = heapq.heappop(heap)
+                if distance > distance_list[node]:
+                    continue
+                for edge_index, (node1, edge_capacity, cost, _) in enumerate(
+                    graph[node]
+                ):
+                    if not edge_capacity:
+                        continue
+                    distance1 = (
+                        distance + cost + potential_list[node] - potential_list[node1]
+                    )
+                    if distance1 < distance_list[node1]:
+                        distance_list[node1] = distance1
+                        previous_list[node1] = (node, edge_index)
+                        heapq.heappush(heap, (distance1, node1))
+            path_cost, node, path = 0.0, sink, []
+            while (previous := previous_list[node]) is not None:
+                path.append(previous)
+                path_cost += graph[previous[0]][previous[1]][2]
+                node = previous[0]
+            # Another voice which doesn't pick any (additional) placement
+            # doesn't improve the result.
+            if path_cost >= 0:
+                break
+            for node, edge_index in path:
+                edge = graph[node][edge_index]
+                edge[1] -= 1
+                graph[edge[0]][edge[3]][1] += 1
+            for node, distance in enumerate(distance_list):
+                if distance < math.inf:
+                    potential_list[node] += distance
+
+        return [
+            ep
+            for ep, (node, edge_index) in zip(event_placement_list, edge_list)
+            if graph[node][edge_index][1]
+        ]
+
+    def resolve_conflict(self, timeline: TimeLine, conflict: Conflict) -> bool:
+        resource_to_event_placement_list: dict[str | int, list[EventPlacement]] = {}
+        resource_to_capacity: dict[str | int, int] = {}
+        for ep in timeline.event_placement_tuple:
+            for resource, capacity in _get_resource_tuple(ep, conflict.rule_set):
+                resource_to_event_placement_list.setdefault(resource, []).append(ep)
+                resource_to_capacity[resource] = capacity
+
+        loser_dict: dict[int, EventPlacement] = {}
+        # Groups of a rule set (their resources are their indices) are
+        # processed before the tags which aren't part of any group.
+        rule_set = conflict.rule_set
+        for resource in sorted(
+            (
+                resource
+                for resource in resource_to_event_placement_list
+                if rule_set is None
+                or isinstance(resource, int)
+                or resource not in rule_set._tag_to_group_index_list
+            ),
+            key=lambda resource: (isinstance(resource, str), resource),
+        ):
+            event_placement_list = [
+                ep
+                for ep in resource_to_event_placement_list[resource]
+                if id(ep) not in loser_dict
+            ]
+            if (capacity := resource_to_capacity[resource]) == 1:
+                loser_list = self._get_loser_list(event_placement_list)
+            else:
+                loser_list = self._get_capacity_loser_list(
+                    event_placement_list, capacity
+                )
+            for ep in loser_list:
+                loser_dict[id(ep)] = ep
+
+        if not loser_dict:
+            return False
+        timeline.unregister_sequence(tuple(loser_dict.values()))
+        return True
+
+
+class ShiftWithinRangeStrategy(ConflictResolutionStrategy):
+    """Pick concrete times within the ranges of :class:`EventPlacement`.
+
+    This strategy doesn't remove any :class:`EventPlacement`, but uses the
+    flexibility of placements with a ``start_or_start_range`` or an
+    ``end_or_end_range`` which is a :class:`ranges.Range`. It looks for
+    start and end times within the given ranges, so that placements which
+    share a tag don't overlap anymore.
+
+    All placements which are (transitively) overlapping with the conflicting
+    placements are adjusted at once. Their start and end times need to
+    fulfill a system of difference constraints: each time needs to be within
+    its range, each end needs to be after its start and each start needs to
+    be after the end of the previous placement with the same tag. Because
+    the order of the placements is kept, all constraints point forward in
+    time and the earliest solution is found by one propagation over the
+    sorted placements: each start is as early as possible and each end
+    keeps the minimal duration of its placement (or is the latest possible
+    end if the end range doesn't allow this). Afterwards each adjusted
+    placement has a fixed start and end time.
+
+    If the conflict is defined by a :class:`ConflictRuleSet`, each tag
+    (and each group of the rule set) has as many voices as its capacity
+    allows: each start only needs to be after the end of the voice which
+    ends first, and the placement continues this voice.
+
+    If there isn't any solution, this strategy returns ``False`` and
+    :meth:`TimeLine.resolve_conflicts` falls through to the next strategy.
+    """
+
+    def resolve_conflict(self, timeline: TimeLine, conflict: Conflict) -> bool:
+        left_id = id(conflict.left)
+        for cluster in _get_overlap_cluster_list(
+            timeline.event_placement_tuple, conflict.rule_set
+        ):
+            if any(id(ep) == left_id for ep in cluster):
+                break
+        else:
+            return False
+
+        cluster.sort(key=lambda ep: (float(ep.min_start), float(ep.max_end)))
+        # For each resource (a tag or a group of a rule set) a heap with the
+        # ends of its voices.
+        resource_to_end_heap: dict[str | int, list[float]] = {}
+        start_and_end_list = []
+        for ep in cluster:
+            resource_tuple = _get_resource_tuple(ep, conflict.rule_set)
+            start = max(
+                [float(ep.min_start)]
+                + [
+                    end_heap[0]
+                    for resource, capacity in resource_tuple
+                    if len(end_heap := resource_to_end_heap.get(resource, ()))
+                    >= capacity
+                ]
+            )
+            # If the start is pushed, the placement keeps its minimal
+            # duration (as far as its end range allows).
+            end = min(
+                max(float(ep.min_end), start + float(ep.min_end - ep.min_start)),
+                float(ep.max_end),
+            )
+            if end <= start:
+                end = float(ep.max_end)
+            if start > float(ep.max_start) or end <= start:
+                return False
+            for resource, capacity in resource_tuple:
+                end_heap = resource_to_end_heap.setdefault(resource, [])
+                if len(end_heap) >= capacity:
+                    heapq.heapreplace(end_heap, end)
+                else:
+                    heapq.heappush(end_heap, end)
+            start_and_end_list.append((start, end))
+
+        # Placements which are shared with snapshots are copied before
+        # they are changed.
+        id_to_event_placement = timeline._get_mutable_event_placement_dict(
+            [
+                ep
+                for ep, (start, end) in zip(cluster, start_and_end_list)
+                if (ep.start_or_start_range, ep.end_or_end_range) != (start, end)
+            ]
+        )
+        for ep, (start, end) in zip(cluster, start_and_end_list):
+            if ep := id_to_event_placement.get(id(ep)):
+                ep.start_or_start_range, ep.end_or_end_range = start, end
+        return True
+
+
+class ShiftLaterStrategy(ConflictResolutionStrategy):
+    """Push conflicting :class:`EventPlacement` later instead of dropping them.
+
+    :param align: If set to ``True``, each shift is applied to all
+        following placements of all tags, so that the alignment between
+        different tags is kept. Otherwise only following placements which
+        share a tag with a shifted placement (or which share a tag with
+        such a placement, etc.) are shifted. Default to ``False``.
+    :type align: bool
+
+    Like :class:`WeightedIntervalSchedulingStrategy` this strategy resolves
+    all conflicts of the :class:`TimeLine` at once. The placements are
+    visited in order of their start. Each placement which starts before a
+    previous placement with the same tag ends is pushed until this
+    placement ends, and the same offset is added to all following
+    placements (like inserting a gap). Because the offsets are accumulated
+    during one pass over the sorted placements (instead of moving all
+    following placements for each conflict), each placement is only moved
+    once. The material between two conflicts keeps its rhythm.
+
+    If the :class:`TimeLine` has a static duration and any placement would
+    end after it, this strategy returns ``False`` without changing anything.
+    It also returns ``False`` if nothing needs to be shifted (e.g. if the
+    conflict is between empty placements at the same time).
+
+    If the conflict is defined by a :class:`ConflictRuleSet`, a placement
+    is only pushed until each of its tags (and each of its groups) has a
+    free capacity: for each tag the ends of as many placements as its
+    capacity allows are remembered. Otherwise this strategy assumes that a
+    conflict is defined by two overlapping placements which share a tag
+    (the default ``is_conflict`` of :meth:`TimeLine.resolve_conflicts`).
+
+    **Example:**
+
+    >>> from mutwo import core_events, timeline_interfaces
+    >>> event = core_events.Concurrence([core_events.Chronon(1, tag="a")])
+    >>> timeline = timeline_interfaces.TimeLine(
+    ...     [
+    ...         timeline_interfaces.EventPlacement(event, start, start + 2)
+    ...         for start in (0, 1, 4)
+    ...     ]
+    ... )
+    >>> timeline.resolve_conflicts([timeline_interfaces.ShiftLaterStrategy()])
+    >>> [float(ep.min_start) for ep in timeline.event_placement_tuple]
+    [0.0, 2.0, 5.0]
+    """
+
+    def __init__(self, align: bool = False):
+        self._align = align
+
+    def resolve_conflict(self, timeline: TimeLine, conflict: Conflict) -> bool:
+        event_placement_list = sorted(
+            {id(ep): ep for ep in timeline.event_placement_tuple}.values(),
+            key=_get_sort_key,
+        )
+        # For each resource (a tag or a group of a rule set) a heap with the
+        # ends of the latest (shifted) placements which use it (at most as
+        # many as its capacity) and the accumulated offset of each resource
+        # (or of all resources if aligned).
+        resource_to_end_heap: dict[str | int, list[float]] = {}
+        resource_to_offset: dict[typing.Optional[str | int], float] = {}
+        offset_list = []
+        for ep in event_placement_list:
+            start, end = _get_sort_key(ep)
+            resource_tuple = _get_resource_tuple(ep, conflict.rule_set)
+            group_tuple = (
+                (None,)
+                if self._align
+                else tuple(resource for resource, _ in resource_tuple)
+            )
+            offset = max(
+                (resource_to_offset.get(group, 0) for group in group_tuple), default=0
+            )
+            # If a resource is full, the placement needs to wait until the
+            # earliest of its placements ends.
+            offset = max(
+                [
+                    end_heap[0] - start
+                    for resource, capacity in resource_tuple
+                    if len(end_heap := resource_to_end_heap.get(resource, ()))
+                    >= capacity
+                ]
+                + [offset]
+            )
+            for group in group_tuple:
+                resource_to_offset[group] = offset
+            for resource, capacity in resource_tuple:
+                end_heap = resource_to_end_heap.setdefault(resource, [])
+                if len(end_heap) >= capacity:
+                    heapq.heapreplace(end_heap, max(end_heap[0], end + offset))
+                else:
+                    heapq.heappush(end_heap, end + offset)
+            offset_list.append(offset)
+
+        if not any(offset_list):
+            return False
+        if not timeline._dynamic_duration and any(
+            float(ep.max_end) + offset > float(timeline.duration)
+            for ep, offset in zip(event_placement_list, offset_list)
+        ):
+            return False
+        # Placements which are shared with snapshots are copied before
+        # they are moved.
+        id_to_event_placement = timeline._get_mutable_event_placement_dict(
+            [ep for ep, offset in zip(event_placement_list, offset_list) if offset]
+        )
+        for ep, offset in zip(event_placement_list, offset_list):
+            if offset:
+                id_to_event_placement[id(ep)].move_by(offset)
+        return True
+
+
 class TimeLine(core_utilities.MutwoObject):
     """Timeline to place events on.
 
@@ -366,6 +1333,44 @@ class TimeLine(core_utilities.MutwoObject):
         :class:`EventPlacement` with end > duration this would raise
         an error. Default to ``None``.
     :type duration: typing.Optional[UnspecificTime]
+    :param track_conflicts: If set to ``True`` the :class:`TimeLine`
+        maintains a live set of all conflicts: each time an
+        :class:`EventPlacement` is registered, unregistered or changed,
+        only its overlapping neighbours are checked. The conflicts can
+        be accessed via :attr:`conflicts` and :attr:`has_conflicts`.
+        Here a conflict means two overlapping placements which share a
+        tag. Default to ``False``.
+    :type track_conflicts: bool
+    :param unique: If set to ``True``, :meth:`register` raises a
+        :class:`mutwo.timeline_utilities.DuplicateEventPlacementError` if an
+        equal :class:`EventPlacement` is already part of the
+        :class:`TimeLine`. Thanks to :attr:`EventPlacement.structural_hash`
+        this only needs to compare the new placement with placements which
+        have the same hash. Default to ``False``.
+    :type unique: bool
+    :param horizon: If set, the :class:`TimeLine` is rolling: each time
+        the playhead moves (see :meth:`move_playhead`), all
+        :class:`EventPlacement` which end more than ``horizon`` before
+        the playhead are evicted (see :meth:`evict`). Default to ``None``.
+    :type horizon: typing.Optional[UnspecificTime]
+    :param on_evict: If set, it's called with all evicted
+        :class:`EventPlacement` (e.g. to store them on disk) each time
+        placements are evicted. Default to ``None``.
+    :type on_evict: typing.Optional[typing.Callable[[tuple[EventPlacement, ...]], None]]
+    :param max_change_count: The change journal (see :meth:`get_change_tuple`)
+        only keeps the latest changes: as soon as it contains twice as many
+        changes, all but the latest ``max_change_count`` changes are
+        forgotten. Consumers which read the journal less often only need to
+        rebuild their state (see
+        :class:`mutwo.timeline_utilities.ForgottenChangesError`). If set to
+        ``None`` the journal keeps all changes until :meth:`forget_changes`
+        is called. Because the journal refers to the changed placements,
+        an unbounded journal also keeps unregistered placements alive.
+        Default to ``1024``.
+    :type max_change_count: typing.Optional[int]
+
+    A rolling :class:`TimeLine` keeps its memory usage flat, even if
+    placements are registered forever (e.g. in a long-running installation).
 
     **Warning:**
 
@@ -377,12 +1382,145 @@ class TimeLine(core_utilities.MutwoObject):
         self,
         event_placement_sequence: typing.Sequence[EventPlacement] = [],
         duration: typing.Optional[UnspecificTime] = None,
+        *,
+        track_conflicts: bool = False,
+        unique: bool = False,
+        horizon: typing.Optional[UnspecificTime] = None,
+        on_evict: typing.Optional[
+            typing.Callable[[tuple[EventPlacement, ...]], None]
+        ] = None,
+        max_change_count: typing.Optional[int] = 1024,
     ):
         self._dynamic_duration = duration is None
         self._duration = duration
-        self._event_placement_list: list[EventPlacement] = list(
-            event_placement_sequence
+        self._track_conflicts = track_conflicts
+        self._unique = unique
+        self._horizon = (
+            None if horizon is None else core_parameters.abc.Duration.from_any(horizon)
         )
+        self._on_evict = on_evict
+        self._max_change_count = max_change_count
+        self._playhead = core_parameters.DirectDuration(0)
+        # The latest end of all evicted placements: a dynamic duration
+        # doesn't shrink when placements are evicted.
+        self._evicted_end: typing.Optional[core_parameters.abc.Duration] = None
+        # If conflicts are tracked, but the index is 'None', it's
+        # lazily built as soon as it's needed (see '_get_conflict_index').
+        self._conflict_index = _ConflictIndex() if track_conflicts else None
+        # The gap index is lazily built by the first free slot query and
+        # maintained afterwards (see '_get_gap_index').
+        self._gap_index: typing.Optional[_GapIndex] = None
+        # If placements need to be unique, but the index is 'None', it's
+        # lazily built as soon as it's needed (see '_get_duplicate_index').
+        self._duplicate_index: typing.Optional[_DuplicateIndex] = None
+        # If the list is shared with a snapshot, it needs to be copied
+        # before it can be changed (see '_get_mutable_event_placement_list').
+        # The copy shares all chunks of the list which aren't changed
+        # afterwards.
+        self._is_event_placement_list_shared = False
+        self._event_placement_list = _ChunkedList()
+        # Maps the 'id' of each registered placement to how often it's
+        # registered and to its (unique) tags at the time it was counted.
+        # Together with the count of placements per tag, this is shared with
+        # snapshots in the same way as the list of placements.
+        self._id_to_count = _ShardedDict()
+        self._id_to_tag_tuple = _ShardedDict()
+        self._tag_to_count: dict[str, int] = {}
+        self._change_dispatcher = _ChangeDispatcher(self)
+        self._version = 0
+        # The change journal: the first change in the list has the
+        # version 'self._change_offset + 1'.
+        self._change_list: list[TimeLineChange] = []
+        self._change_offset = 0
+        for event_placement in event_placement_sequence:
+            self._check_duplicate(event_placement)
+            self._add_event_placement(event_placement)
+
+    # ###################################################################### #
+    #                          public class methods                          #
+    # ###################################################################### #
+
+    @classmethod
+    def merge(
+        cls,
+        *timeline: TimeLine,
+        duration: typing.Optional[UnspecificTime] = None,
+        **kwargs: typing.Any,
+    ) -> TimeLine:
+        """Create a new sorted :class:`TimeLine` from multiple time lines.
+
+        :param timeline: The time lines which are merged. They don't
+            change.
+        :type timeline: TimeLine
+        :param duration: See :class:`TimeLine`. Default to ``None``.
+        :type duration: typing.Optional[UnspecificTime]
+        :param kwargs: Further keyword arguments are passed to the new
+            time line (e.g. ``track_conflicts``).
+
+        The placements of each time line are sorted (which is cheap if a
+        time line is already sorted) and afterwards all time lines are
+        combined by a k-way merge in ``O(n log k)``, so that the new
+        time line doesn't need to be sorted again. If placements start and
+        end at the same time, placements of earlier time lines come first.
+        The new time line shares its :class:`EventPlacement` with the
+        merged time lines.
+
+        **Example:**
+
+        >>> from mutwo import core_events, timeline_interfaces
+        >>> event = core_events.Concurrence([core_events.Chronon(1, tag="a")])
+        >>> timeline0 = timeline_interfaces.TimeLine(
+        ...     [timeline_interfaces.EventPlacement(event, 0, 1)]
+        ... )
+        >>> timeline1 = timeline_interfaces.TimeLine(
+        ...     [timeline_interfaces.EventPlacement(event, 0.5, 2)]
+        ... )
+        >>> timeline = timeline_interfaces.TimeLine.merge(timeline0, timeline1)
+        >>> [float(ep.min_start) for ep in timeline.event_placement_tuple]
+        [0.0, 0.5]
+        """
+        return cls(
+            list(
+                heapq.merge(
+                    *(
+                        sorted(t.event_placement_tuple, key=_get_sort_key)
+                        for t in timeline
+                    ),
+                    key=_get_sort_key,
+                )
+            ),
+            duration,
+            **kwargs,
+        )
+
+    # ###################################################################### #
+    #                          magic methods                                 #
+    # ###################################################################### #
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        # Indices refer to placements by their 'id', which changes when
+        # pickling or copying a time line: therefore we rebuild them.
+        state = self.__dict__.copy()
+        state["_conflict_index"] = state["_gap_index"] = None
+        state["_duplicate_index"] = None
+        state["_is_event_placement_list_shared"] = False
+        for name in (
+            "_id_to_count",
+            "_id_to_tag_tuple",
+            "_tag_to_count",
+            "_change_dispatcher",
+        ):
+            del state[name]
+        return state
+
+    def __setstate__(self, state: dict[str, typing.Any]):
+        self.__dict__.update(state)
+        self._change_dispatcher = _ChangeDispatcher(self)
+        self._id_to_count, self._id_to_tag_tuple = _ShardedDict(), _ShardedDict()
+        self._tag_to_count = {}
+        for event_placement in self._event_placement_list:
+            self._count_event_placement(event_placement, 1)
+            self._change_dispatcher.attach(event_placement)
 
     # ###################################################################### #
     #                          public properties                             #
@@ -391,13 +1529,14 @@ class TimeLine(core_utilities.MutwoObject):
     @property
     def duration(self) -> core_parameters.abc.Duration:
         if self._dynamic_duration:
+            end_list = [
+                event_placement.max_end
+                for event_placement in self._event_placement_list
+            ]
+            if self._evicted_end is not None:
+                end_list.append(self._evicted_end)
             try:
-                return max(
-                    [
-                        event_placement.max_end
-                        for event_placement in self._event_placement_list
-                    ]
-                )
+                return max(end_list)
             # If there isn't any registered EventPlacement yet.
             except ValueError:
                 return core_parameters.DirectDuration(0)
@@ -408,13 +1547,46 @@ class TimeLine(core_utilities.MutwoObject):
     def event_placement_tuple(self) -> tuple[EventPlacement, ...]:
         return tuple(self._event_placement_list)
 
+    @property
+    def version(self) -> int:
+        """Number which increases with each change of the :class:`TimeLine`.
+
+        Each registered, unregistered or moved :class:`EventPlacement` and
+        each replaced event of a registered :class:`EventPlacement` is a
+        change. Sorting isn't a change. Changes inside the event of an
+        :class:`EventPlacement` can't be detected (see
+        :attr:`EventPlacement.version`).
+        """
+        return self._version
+
+    @property
+    def playhead(self) -> core_parameters.abc.Duration:
+        """The current position of the playhead (see :meth:`move_playhead`)."""
+        return self._playhead
+
+    @property
+    def conflicts(self) -> tuple[Conflict, ...]:
+        """All current conflicts (only available if conflicts are tracked)."""
+        return self._get_conflict_index().conflict_tuple
+
+    @property
+    def has_conflicts(self) -> bool:
+        """``True`` if there is any conflict (only available if conflicts are tracked)."""
+        return bool(self._get_conflict_index())
+
     @property
     def tag_set(self) -> set[str]:
-        tag_set = set([])
-        for event_placement in self.event_placement_tuple:
-            for tag in event_placement.tag_tuple:
-                tag_set.add(tag)
-        return tag_set
+        return set(self._tag_to_count)
+
+    @property
+    def tag_to_count(self) -> dict[str, int]:
+        """How many registered :class:`EventPlacement` use each tag.
+
+        The counts are updated when placements are registered,
+        unregistered or get a new event, so that accessing them (or
+        :attr:`tag_set`) doesn't need to iterate all placements.
+        """
+        return dict(self._tag_to_count)
 
     # ###################################################################### #
     #                          public methods                                #
@@ -423,17 +1595,18 @@ class TimeLine(core_utilities.MutwoObject):
     # FIXME: In 'unregister' we remove the 'EventPlacement' which is equal to
     # the given input. This means if we have multiple equal 'EventPlacement'
     # within a timeline, currently this won't remove all of those equal copies.
-    # We may want to add a test here which ensures that no equal 'EventPlacement'
-    # are added to a 'TimeLine'. But this leads to expensive comparison of mutwo
-    # events, which needs to be avoided for performance reasons.
-    # Can we find a way to make this method safer without having such a bad
-    # performance? Test by id?
+    # With 'unique=True' equal 'EventPlacement' are rejected (this is cheap,
+    # because only placements with the same structural hash are compared),
+    # but by default equal placements are still allowed.
     def register(self, event_placement: EventPlacement):
         """Register a new :class:`EventPlacement` on given :class:`TimeLine`.
 
         :param event_placement: The :class:`EventPlacement` which should be
             placed on the :class:`TimeLine`.
         :type event_placement: EventPlacement
+        :raises DuplicateEventPlacementError: If the :class:`TimeLine` is
+            unique and an equal :class:`EventPlacement` is already
+            registered.
         """
         end = event_placement.max_end
 
@@ -447,7 +1620,8 @@ class TimeLine(core_utilities.MutwoObject):
             if end > (duration := self.duration):
                 raise timeline_utilities.ExceedDurationError(event_placement, duration)
 
-        self._event_placement_list.append(event_placement)
+        self._check_duplicate(event_placement)
+        self._add_event_placement(event_placement)
 
     def unregister(self, event_placement: EventPlacement):
         """Unregister an :class:`EventPlacement` which is part of :class:`TimeLine`.
@@ -469,16 +1643,122 @@ class TimeLine(core_utilities.MutwoObject):
         ep_id = id(event_placement)
         for i, ep in enumerate(self.event_placement_tuple):
             if id(ep) == ep_id:
-                del self._event_placement_list[i]
+                del self._get_mutable_event_placement_list()[i]
+                self._remove_event_placement(ep)
                 return
         raise timeline_utilities.EventPlacementNotFoundError(
             event_placement=event_placement
         )
 
+    def unregister_sequence(
+        self, event_placement_sequence: typing.Sequence[EventPlacement]
+    ):
+        """Unregister multiple :class:`EventPlacement` at once.
+
+        :param event_placement_sequence: The :class:`EventPlacement` which
+            should be removed from the :class:`TimeLine`.
+        :type event_placement_sequence: typing.Sequence[EventPlacement]
+        :raises EventPlacementNotFoundError: If any :class:`EventPlacement`
+            isn't inside :class:`TimeLine`. In this case no
+            :class:`EventPlacement` is removed.
+
+        This is much faster than calling :meth:`unregister` for each
+        :class:`EventPlacement`, because the :class:`TimeLine` is only
+        scanned once.
+        """
+        for event_placement in event_placement_sequence:
+            if id(event_placement) not in self._id_to_count:
+                raise timeline_utilities.EventPlacementNotFoundError(
+                    event_placement=event_placement
+                )
+        ep_id_set = {id(ep) for ep in event_placement_sequence}
+        event_placement_list = self._get_mutable_event_placement_list()
+        new_event_placement_list = []
+        for ep in event_placement_list:
+            if id(ep) in ep_id_set:
+                self._remove_event_placement(ep)
+            else:
+                new_event_placement_list.append(ep)
+        event_placement_list.replace(new_event_placement_list)
+
+    def evict(self, until: UnspecificTime) -> tuple[EventPlacement, ...]:
+        """Unregister all :class:`EventPlacement` which end before a time.
+
+        :param until: All :class:`EventPlacement` whose :attr:`EventPlacement.max_end`
+            is smaller than or equal to this time are unregistered.
+        :type until: UnspecificTime
+        :return: The evicted :class:`EventPlacement` (each of them once,
+            even if it was registered multiple times).
+
+        All placements are removed in one scan of the :class:`TimeLine`
+        (like :meth:`unregister_sequence`) and each of them is recorded
+        as an unregistered change in the change journal. If the
+        :class:`TimeLine` has an ``on_evict`` callback, it's called with
+        the evicted placements. A dynamic :attr:`duration` doesn't shrink
+        by evicting placements.
+        """
+        until = core_parameters.abc.Duration.from_any(until)
+        event_placement_list = self._event_placement_list
+        if not any(ep.max_end <= until for ep in event_placement_list):
+            return ()
+        event_placement_list = self._get_mutable_event_placement_list()
+        id_to_evicted_event_placement: dict[int, EventPlacement] = {}
+        new_event_placement_list = []
+        for ep in event_placement_list:
+            if (end := ep.max_end) <= until:
+                if self._evicted_end is None or end > self._evicted_end:
+                    self._evicted_end = end
+                id_to_evicted_event_placement[id(ep)] = ep
+                self._remove_event_placement(ep)
+            else:
+                new_event_placement_list.append(ep)
+        event_placement_list.replace(new_event_placement_list)
+        evicted_event_placement_tuple = tuple(id_to_evicted_event_placement.values())
+        if self._on_evict is not None:
+            self._on_evict(evicted_event_placement_tuple)
+        return evicted_event_placement_tuple
+
+    def move_playhead(self, playhead: UnspecificTime) -> tuple[EventPlacement, ...]:
+        """Move the playhead of a (rolling) :class:`TimeLine` forward.
+
+        :param playhead: The new position of the playhead.
+        :type playhead: UnspecificTime
+        :return: The evicted :class:`EventPlacement` (see :meth:`evict`).
+            If the :class:`TimeLine` doesn't have a ``horizon``, nothing
+            is evicted.
+        :raises ValueError: If the playhead would move backwards.
+
+        **Example:**
+
+        >>> from mutwo import core_events, timeline_interfaces
+        >>> timeline = timeline_interfaces.TimeLine(horizon=1)
+        >>> event = core_events.Concurrence([core_events.Chronon(1, tag="a")])
+        >>> for start in range(4):
+        ...     timeline.register(
+        ...         timeline_interfaces.EventPlacement(event, start, start + 1)
+        ...     )
+        >>> len(timeline.move_playhead(3))
+        2
+        >>> [float(ep.min_start) for ep in timeline.event_placement_tuple]
+        [2.0, 3.0]
+        >>> timeline.duration
+        DirectDuration(4.0)
+        """
+        playhead = core_parameters.abc.Duration.from_any(playhead)
+        if playhead < self._playhead:
+            raise ValueError(
+                f"Can't move playhead backwards from '{self._playhead}' "
+                f"to '{playhead}'!"
+            )
+        self._playhead = playhead
+        if self._horizon is None:
+            return ()
+        return self.evict(playhead - self._horizon)
+
     def sort(self) -> TimeLine:
         """Sort all :class:`EventPlacement` by start time (and if equal by end time)."""
 
-        self._event_placement_list.sort(
+        self._get_mutable_event_placement_list().sort(
             key=lambda event_placement: (
                 event_placement.min_start,
                 event_placement.max_end,
@@ -486,6 +1766,108 @@ class TimeLine(core_utilities.MutwoObject):
         )
         return self
 
+    def get_change_tuple(self, version: int = 0) -> tuple[TimeLineChange, ...]:
+        """Get all changes since the given version from the change journal.
+
+        :param version: The version of the :class:`TimeLine` which is
+            already known by the caller (the cursor). All changes which
+            happened after this version are returned. Default to ``0``.
+        :type version: int
+        :raises ForgottenChangesError: If the journal doesn't contain all
+            changes since the given version anymore (because they were
+            forgotten or because the :class:`TimeLine` was restored from
+            a snapshot). In this case the caller needs to assume that
+            everything changed.
+
+        **Example:**
+
+        >>> from mutwo import core_events, timeline_interfaces
+        >>> timeline = timeline_interfaces.TimeLine()
+        >>> cursor = timeline.version
+        >>> event = core_events.Concurrence([core_events.Chronon(1, tag="a")])
+        >>> timeline.register(timeline_interfaces.EventPlacement(event, 0, 1))
+        >>> [change.kind for change in timeline.get_change_tuple(cursor)]
+        ['registered']
+        """
+        if version < self._change_offset:
+            raise timeline_utilities.ForgottenChangesError(version, self._change_offset)
+        return tuple(self._change_list[version - self._change_offset :])
+
+    def forget_changes(self, version: int):
+        """Remove all changes until the given version from the change journal.
+
+        :param version: All changes with a version which is smaller than
+            or equal to this version are removed.
+        :type version: int
+
+        The change journal grows with each change (up to twice the
+        ``max_change_count`` of the :class:`TimeLine`): this method should
+        be called once all consumers have read the changes.
+        """
+        version = min(version, self._version)
+        if version > self._change_offset:
+            del self._change_list[: version - self._change_offset]
+            self._change_offset = version
+
+    def snapshot(self) -> TimeLine:
+        """Create a snapshot of the :class:`TimeLine` in constant time.
+
+        The returned snapshot is an independent :class:`TimeLine`: it can be
+        passed to :meth:`restore` later, but it can also be changed (and
+        snapshotted) itself in order to explore alternative variants. The
+        snapshot and the original :class:`TimeLine` share their internal
+        data until one of them registers, unregisters or sorts
+        :class:`EventPlacement`: only then the changed :class:`TimeLine`
+        copies its list of placements (but never the placements or their
+        events).
+
+        **Warning:**
+
+        Both time lines share the same :class:`EventPlacement` objects.
+        If an :class:`EventPlacement` should only change in one of them,
+        it needs to be changed via :meth:`get_mutable_event_placement`,
+        which replaces it by a copy first. Strategies which move
+        placements (e.g. :class:`ShiftLaterStrategy`) already do so.
+        """
+        snapshot = type(self).__new__(type(self))
+        snapshot.__dict__.update(self.__dict__)
+        snapshot._conflict_index = snapshot._gap_index = None
+        snapshot._duplicate_index = None
+        snapshot._change_list = []
+        snapshot._change_offset = self._version
+        self._change_dispatcher.add(snapshot)
+        self._is_event_placement_list_shared = True
+        snapshot._is_event_placement_list_shared = True
+        return snapshot
+
+    def restore(self, snapshot: TimeLine):
+        """Reset :class:`TimeLine` to the state of a snapshot.
+
+        :param snapshot: A snapshot which was created by :meth:`snapshot`.
+        :type snapshot: TimeLine
+
+        This is done in constant time (indices, e.g. for tracked conflicts,
+        are rebuilt as soon as they are needed again). All changes in the
+        change journal are forgotten.
+        """
+        self._conflict_index = self._gap_index = self._duplicate_index = None
+        self._dynamic_duration = snapshot._dynamic_duration
+        self._duration = snapshot._duration
+        self._playhead = snapshot._playhead
+        self._evicted_end = snapshot._evicted_end
+        self._event_placement_list = snapshot._event_placement_list
+        self._id_to_count = snapshot._id_to_count
+        self._id_to_tag_tuple = snapshot._id_to_tag_tuple
+        self._tag_to_count = snapshot._tag_to_count
+        self._is_event_placement_list_shared = True
+        snapshot._is_event_placement_list_shared = True
+        self._change_dispatcher.discard(self)
+        self._change_dispatcher = snapshot._change_dispatcher
+        self._change_dispatcher.add(self)
+        self._version = max(self._version, snapshot._version) + 1
+        self._change_list = []
+        self._change_offset = self._version
+
     def get_event_placement(
         self, tag: str, index: int, *, sort: bool = True
     ) -> EventPlacement:
@@ -516,16 +1898,54 @@ class TimeLine(core_utilities.MutwoObject):
                 return event_placement
         raise timeline_utilities.EventPlacementNotFoundError(tag, index)
 
+    def get_mutable_event_placement(
+        self, event_placement: EventPlacement
+    ) -> EventPlacement:
+        """Get registered :class:`EventPlacement`, which can be changed in place.
+
+        :param event_placement: The registered :class:`EventPlacement`.
+        :type event_placement: EventPlacement
+        :return: The :class:`EventPlacement` itself or its replacement.
+        :raises EventPlacementNotFoundError: If :class:`EventPlacement` isn't
+            inside :class:`TimeLine`.
+
+        If the :class:`EventPlacement` is also part of another :class:`TimeLine`
+        (e.g. of a snapshot, see :meth:`snapshot`), it's first replaced by
+        a copy in this :class:`TimeLine` (copy-on-write): the other time
+        lines aren't affected by changing the returned copy. The copy shares
+        the event with the original (see :meth:`EventPlacement.get_mutable_event`).
+        In the change journal the replacement is recorded as unregistering
+        the original and registering the copy.
+
+        **Example:**
+
+        >>> from mutwo import core_events, timeline_interfaces
+        >>> event = core_events.Concurrence([core_events.Chronon(1, tag="a")])
+        >>> timeline = timeline_interfaces.TimeLine(
+        ...     [timeline_interfaces.EventPlacement(event, 0, 1)]
+        ... )
+        >>> snapshot = timeline.snapshot()
+        >>> event_placement = timeline.event_placement_tuple[0]
+        >>> timeline.get_mutable_event_placement(event_placement).move_by(1)
+        EventPlacement(...)
+        >>> [float(ep.min_start) for ep in timeline.event_placement_tuple]
+        [1.0]
+        >>> [float(ep.min_start) for ep in snapshot.event_placement_tuple]
+        [0.0]
+        """
+        return self._get_mutable_event_placement_dict((event_placement,))[
+            id(event_placement)
+        ]
+
     def resolve_conflicts(
         self,
         conflict_resolution_strategy_sequence: typing.Sequence[
             ConflictResolutionStrategy
         ] = [AlwaysLeftStrategy()],
-        is_conflict: typing.Callable[
-            [EventPlacement, EventPlacement], bool
-        ] = lambda ep0, ep1: bool(set(ep0.tag_tuple).intersection(set(ep1.tag_tuple))),
+        is_conflict: IsConflict = _is_sharing_tag,
         *,
         sort: bool = True,
+        executor: typing.Optional[concurrent.futures.Executor] = None,
     ):
         """Resolve overlapping :class:`EventPlacement` in :class:`TimeLine`.
 
@@ -544,8 +1964,11 @@ class TimeLine(core_utilities.MutwoObject):
             this function simply checks if the event placements share any
             common tag. The logic behind this is the assumption that tag
             equals instruments and that an instrument can't play two
-            different event placements at the same time.
-        :type is_conflict: typing.Callable[[EventPlacement, EventPlacement], bool]
+            different event placements at the same time. Instead of a
+            function, a :class:`ConflictRuleSet` can be used to allow
+            multiple placements per tag or to forbid tags of a group to
+            be used at the same time.
+        :type is_conflict: IsConflict
         :param sort: Can be set to ``False`` when sequentially calling
             `resolve_conflicts` without changing the :class:`TimeLine`.
             When `sort = False`, but the :class:`TimeLine` (or any
@@ -554,14 +1977,40 @@ class TimeLine(core_utilities.MutwoObject):
             sure not to break anything, just leave it as ``True``.
             Default to ``True``.
         :type sort: bool
+        :param executor: If set, the independent overlap clusters of the
+            :class:`TimeLine` (see :meth:`get_overlap_cluster_tuple`) are
+            resolved concurrently by this executor and the results are
+            merged back. Because of the GIL this is mostly useful with a
+            :class:`concurrent.futures.ProcessPoolExecutor`; in this case
+            the strategies and ``is_conflict`` need to be picklable. Each
+            cluster is resolved on copies of its placements, so strategies
+            may only unregister or move placements. Stateful strategies
+            (like :class:`AlternatingStrategy`) see each cluster separately.
+            Clusters are only independent if ``is_conflict`` never returns
+            ``True`` for placements without a common tag (tags of the same
+            group of a :class:`ConflictRuleSet` are taken into account).
+            If strategies move placements (e.g. :class:`ShiftLaterStrategy`),
+            the moved placements may overlap with other clusters afterwards:
+            then the clusters with moved placements are resolved again,
+            until nothing moves anymore. Placements of other clusters are
+            therefore only moved if they would conflict otherwise.
+            Default to ``None``.
+        :type executor: typing.Optional[concurrent.futures.Executor]
         :raises UnresolvedConflict: If none of the provided
             :class:`ConflictResolutionStrategy` could solve the conflict.
+            If an ``executor`` is used, the :class:`TimeLine` is unchanged
+            in this case (unless the conflict only appeared after
+            placements were moved: then the moved placements stay where
+            they are).
         """
         # To allow generators, we cast the sequence to a tuple (we may need
         # to iterate it multiple times).
         crst = tuple(conflict_resolution_strategy_sequence)
         if sort:
             self.sort()
+        if executor is not None:
+            self._resolve_conflicts_by_cluster(crst, is_conflict, executor)
+            return
         # We can always only solve the first conflict which we encounter
         # and then we need to start again, because every conflict resolution
         # could affect all event placements and therefore the looped list
@@ -570,14 +2019,980 @@ class TimeLine(core_utilities.MutwoObject):
         while self._resolve_first_conflict(crst, is_conflict):
             pass
 
+    def find_conflicts(
+        self, is_conflict: IsConflict = _is_sharing_tag
+    ) -> typing.Iterator[Conflict]:
+        """Find all conflicts without changing the :class:`TimeLine`.
+
+        :param is_conflict: See :meth:`resolve_conflicts`. Default to a
+            function which checks if the placements share any tag.
+        :type is_conflict: IsConflict
+        :return: An iterator which lazily yields each :class:`Conflict`
+            once. Conflicts are ordered by their right placement.
+
+        Unlike :meth:`resolve_conflicts`, all conflicts are found by one
+        sweep over the placements sorted by their start, which takes
+        ``O(n log n + k)`` with ``k`` being the number of overlapping pairs
+        (if the default ``is_conflict`` is used, only overlapping pairs
+        which share a tag are visited; if a :class:`ConflictRuleSet` is
+        used, only placements which start while a resource is full are
+        compared). The placements are collected when
+        this method is called, so changing the time line while iterating
+        doesn't affect the result.
+
+        **Example:**
+
+        >>> from mutwo import core_events, timeline_interfaces
+        >>> timeline = timeline_interfaces.TimeLine(
+        ...     [
+        ...         timeline_interfaces.EventPlacement(
+        ...             core_events.Concurrence([core_events.Chronon(1, tag="a")]),
+        ...             start,
+        ...             end,
+        ...         )
+        ...         for start, end in ((0, 2), (1, 3), (1.5, 4), (5, 6))
+        ...     ]
+        ... )
+        >>> [
+        ...     (float(c.left.min_start), float(c.right.min_start))
+        ...     for c in timeline.find_conflicts()
+        ... ]
+        [(0.0, 1.0), (0.0, 1.5), (1.0, 1.5)]
+        """
+        event_placement_list = sorted(self._event_placement_list, key=_get_sort_key)
+        if isinstance(is_conflict, ConflictRuleSet):
+            return _iter_rule_set_conflicts(event_placement_list, is_conflict)
+        return _iter_conflicts(event_placement_list, is_conflict)
+
+    def deduplicate_events(self) -> EventDeduplicationReport:
+        """Let placements with structurally identical events share one event.
+
+        :return: A report of how many events were dropped.
+
+        Two events are identical if they are of the same type and have the
+        same content (this is tested by comparing digests of their pickled
+        data, so each event object is only serialised once, even if it's
+        used by many placements). Each placement caches the digest of its
+        event until the placement changes (see :attr:`EventPlacement.version`)
+        or until :meth:`EventPlacement.get_mutable_event` is called: calling
+        this method again (or :meth:`memory_report`) only serialises events
+        which changed since then. All placements which share an event afterwards
+        are marked as shared (see the ``share_event`` parameter of
+        :class:`EventPlacement`), so that they don't affect each other when
+        an event is changed with :meth:`EventPlacement.get_mutable_event`.
+
+        **Example:**
+
+        >>> from mutwo import core_events, timeline_interfaces
+        >>> timeline = timeline_interfaces.TimeLine(
+        ...     [
+        ...         timeline_interfaces.EventPlacement(
+        ...             core_events.Concurrence([core_events.Chronon(1, tag="a")]),
+        ...             start,
+        ...             start + 1,
+        ...         )
+        ...         for start in range(3)
+        ...     ]
+        ... )
+        >>> report = timeline.deduplicate_events()
+        >>> report.event_count, report.unique_event_count
+        (3, 1)
+        """
+        id_to_event = {}
+        digest_to_event = {}
+        id_to_event_digest: dict[int, tuple[bytes, int]] = {}
+        saved_byte_count = 0
+        for event_placement in self.event_placement_tuple:
+            event = event_placement.event
+            if (event_id := id(event)) in id_to_event:
+                continue
+            event_digest = event_placement._get_event_digest()
+            try:
+                id_to_event[event_id] = digest_to_event[event_digest[0]]
+            except KeyError:
+                id_to_event[event_id] = digest_to_event[event_digest[0]] = event
+                id_to_event_digest[event_id] = event_digest
+            else:
+                saved_byte_count += event_digest[1]
+
+        id_to_reference_count: dict[int, int] = {}
+        for event_placement in self.event_placement_tuple:
+            event_id = id(id_to_event[id(event_placement.event)])
+            id_to_reference_count[event_id] = id_to_reference_count.get(event_id, 0) + 1
+        for event_placement in self.event_placement_tuple:
+            event = id_to_event[id(event_placement.event)]
+            if id_to_reference_count[id(event)] > 1:
+                # The flag needs to be set before the event, so that
+                # listeners already see the new state.
+                event_placement._is_event_shared = True
+                if event is not event_placement.event:
+                    event_placement.event = event
+                    # The new event has the same digest.
+                    event_placement._event_digest = id_to_event_digest[id(event)]
+                    event_placement._event_digest_version = event_placement._version
+
+        return EventDeduplicationReport(
+            len(id_to_event), len(digest_to_event), saved_byte_count
+        )
+
+    def memory_report(self) -> TimeLineMemoryReport:
+        """Estimate how much memory the :class:`TimeLine` occupies.
+
+        :return: The sizes of the different components of the time line.
+
+        The sizes are collected with :func:`sys.getsizeof` by one walk over
+        all reachable objects. Objects which were already visited (for
+        instance an event which is shared by many placements) are
+        skipped, so that they are neither counted nor traversed twice.
+        Classes, modules and functions aren't counted.
+
+        **Example:**
+
+        >>> from mutwo import core_events, timeline_interfaces
+        >>> event = core_events.Concurrence([core_events.Chronon(1, tag="a")])
+        >>> timeline = timeline_interfaces.TimeLine(
+        ...     [
+        ...         timeline_interfaces.EventPlacement(event, 0, 1),
+        ...         timeline_interfaces.EventPlacement(event, 1, 2),
+        ...     ]
+        ... )
+        >>> report = timeline.memory_report()
+        >>> report.shared_event_byte_count == report.event_byte_count
+        True
+        """
+        visited_id_set: set[int] = set([])
+
+        def get_byte_count(*obj: typing.Any) -> int:
+            return _get_byte_count(obj, visited_id_set)
+
+        # The containers are only counted shallowly, their content is
+        # counted by the other components.
+        container_byte_count = 0
+        for container in (
+            *self._event_placement_list.get_container_tuple(),
+            *self._id_to_count.get_container_tuple(),
+            *self._id_to_tag_tuple.get_container_tuple(),
+            self._tag_to_count,
+        ):
+            visited_id_set.add(id(container))
+            container_byte_count += sys.getsizeof(container)
+
+        event_placement_byte_count = 0
+        bound_byte_count = 0
+        range_byte_count = 0
+        id_to_event_placement: dict[int, EventPlacement] = {}
+        id_to_reference_count: dict[int, int] = {}
+        for event_placement in self._event_placement_list:
+            event_id = id(event_placement.event)
+            id_to_event_placement.setdefault(event_id, event_placement)
+            id_to_reference_count[event_id] = id_to_reference_count.get(event_id, 0) + 1
+            if id(event_placement) in visited_id_set:
+                continue
+            # We don't follow the listeners: they point back to time lines.
+            listener_list = event_placement._change_listener_list
+            visited_id_set.update(
+                (id(event_placement), id(vars(event_placement)), id(listener_list))
+            )
+            event_placement_byte_count += (
+                sys.getsizeof(event_placement)
+                + sys.getsizeof(vars(event_placement))
+                + sys.getsizeof(listener_list)
+            )
+            for time_or_time_range in (
+                event_placement.start_or_start_range,
+                event_placement.end_or_end_range,
+            ):
+                if isinstance(time_or_time_range, ranges.Range):
+                    bound_byte_count += get_byte_count(
+                        time_or_time_range.start, time_or_time_range.end
+                    )
+                    if id(time_or_time_range) not in visited_id_set:
+                        visited_id_set.add(id(time_or_time_range))
+                        range_byte_count += sys.getsizeof(time_or_time_range)
+                        range_byte_count += get_byte_count(vars(time_or_time_range))
+                else:
+                    bound_byte_count += get_byte_count(time_or_time_range)
+
+        event_byte_count = 0
+        tag_to_event_byte_count: dict[str, int] = {}
+        shared_event_byte_count = 0
+        duplicated_event_byte_count = 0
+        digest_set: set[bytes] = set([])
+        for event_id, event_placement in id_to_event_placement.items():
+            event = event_placement.event
+            byte_count = 0
+            for tagged_event in event:
+                tagged_event_byte_count = get_byte_count(tagged_event)
+                tag = tagged_event.tag
+                tag_to_event_byte_count[tag] = (
+                    tag_to_event_byte_count.get(tag, 0) + tagged_event_byte_count
+                )
+                byte_count += tagged_event_byte_count
+            byte_count += get_byte_count(event)
+            event_byte_count += byte_count
+            if id_to_reference_count[event_id] > 1:
+                shared_event_byte_count += byte_count
+            # Uses the same (cached) digest as 'deduplicate_events'.
+            if (digest := event_placement._get_event_digest()[0]) in digest_set:
+                duplicated_event_byte_count += byte_count
+            else:
+                digest_set.add(digest)
+
+        # The journal is counted last: registered placements are already
+        # visited, so only placements which are kept alive by the journal
+        # are counted.
+        change_journal_byte_count = sys.getsizeof(self._change_list)
+        for change in self._change_list:
+            change_journal_byte_count += sys.getsizeof(change) + sys.getsizeof(
+                vars(change)
+            )
+            event_placement = change.event_placement
+            if id(event_placement) in visited_id_set:
+                continue
+            listener_list = event_placement._change_listener_list
+            visited_id_set.update(
+                (id(event_placement), id(vars(event_placement)), id(listener_list))
+            )
+            change_journal_byte_count += (
+                sys.getsizeof(event_placement)
+                + sys.getsizeof(vars(event_placement))
+                + sys.getsizeof(listener_list)
+                + get_byte_count(
+                    event_placement.event,
+                    event_placement.start_or_start_range,
+                    event_placement.end_or_end_range,
+                )
+            )
+
+        return TimeLineMemoryReport(
+            container_byte_count,
+            event_placement_byte_count,
+            bound_byte_count,
+            range_byte_count,
+            event_byte_count,
+            tag_to_event_byte_count,
+            shared_event_byte_count,
+            duplicated_event_byte_count,
+            change_journal_byte_count,
+        )
+
+    def split_at(
+        self, *time: UnspecificTime, policy: SplitPolicy = "start"
+    ) -> tuple[TimeLine, ...]:
+        """Split :class:`TimeLine` into consecutive segments.
+
+        :param time: The times at which the :class:`TimeLine` is split.
+            ``n`` times result in ``n + 1`` segments.
+        :type time: UnspecificTime
+        :param policy: What happens with an :class:`EventPlacement` which
+            crosses a split time. ``"start"`` puts it only into the segment
+            in which it starts. ``"clip"`` cuts its event (with
+            :meth:`mutwo.core_events.abc.Event.cut_out`) into one part for
+            each segment which it overlaps, so that the segments sound
+            like the original when they are played one after another.
+            ``"duplicate"`` puts a complete copy into each segment which it
+            overlaps. Default to ``"start"``.
+        :type policy: SplitPolicy
+        :raises ValueError: If a split time isn't inside the
+            :class:`TimeLine`, if the policy is unknown or if a crossing
+            :class:`EventPlacement` with ranges should be clipped.
+
+        All segments contain copies of the placements, whose times are
+        relative to the start of their segment. The duration of each segment
+        is static and always exactly the time until the next split time (or
+        until the end of the :class:`TimeLine`), so that the durations of
+        all segments add up to the duration of the :class:`TimeLine`. The
+        segments can be converted independently (e.g. in parallel), but only
+        ``"clip"`` segments can be concatenated afterwards: no placement
+        exceeds its segment. With ``"start"`` a crossing placement ends
+        after its segment, therefore these segments need to be overlaid
+        (each segment starting at its split time) to sound like the
+        original. ``"duplicate"`` segments are meant to analyse each
+        segment on its own (e.g. with :meth:`get_density_tuple`):
+        placements may start before ``0`` and appear in multiple segments,
+        so they can neither be concatenated nor overlaid (and
+        :class:`mutwo.timeline_converters.TimeLineToConcurrence` can't
+        convert placements which start before ``0``).
+
+        **Example:**
+
+        >>> from mutwo import core_events, timeline_interfaces
+        >>> event = core_events.Concurrence([core_events.Chronon(1, tag="a")])
+        >>> timeline = timeline_interfaces.TimeLine(
+        ...     [
+        ...         timeline_interfaces.EventPlacement(event, 0, 1),
+        ...         timeline_interfaces.EventPlacement(event, 1.5, 3),
+        ...     ]
+        ... )
+        >>> for segment in timeline.split_at(2, policy="clip"):
+        ...     print(
+        ...         float(segment.duration),
+        ...         [
+        ...             (float(ep.min_start), float(ep.max_end))
+        ...             for ep in segment.event_placement_tuple
+        ...         ],
+        ...     )
+        2.0 [(0.0, 1.0), (1.5, 2.0)]
+        1.0 [(0.0, 1.0)]
+        """
+        if policy not in ("start", "clip", "duplicate"):
+            raise ValueError(f"Unknown policy '{policy}'!")
+        duration = float(self.duration)
+        split_time_list = sorted(
+            {float(core_parameters.abc.Duration.from_any(t)) for t in time}
+        )
+        if split_time_list and (
+            split_time_list[0] <= 0 or split_time_list[-1] >= duration
+        ):
+            raise ValueError(
+                f"All split times need to be between 0 and {duration} (the "
+                f"duration of the TimeLine), but got '{time}'!"
+            )
+        start_list = [0.0] + split_time_list
+        end_list = split_time_list + [duration]
+
+        segment_list: list[list[EventPlacement]] = [[] for _ in start_list]
+        for event_placement in self.event_placement_tuple:
+            start = float(event_placement.min_start)
+            end = float(event_placement.max_end)
+            first_index = bisect.bisect_right(split_time_list, start)
+            last_index = (
+                first_index
+                if policy == "start"
+                else bisect.bisect_left(split_time_list, end)
+            )
+            for i in range(first_index, last_index + 1):
+                segment_start, segment_end = start_list[i], end_list[i]
+                if policy == "clip" and first_index != last_index:
+                    new_event_placement = self._clip_event_placement(
+                        event_placement, segment_start, segment_end
+                    )
+                else:
+                    new_event_placement = event_placement.copy().move_by(-segment_start)
+                segment_list[i].append(new_event_placement)
+
+        # Placements which are passed to the initialisation aren't checked
+        # against the duration: with "start" and "duplicate" they may end
+        # after their segment.
+        return tuple(
+            type(self)(
+                event_placement_list,
+                core_parameters.DirectDuration(segment_end - segment_start),
+                track_conflicts=self._track_conflicts,
+                unique=self._unique,
+            )
+            for segment_start, segment_end, event_placement_list in zip(
+                start_list, end_list, segment_list
+            )
+        )
+
+    def get_overlap_cluster_tuple(self) -> tuple[tuple[EventPlacement, ...], ...]:
+        """Split :class:`TimeLine` into independent overlap clusters.
+
+        A cluster is a connected component of the graph in which two
+        :class:`EventPlacement` are connected if they share a tag and if
+        their maximum extents (from ``min_start`` to ``max_end``) are
+        overlapping. Placements of different clusters can never conflict
+        with each other, so that each cluster can be resolved on its own.
+        Clusters are ordered by their first placement.
+
+        **Example:**
+
+        >>> from mutwo import core_events, timeline_interfaces
+        >>> timeline = timeline_interfaces.TimeLine(
+        ...     [
+        ...         timeline_interfaces.EventPlacement(
+        ...             core_events.Concurrence([core_events.Chronon(1, tag="a")]),
+        ...             start,
+        ...             end,
+        ...         )
+        ...         for start, end in ((0, 2), (1, 3), (5, 6))
+        ...     ]
+        ... )
+        >>> [len(cluster) for cluster in timeline.get_overlap_cluster_tuple()]
+        [2, 1]
+        """
+        return tuple(
+            tuple(cluster)
+            for cluster in _get_overlap_cluster_list(self.event_placement_tuple)
+        )
+
+    def find_free_slot(
+        self,
+        tag_or_tags: str | typing.Sequence[str],
+        duration: UnspecificTime,
+        after: UnspecificTime = 0,
+        before: typing.Optional[UnspecificTime] = None,
+    ) -> typing.Optional[ranges.Range]:
+        """Find the earliest time span in which the given tags are free.
+
+        :param tag_or_tags: One tag or a sequence of tags which all need
+            to be free.
+        :type tag_or_tags: str | typing.Sequence[str]
+        :param duration: How long the free time span needs to be.
+        :type duration: UnspecificTime
+        :param after: The free time span doesn't start earlier than this.
+            Default to ``0``.
+        :type after: UnspecificTime
+        :param before: The free time span doesn't end later than this. If
+            the :class:`TimeLine` has a static duration, the time span never
+            ends after the end of the :class:`TimeLine`. Default to ``None``.
+        :type before: typing.Optional[UnspecificTime]
+        :return: The free time span (of exactly ``duration``) or ``None``
+            if there is no free time span.
+
+        As for conflicts, an :class:`EventPlacement` occupies its tags from
+        its ``min_start`` until (excluding) its ``max_end``. The occupied
+        time spans of each tag are kept in an index, which is built by the
+        first query and updated afterwards with each change of the
+        :class:`TimeLine`. The first possible time span is found by binary
+        search; only occupied time spans which are followed by too short
+        gaps need to be skipped.
+
+        **Example:**
+
+        >>> from mutwo import core_events, timeline_interfaces
+        >>> timeline = timeline_interfaces.TimeLine(
+        ...     [
+        ...         timeline_interfaces.EventPlacement(
+        ...             core_events.Concurrence([core_events.Chronon(1, tag="a")]),
+        ...             start,
+        ...             end,
+        ...         )
+        ...         for start, end in ((0, 2), (3, 4))
+        ...     ]
+        ... )
+        >>> timeline.find_free_slot("a", 1)
+        Range[DirectDuration(2.0), DirectDuration(3.0))
+        >>> timeline.find_free_slot("a", 1.5)
+        Range[DirectDuration(4.0), DirectDuration(5.5))
+        """
+        tag_tuple = (
+            (tag_or_tags,) if isinstance(tag_or_tags, str) else tuple(tag_or_tags)
+        )
+        duration = float(core_parameters.abc.Duration.from_any(duration))
+        start = float(core_parameters.abc.Duration.from_any(after))
+        gap_index = self._get_gap_index()
+        # Each tag may postpone the start: we need to continue until all
+        # tags agree on the same start.
+        previous_start = None
+        while start != previous_start:
+            previous_start = start
+            for tag in tag_tuple:
+                start = gap_index.get_free_start(tag, start, duration)
+        if start + duration > self._get_free_slot_limit(before):
+            return None
+        return ranges.Range(
+            core_parameters.DirectDuration(start),
+            core_parameters.DirectDuration(start + duration),
+        )
+
+    def iter_free_slots(
+        self,
+        tag_or_tags: str | typing.Sequence[str],
+        after: UnspecificTime = 0,
+        before: typing.Optional[UnspecificTime] = None,
+    ) -> typing.Iterator[ranges.Range]:
+        """Iterate over all time spans in which the given tags are free.
+
+        :param tag_or_tags: One tag or a sequence of tags which all need
+            to be free.
+        :type tag_or_tags: str | typing.Sequence[str]
+        :param after: Only free time spans after this time are returned.
+            Default to ``0``.
+        :type after: UnspecificTime
+        :param before: Only free time spans before this time are returned.
+            If ``None``, free time spans are searched until the end of the
+            :class:`TimeLine`. Default to ``None``.
+        :type before: typing.Optional[UnspecificTime]
+
+        The time spans are as long as possible and sorted by their start.
+        See :meth:`find_free_slot` for when a tag is occupied.
+
+        **Example:**
+
+        >>> from mutwo import core_events, timeline_interfaces
+        >>> timeline = timeline_interfaces.TimeLine(
+        ...     [
+        ...         timeline_interfaces.EventPlacement(
+        ...             core_events.Concurrence([core_events.Chronon(1, tag="a")]),
+        ...             start,
+        ...             end,
+        ...         )
+        ...         for start, end in ((1, 2), (3, 4))
+        ...     ],
+        ...     duration=5,
+        ... )
+        >>> for slot in timeline.iter_free_slots("a"):
+        ...     print(float(slot.start), float(slot.end))
+        0.0 1.0
+        2.0 3.0
+        4.0 5.0
+        """
+        tag_tuple = (
+            (tag_or_tags,) if isinstance(tag_or_tags, str) else tuple(tag_or_tags)
+        )
+        start = float(core_parameters.abc.Duration.from_any(after))
+        limit = (
+            float(self.duration)
+            if before is None
+            else self._get_free_slot_limit(before)
+        )
+        gap_index = self._get_gap_index()
+        for occupied_start, occupied_end in heapq.merge(
+            *(gap_index.iter_occupied(tag, start) for tag in tag_tuple)
+        ):
+            if start >= limit:
+                return
+            if occupied_start > start:
+                yield ranges.Range(
+                    core_parameters.DirectDuration(start),
+                    core_parameters.DirectDuration(min(occupied_start, limit)),
+                )
+            start = max(start, occupied_end)
+        if start < limit:
+            yield ranges.Range(
+                core_parameters.DirectDuration(start),
+                core_parameters.DirectDuration(limit),
+            )
+
+    def get_max_polyphony(self, tag: typing.Optional[str] = None) -> int:
+        """Get the maximum count of simultaneously sounding placements.
+
+        :param tag: If set, only :class:`EventPlacement` with this tag are
+            counted. Default to ``None``.
+        :type tag: typing.Optional[str]
+
+        As for conflicts, an :class:`EventPlacement` sounds from its
+        ``min_start`` until (excluding) its ``max_end``.
+
+        **Example:**
+
+        >>> from mutwo import core_events, timeline_interfaces
+        >>> timeline = timeline_interfaces.TimeLine(
+        ...     [
+        ...         timeline_interfaces.EventPlacement(
+        ...             core_events.Concurrence([core_events.Chronon(1, tag="a")]),
+        ...             start,
+        ...             end,
+        ...         )
+        ...         for start, end in ((0, 2), (1, 3), (2, 4))
+        ...     ]
+        ... )
+        >>> timeline.get_max_polyphony("a")
+        2
+        """
+        return max(
+            (count for _, count in self._get_polyphony_step_tuple(tag)), default=0
+        )
+
+    def get_occupancy_ratio(self, tag: typing.Optional[str] = None) -> float:
+        """Get the part of the duration in which any placement sounds.
+
+        :param tag: If set, only :class:`EventPlacement` with this tag are
+            taken into account. Default to ``None``.
+        :type tag: typing.Optional[str]
+        :return: A number between 0 (silent) and 1 (something sounds
+            during the whole :class:`TimeLine`).
+
+        Only the parts of placements between 0 and :attr:`duration` are
+        taken into account.
+        """
+        if not (duration := float(self.duration)):
+            return 0.0
+        step_tuple = self._get_polyphony_step_tuple(tag)
+        return (
+            sum(
+                end - start
+                for (start, count), (end, _) in zip(step_tuple, step_tuple[1:])
+                if count
+            )
+            / duration
+        )
+
+    def get_density_tuple(
+        self, bin_count: int, tag: typing.Optional[str] = None
+    ) -> tuple[float, ...]:
+        """Get the mean polyphony within equally long bins.
+
+        :param bin_count: Into how many bins of equal duration the
+            :class:`TimeLine` is split.
+        :type bin_count: int
+        :param tag: If set, only :class:`EventPlacement` with this tag are
+            counted. Default to ``None``.
+        :type tag: typing.Optional[str]
+        :return: For each bin the mean count of sounding placements. If one
+            placement sounds during half of a bin, this adds 0.5.
+
+        **Example:**
+
+        >>> from mutwo import core_events, timeline_interfaces
+        >>> timeline = timeline_interfaces.TimeLine(
+        ...     [
+        ...         timeline_interfaces.EventPlacement(
+        ...             core_events.Concurrence([core_events.Chronon(1, tag="a")]),
+        ...             start,
+        ...             end,
+        ...         )
+        ...         for start, end in ((0, 2), (1, 3))
+        ...     ],
+        ...     duration=4,
+        ... )
+        >>> timeline.get_density_tuple(4)
+        (1.0, 2.0, 1.0, 0.0)
+        """
+        if bin_count < 1:
+            raise ValueError(f"'bin_count' must be at least 1, but is {bin_count}!")
+        if not (duration := float(self.duration)):
+            return (0.0,) * bin_count
+        bin_duration = duration / bin_count
+        area_list = [0.0] * bin_count
+        step_tuple = self._get_polyphony_step_tuple(tag)
+        for (start, count), (end, _) in zip(step_tuple, step_tuple[1:]):
+            if not count:
+                continue
+            # Distribute the segment between 'start' and 'end' over all bins
+            # which it touches.
+            i = min(int(start // bin_duration), bin_count - 1)
+            while start < end:
+                segment_end = (
+                    end if i == bin_count - 1 else min(end, (i + 1) * bin_duration)
+                )
+                area_list[i] += count * max(segment_end - start, 0)
+                start = segment_end
+                i += 1
+        return tuple(area / bin_duration for area in area_list)
+
     # ###################################################################### #
     #                          private methods                               #
     # ###################################################################### #
 
+    def _get_polyphony_step_tuple(
+        self, tag: typing.Optional[str]
+    ) -> tuple[tuple[float, int], ...]:
+        """Sweep over all starts and ends to find how polyphony changes.
+
+        Returns pairs of a time and the count of placements which sound
+        from this time until the time of the next pair. Placements are
+        clipped to the time line (e.g. placements of a segment which is
+        returned by 'split_at' may start before 0).
+        """
+        duration = float(self.duration)
+        delta_list = []
+        for event_placement in self.event_placement_tuple:
+            if tag is None or tag in event_placement.tag_tuple:
+                start = max(float(event_placement.min_start), 0)
+                end = min(float(event_placement.max_end), duration)
+                if start < end:
+                    delta_list.append((start, 1))
+                    delta_list.append((end, -1))
+        # At equal times ends (-1) are sorted before starts (+1): a placement
+        # doesn't sound at its end anymore.
+        delta_list.sort()
+        step_list: list[tuple[float, int]] = []
+        count = 0
+        for time, delta in delta_list:
+            count += delta
+            if step_list and step_list[-1][0] == time:
+                step_list[-1] = (time, count)
+            else:
+                step_list.append((time, count))
+        return tuple(step_list)
+
+    @staticmethod
+    def _clip_event_placement(
+        event_placement: EventPlacement, segment_start: float, segment_end: float
+    ) -> EventPlacement:
+        """Get part of placement within segment, relative to segment start."""
+        if isinstance(event_placement.start_or_start_range, ranges.Range) or (
+            isinstance(event_placement.end_or_end_range, ranges.Range)
+        ):
+            raise ValueError(
+                f"Can't clip '{event_placement}', because its start or end "
+                "is a range."
+            )
+        start, end = float(event_placement.min_start), float(event_placement.max_end)
+        clipped_start, clipped_end = max(start, segment_start), min(end, segment_end)
+        event = event_placement.event.copy()
+        # The event is stretched to fill the placement, so we need to
+        # cut it at the same relative positions.
+        if event_duration := float(event.duration):
+            factor = event_duration / (end - start)
+            event.cut_out(
+                (clipped_start - start) * factor, (clipped_end - start) * factor
+            )
+        return EventPlacement(
+            event, clipped_start - segment_start, clipped_end - segment_start
+        )
+
+    def _resolve_conflicts_by_cluster(
+        self,
+        conflict_resolution_strategy_tuple: tuple[ConflictResolutionStrategy, ...],
+        is_conflict: IsConflict,
+        executor: concurrent.futures.Executor,
+    ):
+        # Moved placements may overlap with placements of other clusters
+        # afterwards: the clusters with moved placements are resolved again
+        # until nothing moves anymore.
+        moved_id_set = None
+        while moved_id_set is None or moved_id_set:
+            moved_id_set = self._resolve_cluster_tuple(
+                conflict_resolution_strategy_tuple,
+                is_conflict,
+                executor,
+                moved_id_set,
+            )
+
+    def _resolve_cluster_tuple(
+        self,
+        conflict_resolution_strategy_tuple: tuple[ConflictResolutionStrategy, ...],
+        is_conflict: IsConflict,
+        executor: concurrent.futures.Executor,
+        moved_id_set: typing.Optional[set[int]],
+    ) -> set[int]:
+        # Resolves all clusters (or only clusters with moved placements)
+        # and returns the 'id' of each placement which moved.
+        #
+        # A cluster with only one placement can't have any conflict.
+        cluster_tuple = tuple(
+            tuple(cluster)
+            for cluster in _get_overlap_cluster_list(
+                self.event_placement_tuple,
+                is_conflict if isinstance(is_conflict, ConflictRuleSet) else None,
+            )
+            if len(cluster) > 1
+            and (moved_id_set is None or any(id(ep) in moved_id_set for ep in cluster))
+        )
+        # Strategies which move placements need to know the duration.
+        duration = None if self._dynamic_duration else self.duration
+        # Placements which are sent to another process are copied anyway,
+        # otherwise the worker needs to copy them: it mustn't change
+        # placements of this time line from another thread.
+        is_copy_needed = not isinstance(
+            executor, concurrent.futures.ProcessPoolExecutor
+        )
+        future_list = [
+            executor.submit(
+                _resolve_cluster_conflicts,
+                cluster,
+                conflict_resolution_strategy_tuple,
+                is_conflict,
+                is_copy_needed,
+                duration,
+            )
+            for cluster in cluster_tuple
+        ]
+        # We first wait for all results, so that the time line stays
+        # unchanged if any cluster can't be resolved.
+        result_tuple = tuple(future.result() for future in future_list)
+
+        loser_list = []
+        changed_list = []
+        for cluster, result in zip(cluster_tuple, result_tuple):
+            index_to_time_tuple = {index: time_tuple for index, *time_tuple in result}
+            for index, event_placement in enumerate(cluster):
+                try:
+                    start, end = index_to_time_tuple[index]
+                except KeyError:
+                    loser_list.append(event_placement)
+                    continue
+                if (start, end) != (
+                    event_placement.start_or_start_range,
+                    event_placement.end_or_end_range,
+                ):
+                    changed_list.append((event_placement, start, end))
+        # Placements which are shared with snapshots are copied before
+        # they are changed.
+        id_to_event_placement = self._get_mutable_event_placement_dict(
+            [event_placement for event_placement, _, _ in changed_list]
+        )
+        moved_id_set = set([])
+        for event_placement, start, end in changed_list:
+            event_placement = id_to_event_placement[id(event_placement)]
+            if start != event_placement.start_or_start_range:
+                event_placement.start_or_start_range = start
+            if end != event_placement.end_or_end_range:
+                event_placement.end_or_end_range = end
+            moved_id_set.add(id(event_placement))
+        if loser_list:
+            self.unregister_sequence(loser_list)
+        return moved_id_set
+
+    def _get_unique_event_placement_tuple(self) -> tuple[EventPlacement, ...]:
+        return tuple({id(ep): ep for ep in self._event_placement_list}.values())
+
+    def _get_mutable_event_placement_list(self) -> _ChunkedList:
+        if self._is_event_placement_list_shared:
+            self._event_placement_list = self._event_placement_list.copy()
+            self._id_to_count = self._id_to_count.copy()
+            self._id_to_tag_tuple = self._id_to_tag_tuple.copy()
+            self._tag_to_count = dict(self._tag_to_count)
+            self._is_event_placement_list_shared = False
+        return self._event_placement_list
+
+    def _get_mutable_event_placement_dict(
+        self, event_placement_sequence: typing.Sequence[EventPlacement]
+    ) -> dict[int, EventPlacement]:
+        # Maps the 'id' of each given placement to the placement which can
+        # be changed in place, see 'get_mutable_event_placement'. All
+        # shared placements are replaced in one scan of the list.
+        id_to_event_placement: dict[int, EventPlacement] = {}
+        id_to_copy: dict[int, EventPlacement] = {}
+        shared_event_placement_list: list[EventPlacement] = []
+        for event_placement in event_placement_sequence:
+            if (ep_id := id(event_placement)) not in self._id_to_count:
+                raise timeline_utilities.EventPlacementNotFoundError(
+                    event_placement=event_placement
+                )
+            if ep_id not in id_to_event_placement:
+                if self._is_event_placement_shared(event_placement):
+                    # The copy and the original share their event.
+                    event_placement._is_event_shared = True
+                    id_to_copy[ep_id] = event_placement.copy()
+                    shared_event_placement_list.append(event_placement)
+                id_to_event_placement[ep_id] = id_to_copy.get(ep_id, event_placement)
+        if id_to_copy:
+            self._get_mutable_event_placement_list().substitute(id_to_copy)
+            for event_placement in shared_event_placement_list:
+                copy_ = id_to_copy[id(event_placement)]
+                count = self._id_to_count[id(event_placement)]
+                for _ in range(count):
+                    self._remove_event_placement(event_placement)
+                self._change_dispatcher.attach(copy_)
+                for _ in range(count):
+                    self._count_event_placement(copy_, 1)
+                    self._record_change("registered", copy_)
+                self._index_event_placement(copy_)
+        return id_to_event_placement
+
+    def _is_event_placement_shared(self, event_placement: EventPlacement) -> bool:
+        ep_id = id(event_placement)
+        return any(
+            timeline is not self and ep_id in timeline._id_to_count
+            for listener in event_placement._change_listener_list
+            if isinstance(listener, _ChangeDispatcher)
+            for timeline in tuple(listener._timeline_set)
+        )
+
+    def _add_event_placement(self, event_placement: EventPlacement):
+        self._get_mutable_event_placement_list().append(event_placement)
+        self._count_event_placement(event_placement, 1)
+        self._change_dispatcher.attach(event_placement)
+        # Indices contain each placement only once, even if it's
+        # registered multiple times.
+        if self._id_to_count[id(event_placement)] == 1:
+            self._index_event_placement(event_placement)
+        self._record_change("registered", event_placement)
+
+    def _remove_event_placement(self, event_placement: EventPlacement):
+        # Needs to be called after the placement was removed from the list.
+        self._count_event_placement(event_placement, -1)
+        if id(event_placement) not in self._id_to_count:
+            self._unindex_event_placement(event_placement)
+        self._record_change("unregistered", event_placement)
+
+    def _count_event_placement(self, event_placement: EventPlacement, delta: int):
+        # Needs to be called on a mutable list (or when the state is
+        # rebuilt), see '_get_mutable_event_placement_list'.
+        ep_id = id(event_placement)
+        if (count := self._id_to_count.get(ep_id, 0) + delta) > 0:
+            self._id_to_count[ep_id] = count
+            if ep_id not in self._id_to_tag_tuple:
+                self._id_to_tag_tuple[ep_id] = tuple(
+                    dict.fromkeys(event_placement.tag_tuple)
+                )
+            tag_tuple = self._id_to_tag_tuple[ep_id]
+        else:
+            del self._id_to_count[ep_id]
+            tag_tuple = self._id_to_tag_tuple.pop(ep_id)
+        self._count_tags(tag_tuple, delta)
+
+    def _count_tags(self, tag_tuple: tuple[str, ...], delta: int):
+        for tag in tag_tuple:
+            if count := self._tag_to_count.get(tag, 0) + delta:
+                self._tag_to_count[tag] = count
+            else:
+                del self._tag_to_count[tag]
+
+    def _index_event_placement(self, event_placement: EventPlacement):
+        if self._conflict_index is not None:
+            self._conflict_index.add(event_placement)
+        if self._gap_index is not None:
+            self._gap_index.add(event_placement)
+        if self._duplicate_index is not None:
+            self._duplicate_index.add(event_placement)
+
+    def _unindex_event_placement(self, event_placement: EventPlacement):
+        if self._conflict_index is not None:
+            self._conflict_index.remove(event_placement)
+        if self._gap_index is not None:
+            self._gap_index.remove(event_placement)
+        if self._duplicate_index is not None:
+            self._duplicate_index.remove(event_placement)
+
+    def _on_change(self, event_placement: EventPlacement, kind: ChangeKind):
+        # The change dispatcher is shared with snapshots, which may not
+        # contain the changed placement.
+        if (ep_id := id(event_placement)) in self._id_to_count:
+            if kind == "event_replaced":
+                self._get_mutable_event_placement_list()
+                tag_tuple = tuple(dict.fromkeys(event_placement.tag_tuple))
+                if (old_tag_tuple := self._id_to_tag_tuple[ep_id]) != tag_tuple:
+                    count = self._id_to_count[ep_id]
+                    self._count_tags(old_tag_tuple, -count)
+                    self._count_tags(tag_tuple, count)
+                    self._id_to_tag_tuple[ep_id] = tag_tuple
+            self._unindex_event_placement(event_placement)
+            self._index_event_placement(event_placement)
+            self._record_change(kind, event_placement)
+
+    def _record_change(self, kind: ChangeKind, event_placement: EventPlacement):
+        self._version += 1
+        self._change_list.append(TimeLineChange(self._version, kind, event_placement))
+        # We only trim the journal once it's twice as long as needed, so
+        # that trimming only costs amortized constant time per change.
+        if (max_change_count := self._max_change_count) is not None and len(
+            self._change_list
+        ) > 2 * max_change_count:
+            self.forget_changes(self._version - max_change_count)
+
+    def _get_conflict_index(self) -> _ConflictIndex:
+        if not self._track_conflicts:
+            raise timeline_utilities.ConflictsNotTrackedError()
+        if self._conflict_index is None:
+            self._conflict_index = _ConflictIndex()
+            for event_placement in self._get_unique_event_placement_tuple():
+                self._conflict_index.add(event_placement)
+        return self._conflict_index
+
+    def _get_duplicate_index(self) -> _DuplicateIndex:
+        if self._duplicate_index is None:
+            self._duplicate_index = _DuplicateIndex()
+            for event_placement in self._get_unique_event_placement_tuple():
+                self._duplicate_index.add(event_placement)
+        return self._duplicate_index
+
+    def _check_duplicate(self, event_placement: EventPlacement):
+        if self._unique and self._get_duplicate_index().contains(event_placement):
+            raise timeline_utilities.DuplicateEventPlacementError(event_placement)
+
+    def _get_gap_index(self) -> _GapIndex:
+        if self._gap_index is None:
+            self._gap_index = _GapIndex()
+            for event_placement in self._get_unique_event_placement_tuple():
+                self._gap_index.add(event_placement)
+        return self._gap_index
+
+    def _get_free_slot_limit(self, before: typing.Optional[UnspecificTime]) -> float:
+        limit = float("inf") if self._dynamic_duration else float(self.duration)
+        if before is not None:
+            limit = min(limit, float(core_parameters.abc.Duration.from_any(before)))
+        return limit
+
     def _resolve_first_conflict(
         self,
         conflict_resolution_strategy_tuple: tuple[ConflictResolutionStrategy, ...],
-        is_conflict: typing.Callable[[EventPlacement, EventPlacement], bool],
+        is_conflict: IsConflict,
     ) -> bool:
         """This methods resolves the first conflict it finds and then stops.
 
@@ -585,6 +3000,14 @@ class TimeLine(core_utilities.MutwoObject):
             ``False`` if no conflict was found.
         """
 
+        if isinstance(is_conflict, ConflictRuleSet):
+            if (conflict := next(self.find_conflicts(is_conflict), None)) is None:
+                return False
+            for s in conflict_resolution_strategy_tuple:
+                if s.resolve_conflict(self, conflict):
+                    return True
+            raise timeline_utilities.UnresolvedConflict(conflict)
+
         for i, event_placement0 in enumerate(self.event_placement_tuple):
             for event_placement1 in self.event_placement_tuple[i + 1 :]:
                 if not is_conflict(event_placement0, event_placement1):
@@ -610,3 +3033,969 @@ class TimeLine(core_utilities.MutwoObject):
                     break
 
         return False
+
+
+class ConcurrentTimeLine(TimeLine):
+    """:class:`TimeLine` which can be filled by multiple threads at once.
+
+    :param event_placement_sequence: The initial :class:`EventPlacement`.
+    :type event_placement_sequence: typing.Sequence[EventPlacement]
+    :param duration: See :class:`TimeLine`.
+    :type duration: typing.Optional[UnspecificTime]
+    :param track_conflicts: See :class:`TimeLine`.
+    :type track_conflicts: bool
+    :param unique: See :class:`TimeLine`. Because duplicates need to be
+        checked against all placements, a unique time line can't buffer
+        registered placements: :meth:`register` then always needs to hold
+        the common lock. Default to ``False``.
+    :type unique: bool
+    :param stripe_count: Into how many independently locked buffers new
+        :class:`EventPlacement` are registered. The buffer is picked by the
+        first tag of a placement, so threads which produce material for
+        different tags rarely need to wait for each other. Default to ``16``.
+    :type stripe_count: int
+    :param horizon: See :class:`TimeLine`.
+    :type horizon: typing.Optional[UnspecificTime]
+    :param on_evict: See :class:`TimeLine`.
+    :type on_evict: typing.Optional[typing.Callable[[tuple[EventPlacement, ...]], None]]
+    :param max_change_count: See :class:`TimeLine`.
+    :type max_change_count: typing.Optional[int]
+
+    :meth:`register` only appends the placement to the buffer of its
+    stripe. All buffered placements are merged into the time line as soon
+    as it's read or changed in any other way: all these operations are
+    protected by one common lock. Reading :attr:`event_placement_tuple`
+    returns an immutable snapshot, which is shared between all readers
+    and which can be accessed without any lock as long as nothing changed.
+
+    **Warning:**
+
+    Registered :class:`EventPlacement` shouldn't be changed by multiple
+    threads at the same time.
+    """
+
+    def __init__(
+        self,
+        event_placement_sequence: typing.Sequence[EventPlacement] = [],
+        duration: typing.Optional[UnspecificTime] = None,
+        *,
+        track_conflicts: bool = False,
+        unique: bool = False,
+        stripe_count: int = 16,
+        horizon: typing.Optional[UnspecificTime] = None,
+        on_evict: typing.Optional[
+            typing.Callable[[tuple[EventPlacement, ...]], None]
+        ] = None,
+        max_change_count: typing.Optional[int] = 1024,
+    ):
+        self._init_locks(stripe_count)
+        super().__init__(
+            event_placement_sequence,
+            duration,
+            track_conflicts=track_conflicts,
+            unique=unique,
+            horizon=horizon,
+            on_evict=on_evict,
+            max_change_count=max_change_count,
+        )
+
+    # ###################################################################### #
+    #                          magic methods                                 #
+    # ###################################################################### #
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        with self._lock:
+            self._merge()
+            state = super().__getstate__()
+        for name in ("_lock", "_stripe_tuple", "_event_placement_tuple"):
+            del state[name]
+        state["_stripe_count"] = len(self._stripe_tuple)
+        return state
+
+    def __setstate__(self, state: dict[str, typing.Any]):
+        self._init_locks(state.pop("_stripe_count"))
+        super().__setstate__(state)
+
+    # ###################################################################### #
+    #                          private methods                               #
+    # ###################################################################### #
+
+    def _init_locks(self, stripe_count: int):
+        self._lock = threading.RLock()
+        self._stripe_tuple = tuple((threading.Lock(), []) for _ in range(stripe_count))
+        self._is_dirty = False
+        self._event_placement_tuple: typing.Optional[tuple[EventPlacement, ...]] = None
+
+    def _merge(self):
+        # Needs to be called while holding 'self._lock'. We reset the
+        # flag before draining the buffers: if any thread registers a
+        # placement in the meantime, the flag is set again.
+        if self._is_dirty:
+            self._is_dirty = False
+            for lock, buffer in self._stripe_tuple:
+                with lock:
+                    event_placement_list = buffer.copy()
+                    buffer.clear()
+                for event_placement in event_placement_list:
+                    self._add_event_placement(event_placement)
+
+    def _get_mutable_event_placement_list(self) -> _ChunkedList:
+        self._event_placement_tuple = None
+        return super()._get_mutable_event_placement_list()
+
+    def _get_conflict_index(self) -> _ConflictIndex:
+        with self._lock:
+            self._merge()
+            return super()._get_conflict_index()
+
+    def _get_duplicate_index(self) -> _DuplicateIndex:
+        with self._lock:
+            self._merge()
+            return super()._get_duplicate_index()
+
+    def _get_unique_event_placement_tuple(self) -> tuple[EventPlacement, ...]:
+        with self._lock:
+            self._merge()
+            return super()._get_unique_event_placement_tuple()
+
+    def _get_gap_index(self) -> _GapIndex:
+        with self._lock:
+            self._merge()
+            return super()._get_gap_index()
+
+    # ###################################################################### #
+    #                          public properties                             #
+    # ###################################################################### #
+
+    @property
+    def duration(self) -> core_parameters.abc.Duration:
+        with self._lock:
+            self._merge()
+            return super().duration
+
+    @property
+    def version(self) -> int:
+        with self._lock:
+            self._merge()
+            return super().version
+
+    @property
+    def tag_set(self) -> set[str]:
+        with self._lock:
+            self._merge()
+            return super().tag_set
+
+    @property
+    def tag_to_count(self) -> dict[str, int]:
+        with self._lock:
+            self._merge()
+            return super().tag_to_count
+
+    @property
+    def event_placement_tuple(self) -> tuple[EventPlacement, ...]:
+        if (
+            not self._is_dirty
+            and (event_placement_tuple := self._event_placement_tuple) is not None
+        ):
+            return event_placement_tuple
+        with self._lock:
+            self._merge()
+            if self._event_placement_tuple is None:
+                self._event_placement_tuple = tuple(self._event_placement_list)
+            return self._event_placement_tuple
+
+    # ###################################################################### #
+    #                          public methods                                #
+    # ###################################################################### #
+
+    def register(self, event_placement: EventPlacement):
+        if not self._dynamic_duration:
+            if event_placement.max_end > self._duration:
+                raise timeline_utilities.ExceedDurationError(
+                    event_placement, self._duration
+                )
+        if self._unique:
+            with self._lock:
+                self._merge()
+                self._check_duplicate(event_placement)
+                self._add_event_placement(event_placement)
+            return
+        lock, buffer = self._stripe_tuple[
+            hash(event_placement.tag_tuple[:1]) % len(self._stripe_tuple)
+        ]
+        with lock:
+            buffer.append(event_placement)
+        self._is_dirty = True
+
+    def unregister(self, event_placement: EventPlacement):
+        with self._lock:
+            self._merge()
+            super().unregister(event_placement)
+
+    def unregister_sequence(
+        self, event_placement_sequence: typing.Sequence[EventPlacement]
+    ):
+        with self._lock:
+            self._merge()
+            super().unregister_sequence(event_placement_sequence)
+
+    def get_change_tuple(self, version: int = 0) -> tuple[TimeLineChange, ...]:
+        with self._lock:
+            self._merge()
+            return super().get_change_tuple(version)
+
+    def forget_changes(self, version: int):
+        with self._lock:
+            self._merge()
+            super().forget_changes(version)
+
+    def evict(self, until: UnspecificTime) -> tuple[EventPlacement, ...]:
+        with self._lock:
+            self._merge()
+            return super().evict(until)
+
+    def move_playhead(self, playhead: UnspecificTime) -> tuple[EventPlacement, ...]:
+        with self._lock:
+            self._merge()
+            return super().move_playhead(playhead)
+
+    def sort(self) -> ConcurrentTimeLine:
+        with self._lock:
+            self._merge()
+            return super().sort()
+
+    def snapshot(self) -> ConcurrentTimeLine:
+        with self._lock:
+            self._merge()
+            snapshot = super().snapshot()
+        snapshot._init_locks(len(self._stripe_tuple))
+        return snapshot
+
+    def restore(self, snapshot: TimeLine):
+        with self._lock:
+            self._merge()
+            super().restore(snapshot)
+            self._event_placement_tuple = None
+
+    def get_event_placement(
+        self, tag: str, index: int, *, sort: bool = True
+    ) -> EventPlacement:
+        with self._lock:
+            return super().get_event_placement(tag, index, sort=sort)
+
+    def get_mutable_event_placement(
+        self, event_placement: EventPlacement
+    ) -> EventPlacement:
+        with self._lock:
+            self._merge()
+            return super().get_mutable_event_placement(event_placement)
+
+    def resolve_conflicts(self, *args: typing.Any, **kwargs: typing.Any):
+        with self._lock:
+            super().resolve_conflicts(*args, **kwargs)
+
+    def find_conflicts(self, *args: typing.Any, **kwargs: typing.Any):
+        # The placements are collected immediately, so the caller can
+        # iterate without the lock.
+        with self._lock:
+            self._merge()
+            return super().find_conflicts(*args, **kwargs)
+
+    def deduplicate_events(self) -> EventDeduplicationReport:
+        with self._lock:
+            self._merge()
+            return super().deduplicate_events()
+
+    def memory_report(self) -> TimeLineMemoryReport:
+        with self._lock:
+            self._merge()
+            return super().memory_report()
+
+    def split_at(
+        self, *time: UnspecificTime, policy: SplitPolicy = "start"
+    ) -> tuple[ConcurrentTimeLine, ...]:
+        with self._lock:
+            self._merge()
+            return super().split_at(*time, policy=policy)
+
+    def find_free_slot(self, *args: typing.Any, **kwargs: typing.Any):
+        with self._lock:
+            self._merge()
+            return super().find_free_slot(*args, **kwargs)
+
+    def iter_free_slots(
+        self, *args: typing.Any, **kwargs: typing.Any
+    ) -> typing.Iterator[ranges.Range]:
+        # We mustn't keep the lock while the caller iterates.
+        with self._lock:
+            self._merge()
+            return iter(tuple(super().iter_free_slots(*args, **kwargs)))
+
+    def get_overlap_cluster_tuple(self) -> tuple[tuple[EventPlacement, ...], ...]:
+        with self._lock:
+            self._merge()
+            return super().get_overlap_cluster_tuple()
+
+
+# Objects which belong to the program instead of the data.
+_UNCOUNTED_TYPE_TUPLE = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+)
+
+
+def _get_byte_count(obj_iterable: typing.Iterable, visited_id_set: set[int]) -> int:
+    """Sum the sizes of all objects which can be reached from the objects.
+
+    Objects whose 'id' is in ``visited_id_set`` are skipped and the 'id' of
+    each counted object is added, so that the set can be used to count
+    objects which are shared by different calls only once. The objects are
+    walked iteratively, so that deeply nested events don't exceed the
+    recursion limit.
+    """
+    byte_count = 0
+    stack = list(obj_iterable)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in visited_id_set or isinstance(obj, _UNCOUNTED_TYPE_TUPLE):
+            continue
+        visited_id_set.add(id(obj))
+        byte_count += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        if hasattr(obj, "__dict__"):
+            stack.append(vars(obj))
+        for cls in type(obj).__mro__:
+            slot_name_tuple = getattr(cls, "__slots__", ())
+            if isinstance(slot_name_tuple, str):
+                slot_name_tuple = (slot_name_tuple,)
+            for name in slot_name_tuple:
+                if hasattr(obj, name):
+                    stack.append(getattr(obj, name))
+    return byte_count
+
+
+def _get_overlap_cluster_list(
+    event_placement_sequence: typing.Sequence[EventPlacement],
+    rule_set: typing.Optional[ConflictRuleSet] = None,
+) -> list[list[EventPlacement]]:
+    """Split event placements into independent clusters.
+
+    A cluster is a connected component of the graph in which two
+    :class:`EventPlacement` are connected if they share a tag (or a
+    resource of the rule set) and if they are overlapping. The components
+    are found by one sweep over the sorted placements of each tag.
+    """
+    event_placement_tuple = tuple(event_placement_sequence)
+    parent_list = list(range(len(event_placement_tuple)))
+
+    def find(i: int) -> int:
+        while (parent := parent_list[i]) != i:
+            parent_list[i] = i = parent_list[parent]
+        return i
+
+    start_list, end_list = [], []
+    tag_to_index_list: dict[str | int, list[int]] = {}
+    for i, ep in enumerate(event_placement_tuple):
+        start_list.append(float(ep.min_start))
+        end_list.append(float(ep.max_end))
+        if rule_set is None:
+            tag_tuple = ep.tag_tuple
+        else:
+            tag_tuple = [r for r, _ in rule_set._get_resource_tuple(ep.tag_tuple)]
+        for tag in tag_tuple:
+            tag_to_index_list.setdefault(tag, []).append(i)
+
+    for index_list in tag_to_index_list.values():
+        index_list.sort(key=lambda i: (start_list[i], end_list[i]))
+        cluster_end = None
+        for i in index_list:
+            start, end = start_list[i], end_list[i]
+            # Empty placements at the end of a cluster only overlap with
+            # empty placements at the same time (which are sorted first).
+            if cluster_end is not None and (
+                start < cluster_end or start == end == empty_time
+            ):
+                parent_list[find(i)] = find(root)
+                cluster_end = max(cluster_end, end)
+            else:
+                root, cluster_end, empty_time = i, end, None
+            if start == end:
+                empty_time = start
+
+    root_to_cluster: dict[int, list[EventPlacement]] = {}
+    for i, ep in enumerate(event_placement_tuple):
+        root_to_cluster.setdefault(find(i), []).append(ep)
+    return list(root_to_cluster.values())
+
+
+def _iter_conflicts(
+    event_placement_sequence: typing.Sequence[EventPlacement],
+    is_conflict: typing.Callable[[EventPlacement, EventPlacement], bool],
+) -> typing.Iterator[Conflict]:
+    """Yield all conflicts of placements which are sorted by their start.
+
+    Each placement is compared with all earlier placements which are still
+    active at its start. If the default ``is_conflict`` is used, only
+    placements which share a tag can conflict, so that a separate list of
+    active placements is kept per tag.
+    """
+    is_sharing_tag = is_conflict is _is_sharing_tag
+    group_to_active_list: dict[typing.Optional[str], list] = {}
+    for event_placement in event_placement_sequence:
+        start, end = _get_sort_key(event_placement)
+        group_tuple = (
+            tuple(dict.fromkeys(event_placement.tag_tuple))
+            if is_sharing_tag
+            else (None,)
+        )
+        # Placements with multiple tags may be found multiple times.
+        checked_id_set = set([])
+        for group in group_tuple:
+            active_list = group_to_active_list.setdefault(group, [])
+            # Placements which end at the start of an empty placement may
+            # be empty placements at the same time.
+            active_list[:] = [
+                active
+                for active in active_list
+                if active[0] > start or active[0] == start == end
+            ]
+            for other_end, other_start, other in active_list:
+                if (other_id := id(other)) in checked_id_set:
+                    continue
+                checked_id_set.add(other_id)
+                is_overlapping = _is_overlapping(other_start, other_end, start, end)
+                if is_overlapping and is_conflict(other, event_placement):
+                    yield Conflict(other, event_placement)
+            active_list.append((end, start, event_placement))
+
+
+def _iter_rule_set_conflicts(
+    event_placement_sequence: typing.Sequence[EventPlacement],
+    rule_set: ConflictRuleSet,
+) -> typing.Iterator[Conflict]:
+    """Yield all conflicts of placements which are sorted by their start.
+
+    For each resource a heap of the active placements ordered by their end
+    is kept, so that its size is the number of placements which currently
+    use the resource. Active placements are only visited if a resource
+    is full.
+    """
+    resource_to_heap: dict[str | int, list] = {}
+    for index, event_placement in enumerate(event_placement_sequence):
+        start, end = _get_sort_key(event_placement)
+        # Placements with multiple resources may be found multiple times.
+        checked_id_set = set([])
+        for resource, capacity in rule_set._get_resource_tuple(
+            event_placement.tag_tuple
+        ):
+            heap = resource_to_heap.setdefault(resource, [])
+            # Placements which end at the start of an empty placement may
+            # be empty placements at the same time (and because empty
+            # placements are sorted first, no empty placement follows a
+            # placement which isn't empty and starts at the same time).
+            while heap and (
+                heap[0][0] < start or (heap[0][0] == start and start < end)
+            ):
+                heapq.heappop(heap)
+            if len(heap) >= capacity:
+                overlapping_list = sorted(
+                    (other_index, other)
+                    for other_end, other_index, other_start, other in heap
+                    if _is_overlapping(other_start, other_end, start, end)
+                )
+                if len(overlapping_list) >= capacity:
+                    for _, other in overlapping_list:
+                        if (other_id := id(other)) not in checked_id_set:
+                            checked_id_set.add(other_id)
+                            yield Conflict(other, event_placement, rule_set)
+            # The index is unique, so that placements are never compared.
+            heapq.heappush(heap, (end, index, start, event_placement))
+
+
+def _resolve_cluster_conflicts(
+    event_placement_tuple: tuple[EventPlacement, ...],
+    conflict_resolution_strategy_tuple: tuple[ConflictResolutionStrategy, ...],
+    is_conflict: IsConflict,
+    is_copy_needed: bool,
+    duration: typing.Optional[core_parameters.abc.Duration],
+) -> tuple[tuple[int, TimeOrTimeRange, TimeOrTimeRange], ...]:
+    """Resolve conflicts of one overlap cluster (may run in another process).
+
+    Returns the index, start and end of each remaining placement, because
+    the placements which are resolved here aren't the original ones.
+    """
+    if is_copy_needed:
+        event_placement_tuple = pickle.loads(pickle.dumps(event_placement_tuple))
+    id_to_index = {id(ep): i for i, ep in enumerate(event_placement_tuple)}
+    timeline = TimeLine(event_placement_tuple, duration)
+    timeline.resolve_conflicts(conflict_resolution_strategy_tuple, is_conflict)
+    return tuple(
+        (id_to_index[id(ep)], ep.start_or_start_range, ep.end_or_end_range)
+        for ep in timeline.event_placement_tuple
+    )
+
+
+class _ChangeDispatcher(object):
+    """Forward changes of event placements to a time line and its snapshots.
+
+    Because snapshots share their placements with the original time line,
+    one dispatcher is attached to each placement instead of one listener
+    per time line: this keeps creating snapshots cheap. The time lines
+    themselves only react to changes of placements which they contain.
+    """
+
+    def __init__(self, timeline: TimeLine):
+        self._timeline_set: weakref.WeakSet[TimeLine] = weakref.WeakSet([timeline])
+
+    def __call__(self, event_placement: EventPlacement, kind: ChangeKind):
+        for timeline in tuple(self._timeline_set):
+            timeline._on_change(event_placement, kind)
+
+    def add(self, timeline: TimeLine):
+        self._timeline_set.add(timeline)
+
+    def discard(self, timeline: TimeLine):
+        self._timeline_set.discard(timeline)
+
+    def attach(self, event_placement: EventPlacement):
+        if not any(
+            listener is self for listener in event_placement._change_listener_list
+        ):
+            event_placement._change_listener_list.append(self)
+
+
+class _ChunkedList(object):
+    """List which shares unchanged chunks with its copies.
+
+    Copying the list only copies the list of its chunks. A chunk is
+    copied as soon as a list which doesn't own it changes it, so that
+    changing a copy of a long list only copies the touched chunks.
+    """
+
+    _chunk_size = 256
+
+    def __init__(self, item_iterable: typing.Iterable = ()):
+        self.replace(item_iterable)
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        return {"item_list": list(self)}
+
+    def __setstate__(self, state: dict[str, typing.Any]):
+        self.replace(state["item_list"])
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> typing.Iterator:
+        return itertools.chain.from_iterable(self._chunk_list)
+
+    def __setitem__(self, index: int, item: typing.Any):
+        chunk_index, index = self._locate(index)
+        self._get_mutable_chunk(chunk_index)[index] = item
+
+    def __delitem__(self, index: int):
+        chunk_index, index = self._locate(index)
+        chunk = self._get_mutable_chunk(chunk_index)
+        del chunk[index]
+        if not chunk:
+            del self._chunk_list[chunk_index]
+            self._owned_chunk_id_set.discard(id(chunk))
+        self._length -= 1
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        if index < 0:
+            index += self._length
+        if 0 <= index < self._length:
+            for chunk_index, chunk in enumerate(self._chunk_list):
+                if index < (chunk_length := len(chunk)):
+                    return chunk_index, index
+                index -= chunk_length
+        raise IndexError("list index out of range")
+
+    def _get_mutable_chunk(self, chunk_index: int) -> list:
+        chunk = self._chunk_list[chunk_index]
+        if id(chunk) not in self._owned_chunk_id_set:
+            chunk = self._chunk_list[chunk_index] = list(chunk)
+            self._owned_chunk_id_set.add(id(chunk))
+        return chunk
+
+    def append(self, item: typing.Any):
+        if self._chunk_list and len(self._chunk_list[-1]) < self._chunk_size:
+            self._get_mutable_chunk(-1).append(item)
+        else:
+            self._chunk_list.append(chunk := [item])
+            self._owned_chunk_id_set.add(id(chunk))
+        self._length += 1
+
+    def substitute(self, id_to_item: dict[int, typing.Any]):
+        """Replace all items whose 'id' is a key by the mapped item."""
+        for chunk_index, chunk in enumerate(self._chunk_list):
+            if any(id(item) in id_to_item for item in chunk):
+                chunk = self._get_mutable_chunk(chunk_index)
+                chunk[:] = [id_to_item.get(id(item), item) for item in chunk]
+
+    def replace(self, item_iterable: typing.Iterable):
+        item_list = list(item_iterable)
+        size = self._chunk_size
+        self._chunk_list = [
+            item_list[i : i + size] for i in range(0, len(item_list), size)
+        ]
+        self._owned_chunk_id_set = {id(chunk) for chunk in self._chunk_list}
+        self._length = len(item_list)
+
+    def sort(self, key: typing.Callable):
+        self.replace(sorted(self, key=key))
+
+    def copy(self) -> _ChunkedList:
+        # From now on both lists share all chunks: none of them owns
+        # any chunk anymore.
+        self._owned_chunk_id_set = set([])
+        new = type(self).__new__(type(self))
+        new._chunk_list = list(self._chunk_list)
+        new._owned_chunk_id_set = set([])
+        new._length = self._length
+        return new
+
+    def get_container_tuple(self) -> tuple[typing.Any, ...]:
+        return (self, self._chunk_list, self._owned_chunk_id_set, *self._chunk_list)
+
+
+class _ShardedDict(object):
+    """Dict which shares unchanged shards with its copies.
+
+    Like :class:`_ChunkedList`, but the keys are distributed over shards
+    by their hash. The number of shards grows with the square root of
+    the number of items, so that copying the dict and changing one of
+    its shards afterwards are both cheap.
+    """
+
+    # An odd number of shards distributes the 'id' of objects (which are
+    # multiples of 16) evenly.
+    _min_shard_count = 7
+
+    def __init__(self):
+        self._reset({}, self._min_shard_count)
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        return {"item_dict": dict(self.items())}
+
+    def __setstate__(self, state: dict[str, typing.Any]):
+        self._reset(state["item_dict"], self._min_shard_count)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> typing.Iterator:
+        return itertools.chain.from_iterable(self._shard_list)
+
+    def __contains__(self, key: typing.Any) -> bool:
+        return key in self._shard_list[hash(key) % len(self._shard_list)]
+
+    def __getitem__(self, key: typing.Any) -> typing.Any:
+        return self._shard_list[hash(key) % len(self._shard_list)][key]
+
+    def __setitem__(self, key: typing.Any, value: typing.Any):
+        shard = self._get_mutable_shard(key)
+        if key not in shard:
+            self._length += 1
+        shard[key] = value
+        if self._length > (shard_count := len(self._shard_list)) ** 2:
+            self._reset(dict(self.items()), shard_count * 2 + 1)
+
+    def __delitem__(self, key: typing.Any):
+        del self._get_mutable_shard(key)[key]
+        self._length -= 1
+
+    def _get_mutable_shard(self, key: typing.Any) -> dict:
+        shard_index = hash(key) % len(self._shard_list)
+        if shard_index not in self._owned_shard_index_set:
+            self._shard_list[shard_index] = dict(self._shard_list[shard_index])
+            self._owned_shard_index_set.add(shard_index)
+        return self._shard_list[shard_index]
+
+    def _reset(self, item_dict: dict, shard_count: int):
+        self._shard_list: list[dict] = [{} for _ in range(shard_count)]
+        for key, value in item_dict.items():
+            self._shard_list[hash(key) % shard_count][key] = value
+        self._owned_shard_index_set = set(range(shard_count))
+        self._length = len(item_dict)
+
+    def get(self, key: typing.Any, default: typing.Any = None) -> typing.Any:
+        return self._shard_list[hash(key) % len(self._shard_list)].get(key, default)
+
+    def pop(self, key: typing.Any) -> typing.Any:
+        value = self._get_mutable_shard(key).pop(key)
+        self._length -= 1
+        return value
+
+    def items(self) -> typing.Iterator[tuple[typing.Any, typing.Any]]:
+        return itertools.chain.from_iterable(
+            shard.items() for shard in self._shard_list
+        )
+
+    def values(self) -> typing.Iterator:
+        return itertools.chain.from_iterable(
+            shard.values() for shard in self._shard_list
+        )
+
+    def copy(self) -> _ShardedDict:
+        self._owned_shard_index_set = set([])
+        new = type(self).__new__(type(self))
+        new._shard_list = list(self._shard_list)
+        new._owned_shard_index_set = set([])
+        new._length = self._length
+        return new
+
+    def get_container_tuple(self) -> tuple[typing.Any, ...]:
+        return (self, self._shard_list, self._owned_shard_index_set, *self._shard_list)
+
+
+class _TagIndex(object):
+    """Sorted index of event placements per tag for fast overlap queries.
+
+    For each tag the placements are kept sorted by their start time.
+    Because we also remember the longest placement of each tag, we know
+    that all placements which overlap with a given time span start
+    within this time span or at most one longest duration earlier.
+    """
+
+    def __init__(self):
+        self._tag_to_key_list: dict[str, list[tuple[float, float, int]]] = {}
+        self._tag_to_event_placement_list: dict[str, list[EventPlacement]] = {}
+        self._tag_to_max_duration: dict[str, float] = {}
+        # We remember the indexed state of each placement, because the
+        # placement itself may already have changed when it's removed.
+        self._id_to_entry: dict[int, tuple[tuple[str, ...], float, float]] = {}
+
+    def add(self, event_placement: EventPlacement):
+        ep_id = id(event_placement)
+        tag_tuple = event_placement.tag_tuple
+        start, end = float(event_placement.min_start), float(event_placement.max_end)
+        self._id_to_entry[ep_id] = (tag_tuple, start, end)
+        key = (start, end, ep_id)
+        for tag in tag_tuple:
+            key_list = self._tag_to_key_list.setdefault(tag, [])
+            i = bisect.bisect_left(key_list, key)
+            key_list.insert(i, key)
+            self._tag_to_event_placement_list.setdefault(tag, []).insert(
+                i, event_placement
+            )
+            # Empty placements need an entry too.
+            self._tag_to_max_duration[tag] = max(
+                self._tag_to_max_duration.get(tag, 0), end - start
+            )
+
+    def remove(
+        self, event_placement: EventPlacement
+    ) -> tuple[tuple[str, ...], float, float]:
+        """Remove placement and return its indexed tags, start and end."""
+        ep_id = id(event_placement)
+        tag_tuple, start, end = entry = self._id_to_entry.pop(ep_id)
+        key = (start, end, ep_id)
+        for tag in tag_tuple:
+            key_list = self._tag_to_key_list[tag]
+            i = bisect.bisect_left(key_list, key)
+            del key_list[i]
+            del self._tag_to_event_placement_list[tag][i]
+            if not key_list:
+                del self._tag_to_key_list[tag]
+                del self._tag_to_event_placement_list[tag]
+                del self._tag_to_max_duration[tag]
+        return entry
+
+    def get_overlapping(
+        self, tag: str, start: float, end: float
+    ) -> typing.Iterator[EventPlacement]:
+        """Find all placements with the given tag which overlap with start and end."""
+        try:
+            key_list = self._tag_to_key_list[tag]
+        except KeyError:
+            return
+        event_placement_list = self._tag_to_event_placement_list[tag]
+        i = bisect.bisect_right(key_list, (start - self._tag_to_max_duration[tag],))
+        for i in range(i, len(key_list)):
+            other_start, other_end, _ = key_list[i]
+            if other_start > end:
+                break
+            if _is_overlapping(other_start, other_end, start, end):
+                yield event_placement_list[i]
+
+    def get_span_list(
+        self, tag: str, start: float, end: float
+    ) -> list[tuple[float, float]]:
+        """Get indexed start and end of placements which start within start and end."""
+        key_list = self._tag_to_key_list.get(tag, [])
+        return [
+            (other_start, other_end)
+            for other_start, other_end, _ in key_list[
+                bisect.bisect_left(key_list, (start,)) : bisect.bisect_right(
+                    key_list, (end, float("inf"))
+                )
+            ]
+        ]
+
+
+class _GapIndex(object):
+    """Occupied time spans per tag for fast free slot queries.
+
+    For each tag the union of the time spans of its placements is kept as
+    a sorted list of disjoint (and not touching) time spans. When a
+    placement is removed, only the time span which contained it is
+    recalculated from the remaining placements.
+    """
+
+    def __init__(self):
+        self._tag_index = _TagIndex()
+        self._tag_to_start_list: dict[str, list[float]] = {}
+        self._tag_to_end_list: dict[str, list[float]] = {}
+
+    def add(self, event_placement: EventPlacement):
+        self._tag_index.add(event_placement)
+        start, end = float(event_placement.min_start), float(event_placement.max_end)
+        for tag in event_placement.tag_tuple:
+            start_list = self._tag_to_start_list.setdefault(tag, [])
+            end_list = self._tag_to_end_list.setdefault(tag, [])
+            # All time spans from i to j (excluding) overlap or touch the
+            # new one and are merged with it.
+            i = bisect.bisect_left(end_list, start)
+            j = bisect.bisect_right(start_list, end)
+            if i < j:
+                start_list[i:j] = [min(start, start_list[i])]
+                end_list[i:j] = [max(end, end_list[j - 1])]
+            else:
+                start_list.insert(i, start)
+                end_list.insert(i, end)
+
+    def remove(self, event_placement: EventPlacement):
+        tag_tuple, start, _ = self._tag_index.remove(event_placement)
+        for tag in tag_tuple:
+            start_list = self._tag_to_start_list[tag]
+            end_list = self._tag_to_end_list[tag]
+            i = bisect.bisect_right(start_list, start) - 1
+            new_start_list, new_end_list = [], []
+            # All placements of a time span start within it (and we can't
+            # search for overlapping placements, because empty placements
+            # at the borders of a time span don't overlap with it).
+            for other_start, other_end in self._tag_index.get_span_list(
+                tag, start_list[i], end_list[i]
+            ):
+                if new_end_list and other_start <= new_end_list[-1]:
+                    new_end_list[-1] = max(new_end_list[-1], other_end)
+                else:
+                    new_start_list.append(other_start)
+                    new_end_list.append(other_end)
+            start_list[i : i + 1] = new_start_list
+            end_list[i : i + 1] = new_end_list
+            if not start_list:
+                del self._tag_to_start_list[tag], self._tag_to_end_list[tag]
+
+    def get_free_start(self, tag: str, start: float, duration: float) -> float:
+        """Find earliest start (not before 'start') with 'duration' free time."""
+        try:
+            start_list = self._tag_to_start_list[tag]
+        except KeyError:
+            return start
+        end_list = self._tag_to_end_list[tag]
+        i = bisect.bisect_right(end_list, start)
+        while i < len(start_list) and start_list[i] < start + duration:
+            start = max(start, end_list[i])
+            i += 1
+        return start
+
+    def iter_occupied(
+        self, tag: str, start: float
+    ) -> typing.Iterator[tuple[float, float]]:
+        """Iterate over all occupied time spans which end after 'start'."""
+        try:
+            start_list = self._tag_to_start_list[tag]
+        except KeyError:
+            return
+        end_list = self._tag_to_end_list[tag]
+        for i in range(bisect.bisect_right(end_list, start), len(start_list)):
+            yield start_list[i], end_list[i]
+
+
+class _DuplicateIndex(object):
+    """Placements grouped by their structural hash to find equal placements."""
+
+    def __init__(self):
+        self._hash_to_event_placement_list: dict[int, list[EventPlacement]] = {}
+        # We remember the indexed hash of each placement, because the
+        # placement itself may already have changed when it's removed.
+        self._id_to_hash: dict[int, int] = {}
+
+    def add(self, event_placement: EventPlacement):
+        self._id_to_hash[id(event_placement)] = h = event_placement.structural_hash
+        self._hash_to_event_placement_list.setdefault(h, []).append(event_placement)
+
+    def remove(self, event_placement: EventPlacement):
+        h = self._id_to_hash.pop(id(event_placement))
+        event_placement_list = self._hash_to_event_placement_list[h]
+        for i, other in enumerate(event_placement_list):
+            if other is event_placement:
+                del event_placement_list[i]
+                break
+        if not event_placement_list:
+            del self._hash_to_event_placement_list[h]
+
+    def contains(self, event_placement: EventPlacement) -> bool:
+        """Find out if any equal placement is indexed."""
+        return any(
+            event_placement == other
+            for other in self._hash_to_event_placement_list.get(
+                event_placement.structural_hash, []
+            )
+        )
+
+
+class _ConflictIndex(object):
+    """Live set of all pairs of overlapping event placements which share a tag."""
+
+    def __init__(self):
+        self._tag_index = _TagIndex()
+        self._key_to_conflict: dict[tuple[int, int], Conflict] = {}
+        self._id_to_key_set: dict[int, set[tuple[int, int]]] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._key_to_conflict)
+
+    @property
+    def conflict_tuple(self) -> tuple[Conflict, ...]:
+        return tuple(self._key_to_conflict.values())
+
+    def add(self, event_placement: EventPlacement):
+        ep_id = id(event_placement)
+        start, end = float(event_placement.min_start), float(event_placement.max_end)
+        sort_key = (start, end, ep_id)
+        key_set = self._id_to_key_set.setdefault(ep_id, set())
+        # Placements with multiple tags may be found multiple times.
+        checked_id_set = {ep_id}
+        for tag in event_placement.tag_tuple:
+            for other in self._tag_index.get_overlapping(tag, start, end):
+                if (other_id := id(other)) in checked_id_set:
+                    continue
+                checked_id_set.add(other_id)
+                # The left placement of a conflict is always the earlier one.
+                if (float(other.min_start), float(other.max_end), other_id) < sort_key:
+                    key, conflict = (other_id, ep_id), Conflict(other, event_placement)
+                else:
+                    key, conflict = (ep_id, other_id), Conflict(event_placement, other)
+                self._key_to_conflict[key] = conflict
+                key_set.add(key)
+                self._id_to_key_set[other_id].add(key)
+        self._tag_index.add(event_placement)
+
+    def remove(self, event_placement: EventPlacement):
+        self._tag_index.remove(event_placement)
+        for key in self._id_to_key_set.pop(id(event_placement)):
+            del self._key_to_conflict[key]
+            for ep_id in key:
+                if (key_set := self._id_to_key_set.get(ep_id)) is not None:
+                    key_set.discard(key)
@@ -3,9 +3,14 @@ import typing
 __all__ = (
     "EventPlacementRegisterError",
     "ExceedDurationError",
+    "DuplicateEventPlacementError",
     "EventPlacementNotFoundError",
     "TooSmallRangeWarning",
     "UnresolvedConflict",
+    "ConflictsNotTrackedError",
+    "ForgottenChangesError",
+    "OverlappingEventPlacementError",
+    "OverlappingEventPlacementWarning",
 )
 
 
@@ -27,6 +32,15 @@ class ExceedDurationError(EventPlacementRegisterError):
         )
 
 
+class DuplicateEventPlacementError(EventPlacementRegisterError):
+    def __init__(self, event_placement_to_register):
+        super().__init__(
+            event_placement_to_register,
+            f"An EventPlacement equal to '{event_placement_to_register}' is "
+            "already registered in the unique TimeLine.",
+        )
+
+
 class EventPlacementNotFoundError(Exception):
     def __init__(
         self,
@@ -59,3 +73,34 @@ class TooSmallRangeWarning(Warning):
 class UnresolvedConflict(Exception):
     def __init__(self, conflict):
         super().__init__(f"Can't resolve conflict '{conflict}'.")
+
+
+class ConflictsNotTrackedError(Exception):
+    def __init__(self):
+        super().__init__(
+            "TimeLine doesn't track conflicts. Initialise TimeLine "
+            "with 'track_conflicts=True' to access its conflicts."
+        )
+
+
+class ForgottenChangesError(Exception):
+    def __init__(self, version, oldest_known_version):
+        super().__init__(
+            f"Can't get changes since version '{version}': the change journal "
+            f"only knows changes since version '{oldest_known_version}'."
+        )
+
+
+class OverlappingEventPlacementError(Exception):
+    def __init__(self, conflict_tuple):
+        super().__init__(
+            f"Found {len(conflict_tuple)} overlapping EventPlacement with a "
+            f"common tag, the first one is '{conflict_tuple[0]}'."
+        )
+
+
+class OverlappingEventPlacementWarning(Warning):
+    def __init__(self, conflict):
+        super().__init__(
+            f"Found overlapping EventPlacement with a common tag: '{conflict}'."
+        )
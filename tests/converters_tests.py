@@ -1,10 +1,13 @@
+import asyncio
 import unittest
+import unittest.mock
 
 import ranges
 
 from mutwo import core_events
 from mutwo import timeline_converters
 from mutwo import timeline_interfaces
+from mutwo import timeline_utilities
 
 
 class TimeLineToEventPlacementDictTest(unittest.TestCase):
@@ -45,6 +48,82 @@ class TimeLineToEventPlacementDictTest(unittest.TestCase):
             tag_to_event_placement_tuple, expected_tag_to_event_placement_tuple
         )
 
+    def test_convert_doesnt_sort_timeline(self):
+        event_placement_tuple = tuple(reversed(self.event_placement_list))
+        timeline = timeline_interfaces.TimeLine(event_placement_tuple)
+        self.timeline_to_event_placement_dict.convert(timeline)
+        self.assertEqual(timeline.event_placement_tuple, event_placement_tuple)
+
+    def test_convert_after_change(self):
+        convert = self.timeline_to_event_placement_dict.convert
+        tag_to_event_placement_tuple = convert(self.timeline)
+        # Unchanged time lines return the same (but not the identical) dict.
+        self.assertEqual(convert(self.timeline), tag_to_event_placement_tuple)
+        self.assertIsNot(convert(self.timeline), tag_to_event_placement_tuple)
+
+        event_placement_0, event_placement_1, event_placement_01, _ = (
+            self.event_placement_list
+        )
+        event_placement_0.move_by(5)
+        self.timeline.unregister(self.event_placement_list[3])
+        new_event_placement = timeline_interfaces.EventPlacement(
+            self.simultaneous_event_1, 2, 3
+        )
+        self.timeline.register(new_event_placement)
+        self.assertEqual(
+            convert(self.timeline),
+            {
+                self.tag0: (event_placement_01, event_placement_0),
+                self.tag1: (event_placement_1, new_event_placement, event_placement_01),
+            },
+        )
+
+        event_placement_0.event = self.simultaneous_event_1.copy()
+        self.timeline.unregister(event_placement_01)
+        self.assertEqual(
+            convert(self.timeline),
+            {self.tag1: (event_placement_1, new_event_placement, event_placement_0)},
+        )
+
+        # Time lines are converted from scratch if the converter doesn't
+        # know their changes.
+        snapshot = self.timeline.snapshot()
+        self.timeline.register(event_placement_01)
+        self.timeline.restore(snapshot)
+        self.assertEqual(convert(self.timeline), convert(snapshot))
+
+    def test_convert_with_overlap(self):
+        self.assertRaises(
+            ValueError, timeline_converters.TimeLineToEventPlacementDict, "error"
+        )
+
+        overlapping_event_placement = timeline_interfaces.EventPlacement(
+            self.simultaneous_event_01, 0.5, 1.5
+        )
+        self.timeline.register(overlapping_event_placement)
+        # By default overlaps are ignored.
+        self.timeline_to_event_placement_dict.convert(self.timeline)
+
+        with self.assertLogs(level="WARNING") as log:
+            timeline_converters.TimeLineToEventPlacementDict("warn").convert(
+                self.timeline
+            )
+        # The placement overlaps with placements of both tags, but with each
+        # placement only once.
+        self.assertEqual(len(log.records), 2)
+
+        timeline_to_event_placement_dict = (
+            timeline_converters.TimeLineToEventPlacementDict("raise")
+        )
+        for _ in range(2):
+            self.assertRaises(
+                timeline_utilities.OverlappingEventPlacementError,
+                timeline_to_event_placement_dict.convert,
+                self.timeline,
+            )
+        self.timeline.unregister(overlapping_event_placement)
+        timeline_to_event_placement_dict.convert(self.timeline)
+
 
 class TimeLineToConcurrenceTest(unittest.TestCase):
     def setUp(self):
@@ -95,6 +174,204 @@ class TimeLineToConcurrenceTest(unittest.TestCase):
         self.assertEqual(len(simultaneous_event[1][0]), 3)
         self.assertEqual(simultaneous_event[0].duration, simultaneous_event[1].duration)
 
+    def test_convert_many(self):
+        random_seed_tuple = (1, 2, 3)
+        simultaneous_event_tuple = self.timeline_to_simultaneous_event.convert_many(
+            self.timeline, random_seed_tuple
+        )
+        self.assertEqual(len(simultaneous_event_tuple), 3)
+        for random_seed, simultaneous_event in zip(
+            random_seed_tuple, simultaneous_event_tuple
+        ):
+            self.assertEqual(
+                simultaneous_event,
+                timeline_converters.TimeLineToConcurrence(random_seed).convert(
+                    self.timeline
+                ),
+            )
+        # The variants don't share any events.
+        simultaneous_event_tuple[0][0][0][0].duration = 100
+        self.assertNotEqual(
+            simultaneous_event_tuple[0][0], simultaneous_event_tuple[1][0]
+        )
+        self.assertNotEqual(
+            simultaneous_event_tuple[1][1], simultaneous_event_tuple[2][1]
+        )
+
+    def test_convert_with_cache(self):
+        timeline_to_simultaneous_event = timeline_converters.TimeLineToConcurrence(
+            cache_size=10
+        )
+        simultaneous_event = timeline_to_simultaneous_event.convert(self.timeline)
+        self.assertEqual(
+            simultaneous_event,
+            self.timeline_to_simultaneous_event.convert(self.timeline),
+        )
+
+        # Changing the result doesn't change the cached events
+        simultaneous_event[0][0][0].duration = 100
+        self.assertNotEqual(
+            simultaneous_event[0],
+            timeline_to_simultaneous_event.convert(self.timeline)[0],
+        )
+
+        # Changed placements are converted again (we only compare the
+        # first tag, because the second tag has random start times)
+        event_placement = self.timeline.get_event_placement("a", 0)
+        event_placement.end_or_end_range = 2
+        self.assertEqual(
+            timeline_to_simultaneous_event.convert(self.timeline)[0],
+            timeline_converters.TimeLineToConcurrence().convert(self.timeline)[0],
+        )
+        self.assertEqual(
+            timeline_to_simultaneous_event.convert(self.timeline)[0][0][0].duration, 2
+        )
+
+    def test_convert_only_changed_event_placements(self):
+        timeline_to_simultaneous_event = timeline_converters.TimeLineToConcurrence(
+            cache_size=10
+        )
+        timeline_to_simultaneous_event.convert(self.timeline)
+        # Placements with ranges get new times in each conversion and
+        # are never cached.
+        self.assertEqual(len(timeline_to_simultaneous_event._key_to_event), 3)
+
+        event_placement = self.timeline.get_event_placement("a", 0)
+        event_placement.end_or_end_range = 2
+        with unittest.mock.patch.object(
+            timeline_to_simultaneous_event,
+            "_event_placement_to_event",
+            wraps=timeline_to_simultaneous_event._event_placement_to_event,
+        ) as event_placement_to_event:
+            timeline_to_simultaneous_event.convert(self.timeline)
+        # Only the changed placement and the placement with ranges are
+        # converted again.
+        self.assertEqual(
+            sorted(
+                float(call.args[0].min_start)
+                for call in event_placement_to_event.call_args_list
+            ),
+            [0, 1],
+        )
+
+    def test_convert_tag_without_event(self):
+        timeline = timeline_interfaces.TimeLine(
+            [
+                timeline_interfaces.EventPlacement(
+                    core_events.Concurrence([self.chronon_a]), 0, 2
+                ),
+                timeline_interfaces.EventPlacement(
+                    core_events.Concurrence([core_events.Consecution([], tag="b")]),
+                    0,
+                    1,
+                ),
+            ]
+        )
+        # A tag without any event is filled with a rest.
+        simultaneous_event = self.timeline_to_simultaneous_event.convert(timeline)
+        self.assertEqual(
+            simultaneous_event[1],
+            core_events.Concurrence(
+                [core_events.Consecution([core_events.Chronon(2)], tag="b")], tag="b"
+            ),
+        )
+        self.assertEqual(simultaneous_event[1].duration, simultaneous_event[0].duration)
+
+    def test_convert_clipped_segments(self):
+        event = core_events.Concurrence(
+            [
+                core_events.Consecution(
+                    [core_events.Chronon(1), core_events.Chronon(2)], tag="a"
+                )
+            ]
+        )
+        timeline = timeline_interfaces.TimeLine(
+            [
+                timeline_interfaces.EventPlacement(event, start, end)
+                for start, end in ((0, 3), (3.5, 5), (6, 8))
+            ],
+            duration=10,
+        )
+        # Segments which are split with the "clip" policy can be converted
+        # independently and concatenated.
+        duration_list = [
+            float(self.timeline_to_simultaneous_event.convert(segment).duration)
+            for segment in timeline.split_at(2, 7, policy="clip")
+        ]
+        self.assertEqual(duration_list, [2, 5, 3])
+        self.assertEqual(
+            sum(duration_list),
+            float(self.timeline_to_simultaneous_event.convert(timeline).duration),
+        )
+
+
+class IncrementalTimeLineToConcurrenceTest(unittest.TestCase):
+    def setUp(self):
+        self.timeline = timeline_interfaces.TimeLine()
+        self.converter = timeline_converters.IncrementalTimeLineToConcurrence()
+
+    def _make_event_placement(self, start, end, tag="a"):
+        return timeline_interfaces.EventPlacement(
+            core_events.Concurrence([core_events.Chronon(1, tag=tag)]), start, end
+        )
+
+    def _get_duration_and_tag_list(self, simultaneous_event):
+        return [
+            [(float(chronon.duration), chronon.tag) for chronon in tagged_event[0]]
+            for tagged_event in simultaneous_event
+        ]
+
+    def test_convert(self):
+        self.timeline.register(self._make_event_placement(1, 3))
+        self.assertEqual(
+            self._get_duration_and_tag_list(self.converter.convert(self.timeline, 2)),
+            [[(1, None), (1, "a")]],
+        )
+        self.assertEqual(self.converter.position, 2)
+        # Placements which are cut continue in the next segment and
+        # new tags are added as soon as they are registered.
+        self.timeline.register(self._make_event_placement(1, 4, "b"))
+        simultaneous_event = self.converter.convert(self.timeline, 3)
+        self.assertEqual(
+            self._get_duration_and_tag_list(simultaneous_event),
+            [[(1, "a")], [(1, "b")]],
+        )
+        self.assertEqual(simultaneous_event.duration, 1)
+
+    def test_convert_after_change(self):
+        self.converter.convert(self.timeline, 3)
+        event_placement0 = self._make_event_placement(5, 6)
+        event_placement1 = self._make_event_placement(4, 6, "b")
+        self.timeline.register(event_placement0)
+        self.timeline.register(event_placement1)
+        self.timeline.unregister(event_placement1)
+        event_placement0.start_or_start_range = 4.5
+        self.assertEqual(
+            self._get_duration_and_tag_list(self.converter.convert(self.timeline, 6)),
+            [[(1.5, None), (1.5, "a")], [(3, None)]],
+        )
+
+    def test_convert_backwards(self):
+        self.converter.convert(self.timeline, 2)
+        self.assertRaises(ValueError, self.converter.convert, self.timeline, 1)
+
+    def test_stream(self):
+        self.timeline.register(self._make_event_placement(1, 3))
+
+        async def stream():
+            return [
+                self._get_duration_and_tag_list(simultaneous_event)
+                async for simultaneous_event in self.converter.stream(
+                    self.timeline, 2, end=5, seconds_per_beat=0.001
+                )
+            ]
+
+        self.assertEqual(
+            asyncio.run(stream()),
+            [[[(1, None), (1, "a")]], [[(1, "a"), (1, None)]], [[(1, None)]]],
+        )
+        self.assertEqual(self.converter.position, 5)
+
 
 class TimeLineToEventPlacementTupleTest(unittest.TestCase):
     def setUp(self):
@@ -1,4 +1,9 @@
+import concurrent.futures
+import pickle
+import threading
 import unittest
+import unittest.mock
+import weakref
 
 import ranges
 
@@ -22,6 +27,65 @@ class EventPlacementTest(unittest.TestCase):
             )
         )
 
+    def test_from_arrays(self):
+        event = core_events.Concurrence([core_events.Chronon(1, tag="a")])
+        event_placement_tuple = timeline_interfaces.EventPlacement.from_arrays(
+            (event, event), (0, 2), (1, 3), max_end_sequence=(1, 3.5)
+        )
+        self.assertEqual(
+            event_placement_tuple,
+            (
+                timeline_interfaces.EventPlacement(event, 0, 1),
+                timeline_interfaces.EventPlacement(event, 2, ranges.Range(3, 3.5)),
+            ),
+        )
+        self.assertIs(event_placement_tuple[0].event, event)
+        self.assertNotEqual(
+            event_placement_tuple[0].version, event_placement_tuple[1].version
+        )
+        # Times are rounded like 'DirectDuration' rounds them.
+        event_placement = timeline_interfaces.EventPlacement.from_arrays(
+            (event,), (1 / 3,), (1,)
+        )[0]
+        self.assertEqual(
+            event_placement.start_or_start_range, core_parameters.DirectDuration(1 / 3)
+        )
+        self.assertEqual(
+            event_placement.start_or_start_range.beat_count,
+            core_parameters.DirectDuration(1 / 3).beat_count,
+        )
+        # Like the constructor, empty placements are accepted.
+        self.assertEqual(
+            timeline_interfaces.EventPlacement.from_arrays((event,), (1,), (1,)),
+            (timeline_interfaces.EventPlacement(event, 1, 1),),
+        )
+
+    def test_from_arrays_error(self):
+        event = core_events.Concurrence([core_events.Chronon(1, tag="a")])
+        self.assertRaises(
+            ValueError,
+            timeline_interfaces.EventPlacement.from_arrays,
+            (event, event),
+            (0, 2),
+            (1,),
+        )
+        self.assertRaises(
+            ValueError,
+            timeline_interfaces.EventPlacement.from_arrays,
+            (event,),
+            (1,),
+            (2,),
+            max_start_sequence=(0.5,),
+        )
+        self.assertRaises(
+            ValueError,
+            timeline_interfaces.EventPlacement.from_arrays,
+            (event,),
+            (1,),
+            (2,),
+            max_end_sequence=(1.5,),
+        )
+
     def test_duration(self):
         self.assertEqual(self.event_placement_with_start_and_end.duration, 1)
         self.assertEqual(
@@ -146,6 +210,74 @@ class EventPlacementTest(unittest.TestCase):
 
         self.assertNotEqual(event_placement_copy.event, event_placement.event)
 
+    def test_structural_hash(self):
+        event_placement = self.event_placement_with_start_and_end
+        event_placement_copy = event_placement.copy()
+        self.assertEqual(
+            event_placement.structural_hash, event_placement_copy.structural_hash
+        )
+        event_placement_copy.move_by(1)
+        self.assertNotEqual(
+            event_placement.structural_hash, event_placement_copy.structural_hash
+        )
+        event_placement_copy.move_by(-1)
+        self.assertEqual(
+            event_placement.structural_hash, event_placement_copy.structural_hash
+        )
+
+    def test_eq(self):
+        event_placement = self.event_placement_with_start_and_end
+        event_placement_copy = event_placement.copy()
+        self.assertEqual(event_placement, event_placement_copy)
+        self.assertNotEqual(
+            event_placement, self.event_placement_with_start_range_and_end_range
+        )
+        event_placement_copy.event = core_events.Concurrence(
+            [core_events.Chronon(1, tag="a")]
+        )
+        self.assertNotEqual(event_placement, event_placement_copy)
+        # Same start, end, tags and duration, but different content.
+        chronon = core_events.Chronon(1)
+        chronon.volume = "ff"
+        event_placement_copy.event = core_events.Concurrence([chronon])
+        self.assertEqual(
+            event_placement.structural_hash, event_placement_copy.structural_hash
+        )
+        self.assertNotEqual(event_placement, event_placement_copy)
+        self.assertNotEqual(event_placement, 1)
+
+    def test_share_event(self):
+        event = core_events.Concurrence([core_events.Chronon(1, tag="a")])
+        event_placement = timeline_interfaces.EventPlacement(
+            event, 0, 1, share_event=True
+        )
+        self.assertTrue(event_placement.is_event_shared)
+        event_placement_copy = event_placement.copy()
+        self.assertTrue(event_placement_copy.is_event_shared)
+        self.assertIs(event_placement_copy.event, event)
+        self.assertEqual(event_placement_copy, event_placement)
+
+        version = event_placement_copy.version
+        mutable_event = event_placement_copy.get_mutable_event()
+        self.assertIsNot(mutable_event, event)
+        self.assertFalse(event_placement_copy.is_event_shared)
+        self.assertNotEqual(event_placement_copy.version, version)
+        mutable_event.duration += 2
+        self.assertEqual(event.duration, 1)
+        self.assertEqual(event_placement_copy.event.duration, 3)
+        # Unshared events are returned as they are.
+        self.assertIs(event_placement_copy.get_mutable_event(), mutable_event)
+        self.assertIsNot(event_placement_copy.copy().event, mutable_event)
+
+        self.assertTrue(
+            all(
+                ep.is_event_shared and ep.event is event
+                for ep in timeline_interfaces.EventPlacement.from_arrays(
+                    (event, event), (0, 1), (1, 2), share_event=True
+                )
+            )
+        )
+
 
 class TimeLineTest(unittest.TestCase):
     def setUp(self):
@@ -244,6 +376,25 @@ class TimeLineTest(unittest.TestCase):
         self.timeline_dynamic.unregister(event_placement)
         self.assertEqual(len(self.timeline_dynamic.event_placement_tuple), 0)
 
+    def test_unregister_sequence(self):
+        event_placement_tuple = tuple(
+            timeline_interfaces.EventPlacement(self.event, i, i + 1) for i in range(4)
+        )
+        for event_placement in event_placement_tuple:
+            self.timeline_dynamic.register(event_placement)
+        self.timeline_dynamic.unregister_sequence(event_placement_tuple[1:3])
+        self.assertEqual(
+            self.timeline_dynamic.event_placement_tuple,
+            (event_placement_tuple[0], event_placement_tuple[3]),
+        )
+        self.assertRaises(
+            timeline_utilities.EventPlacementNotFoundError,
+            self.timeline_dynamic.unregister_sequence,
+            event_placement_tuple,
+        )
+        # Nothing is removed in case of an error
+        self.assertEqual(len(self.timeline_dynamic.event_placement_tuple), 2)
+
     def test_unregister_error(self):
         event_placement = timeline_interfaces.EventPlacement(self.event, 0, 1)
         self.assertRaises(
@@ -252,6 +403,418 @@ class TimeLineTest(unittest.TestCase):
             event_placement,
         )
 
+    def test_unregister_with_empty_event_placement(self):
+        timeline = timeline_interfaces.TimeLine()
+        event_placement_0 = timeline_interfaces.EventPlacement(self.event, 2, 3)
+        event_placement_1 = timeline_interfaces.EventPlacement(self.event, 3, 3)
+        timeline.register(event_placement_0)
+        timeline.register(event_placement_1)
+        self.assertEqual(timeline.find_free_slot(self.tag, 3).start, 3)
+        # The empty placement at the border of the occupied time span
+        # is still occupying its time.
+        timeline.unregister(event_placement_0)
+        self.assertEqual(timeline.find_free_slot(self.tag, 3, after=1).start, 3)
+        timeline.unregister(event_placement_1)
+        self.assertEqual(timeline.find_free_slot(self.tag, 3, after=1).start, 1)
+
+    def test_unregister_event_placement_registered_twice(self):
+        timeline = timeline_interfaces.TimeLine(track_conflicts=True)
+        event_placement = timeline_interfaces.EventPlacement(self.event, 0, 1)
+        timeline.register(event_placement)
+        timeline.register(event_placement)
+        self.assertEqual(timeline.find_free_slot(self.tag, 1).start, 1)
+        timeline.unregister(event_placement)
+        self.assertEqual(timeline.find_free_slot(self.tag, 1).start, 1)
+        timeline.unregister(event_placement)
+        self.assertEqual(timeline.find_free_slot(self.tag, 1).start, 0)
+        self.assertFalse(timeline.has_conflicts)
+
+    def test_conflicts_with_empty_event_placements(self):
+        # Conflict detection, the live conflicts and conflict resolution
+        # agree on which placements overlap.
+        for start_and_end_tuple, is_conflict in (
+            (((1, 1), (1, 1)), True),
+            (((0, 2), (1, 1)), True),
+            (((1, 1), (1, 2)), False),
+            (((0, 1), (1, 1)), False),
+        ):
+            with self.subTest(start_and_end_tuple=start_and_end_tuple):
+                timeline = timeline_interfaces.TimeLine(track_conflicts=True)
+                event_placement_0, event_placement_1 = (
+                    timeline_interfaces.EventPlacement(self.event, start, end)
+                    for start, end in start_and_end_tuple
+                )
+                timeline.register(event_placement_0)
+                timeline.register(event_placement_1)
+                self.assertEqual(
+                    event_placement_0.is_overlapping(event_placement_1), is_conflict
+                )
+                self.assertEqual(timeline.has_conflicts, is_conflict)
+                self.assertEqual(len(tuple(timeline.find_conflicts())), is_conflict)
+                self.assertEqual(
+                    len(
+                        tuple(
+                            timeline.find_conflicts(
+                                timeline_interfaces.ConflictRuleSet()
+                            )
+                        )
+                    ),
+                    is_conflict,
+                )
+                timeline.resolve_conflicts([timeline_interfaces.AlwaysLeftStrategy()])
+                self.assertEqual(len(timeline.event_placement_tuple), 2 - is_conflict)
+                self.assertFalse(timeline.has_conflicts)
+
+    def test_conflicts(self):
+        timeline = timeline_interfaces.TimeLine(track_conflicts=True)
+        event_placement_0 = timeline_interfaces.EventPlacement(self.event, 0, 1)
+        event_placement_1 = timeline_interfaces.EventPlacement(self.event, 0.5, 1.5)
+        event_placement_2 = timeline_interfaces.EventPlacement(
+            self.event.copy().set_parameter("tag", "d"), 0.3, 0.5
+        )
+        event_placement_3 = timeline_interfaces.EventPlacement(self.event, 1.5, 2)
+
+        for event_placement in (
+            event_placement_0,
+            event_placement_1,
+            event_placement_2,
+            event_placement_3,
+        ):
+            timeline.register(event_placement)
+
+        self.assertTrue(timeline.has_conflicts)
+        self.assertEqual(len(timeline.conflicts), 1)
+        conflict = timeline.conflicts[0]
+        self.assertIs(conflict.left, event_placement_0)
+        self.assertIs(conflict.right, event_placement_1)
+
+        # Changing a registered placement updates the conflicts
+        event_placement_1.move_by(0.25)
+        self.assertEqual(len(timeline.conflicts), 2)
+        event_placement_1.move_by(0.25)
+        self.assertEqual(len(timeline.conflicts), 1)
+        self.assertIs(timeline.conflicts[0].left, event_placement_1)
+        self.assertIs(timeline.conflicts[0].right, event_placement_3)
+
+        timeline.unregister(event_placement_3)
+        self.assertFalse(timeline.has_conflicts)
+        self.assertEqual(timeline.conflicts, ())
+
+    def test_conflicts_not_tracked(self):
+        self.assertRaises(
+            timeline_utilities.ConflictsNotTrackedError,
+            lambda: self.timeline_dynamic.has_conflicts,
+        )
+
+    def test_snapshot(self):
+        event_placement_0 = timeline_interfaces.EventPlacement(self.event, 0, 1)
+        event_placement_1 = timeline_interfaces.EventPlacement(self.event, 0.5, 1.5)
+        event_placement_2 = timeline_interfaces.EventPlacement(self.event, 3, 4)
+        timeline = timeline_interfaces.TimeLine(
+            [event_placement_0, event_placement_1], track_conflicts=True
+        )
+
+        snapshot = timeline.snapshot()
+        timeline.resolve_conflicts()
+        self.assertEqual(timeline.event_placement_tuple, (event_placement_0,))
+        self.assertEqual(
+            snapshot.event_placement_tuple, (event_placement_0, event_placement_1)
+        )
+        self.assertTrue(snapshot.has_conflicts)
+        self.assertFalse(timeline.has_conflicts)
+
+        # Snapshots can be changed themselves (branching)
+        snapshot.register(event_placement_2)
+        self.assertEqual(len(snapshot.event_placement_tuple), 3)
+        self.assertEqual(len(timeline.event_placement_tuple), 1)
+
+        timeline.restore(snapshot)
+        self.assertEqual(len(timeline.event_placement_tuple), 3)
+        self.assertTrue(timeline.has_conflicts)
+        timeline.unregister(event_placement_2)
+        self.assertEqual(len(timeline.event_placement_tuple), 2)
+        self.assertEqual(len(snapshot.event_placement_tuple), 3)
+
+    def test_snapshot_with_mutable_event_placement(self):
+        event_placement_0 = timeline_interfaces.EventPlacement(self.event, 0, 1)
+        event_placement_1 = timeline_interfaces.EventPlacement(self.event, 2, 3)
+        timeline = timeline_interfaces.TimeLine(
+            [event_placement_0, event_placement_1], track_conflicts=True
+        )
+        snapshot = timeline.snapshot()
+        self.assertFalse(snapshot.has_conflicts)
+
+        # A placement which is shared with a snapshot is copied
+        mutable_event_placement = timeline.get_mutable_event_placement(
+            event_placement_1
+        )
+        self.assertIsNot(mutable_event_placement, event_placement_1)
+        self.assertEqual(mutable_event_placement, event_placement_1)
+        mutable_event_placement.move_by(-1.5)
+        self.assertTrue(timeline.has_conflicts)
+        self.assertFalse(snapshot.has_conflicts)
+        self.assertEqual(float(event_placement_1.min_start), 2)
+        self.assertEqual(
+            timeline.event_placement_tuple, (event_placement_0, mutable_event_placement)
+        )
+        self.assertEqual(
+            [change.kind for change in timeline.get_change_tuple(2)],
+            ["unregistered", "registered", "moved"],
+        )
+        # ... but only once.
+        self.assertIs(
+            timeline.get_mutable_event_placement(mutable_event_placement),
+            mutable_event_placement,
+        )
+
+        # Moving placements of a snapshot doesn't change the original.
+        snapshot.get_mutable_event_placement(event_placement_0).move_by(0.5)
+        self.assertFalse(snapshot.has_conflicts)
+        self.assertTrue(timeline.has_conflicts)
+        self.assertEqual(float(event_placement_0.min_start), 0)
+
+        self.assertRaises(
+            timeline_utilities.EventPlacementNotFoundError,
+            timeline.get_mutable_event_placement,
+            timeline_interfaces.EventPlacement(self.event, 0, 1),
+        )
+
+    def test_snapshot_with_shifting_strategy(self):
+        timeline = timeline_interfaces.TimeLine(
+            [
+                timeline_interfaces.EventPlacement(self.event, start, start + 2)
+                for start in (0, 1, 4)
+            ]
+        )
+        snapshot = timeline.snapshot()
+        timeline.resolve_conflicts([timeline_interfaces.ShiftLaterStrategy()])
+        self.assertEqual(
+            [float(ep.min_start) for ep in timeline.event_placement_tuple],
+            [0, 2, 5],
+        )
+        self.assertEqual(
+            [float(ep.min_start) for ep in snapshot.event_placement_tuple],
+            [0, 1, 4],
+        )
+        timeline.restore(snapshot)
+        self.assertEqual(
+            [float(ep.min_start) for ep in timeline.event_placement_tuple],
+            [0, 1, 4],
+        )
+
+    def test_snapshot_of_long_time_line(self):
+        # Long lists are copied in chunks: changing a copy only copies
+        # the changed chunks.
+        timeline = timeline_interfaces.TimeLine(
+            [
+                timeline_interfaces.EventPlacement(self.event, start, start + 1)
+                for start in range(1000)
+            ]
+        )
+        snapshot = timeline.snapshot()
+        event_placement_tuple = timeline.event_placement_tuple
+        timeline.unregister(event_placement_tuple[500])
+        timeline.register(event_placement_tuple[500])
+        timeline.unregister(event_placement_tuple[0])
+        self.assertEqual(snapshot.event_placement_tuple, event_placement_tuple)
+        self.assertEqual(
+            timeline.event_placement_tuple,
+            event_placement_tuple[1:500]
+            + event_placement_tuple[501:]
+            + event_placement_tuple[500:501],
+        )
+        self.assertEqual(
+            pickle.loads(pickle.dumps(timeline)).event_placement_tuple,
+            timeline.event_placement_tuple,
+        )
+        self.assertEqual(len(snapshot.tag_to_count), 1)
+        self.assertEqual(timeline.tag_to_count, {self.tag: 999})
+        timeline.restore(snapshot)
+        self.assertEqual(timeline.event_placement_tuple, event_placement_tuple)
+        self.assertEqual(timeline.tag_to_count, {self.tag: 1000})
+
+    def test_tag_to_count(self):
+        event_a = core_events.Concurrence(
+            [core_events.Chronon(1, tag="a"), core_events.Chronon(1, tag="a")]
+        )
+        event_b = core_events.Concurrence([core_events.Chronon(1, tag="b")])
+        event_placement_0 = timeline_interfaces.EventPlacement(event_a, 0, 1)
+        event_placement_1 = timeline_interfaces.EventPlacement(self.event, 2, 3)
+        timeline = self.timeline_dynamic
+        self.assertEqual(timeline.tag_set, set([]))
+        self.assertEqual(timeline.tag_to_count, {})
+
+        timeline.register(event_placement_0)
+        timeline.register(event_placement_0)
+        timeline.register(event_placement_1)
+        self.assertEqual(timeline.tag_to_count, {"a": 2, self.tag: 1})
+        self.assertEqual(timeline.tag_set, {"a", self.tag})
+
+        event_placement_0.event = event_b
+        self.assertEqual(timeline.tag_to_count, {"b": 2, self.tag: 1})
+
+        snapshot = timeline.snapshot()
+        timeline.unregister(event_placement_1)
+        self.assertEqual(timeline.tag_set, {"b"})
+        self.assertEqual(snapshot.tag_set, {"b", self.tag})
+        self.assertEqual(pickle.loads(pickle.dumps(timeline)).tag_to_count, {"b": 2})
+
+        timeline.restore(snapshot)
+        self.assertEqual(timeline.tag_to_count, {"b": 2, self.tag: 1})
+
+    def test_version_and_change_journal(self):
+        event_placement_0 = timeline_interfaces.EventPlacement(self.event, 0, 1)
+        event_placement_1 = timeline_interfaces.EventPlacement(self.event, 2, 3)
+        timeline = self.timeline_dynamic
+        self.assertEqual(timeline.version, 0)
+
+        timeline.register(event_placement_0)
+        timeline.register(event_placement_1)
+        cursor = timeline.version
+        self.assertEqual(cursor, 2)
+
+        event_placement_0.move_by(1)
+        event_placement_1.event = self.event.copy()
+        timeline.unregister(event_placement_0)
+        # Changes of unregistered placements aren't part of the time line
+        event_placement_0.move_by(1)
+        # Sorting isn't a change
+        timeline.sort()
+
+        self.assertEqual(timeline.version, 5)
+        change_tuple = timeline.get_change_tuple(cursor)
+        self.assertEqual(
+            [(c.version, c.kind, c.event_placement) for c in change_tuple],
+            [
+                (3, "moved", event_placement_0),
+                (4, "event_replaced", event_placement_1),
+                (5, "unregistered", event_placement_0),
+            ],
+        )
+        self.assertEqual(len(timeline.get_change_tuple()), 5)
+
+        timeline.forget_changes(cursor)
+        self.assertEqual(timeline.get_change_tuple(cursor), change_tuple)
+        self.assertRaises(
+            timeline_utilities.ForgottenChangesError, timeline.get_change_tuple, 0
+        )
+
+    def test_version_of_snapshot(self):
+        event_placement = timeline_interfaces.EventPlacement(self.event, 0, 1)
+        timeline = self.timeline_dynamic
+        timeline.register(event_placement)
+        snapshot = timeline.snapshot()
+        event_placement.move_by(1)
+        self.assertEqual(timeline.version, 2)
+        self.assertEqual(snapshot.version, 2)
+        snapshot.unregister(event_placement)
+        event_placement.move_by(1)
+        self.assertEqual(timeline.version, 3)
+        self.assertEqual(snapshot.version, 3)
+        self.assertEqual(
+            [c.kind for c in snapshot.get_change_tuple(1)], ["moved", "unregistered"]
+        )
+        timeline.restore(snapshot)
+        self.assertEqual(timeline.version, 4)
+        self.assertRaises(
+            timeline_utilities.ForgottenChangesError, timeline.get_change_tuple, 3
+        )
+
+    def test_max_change_count(self):
+        timeline = timeline_interfaces.TimeLine(max_change_count=2)
+        for start in range(5):
+            timeline.register(
+                timeline_interfaces.EventPlacement(self.event, start, start + 1)
+            )
+            self.assertLessEqual(len(timeline.get_change_tuple(timeline.version)), 4)
+        self.assertEqual(timeline.version, 5)
+        self.assertEqual(len(timeline.get_change_tuple(3)), 2)
+        self.assertRaises(
+            timeline_utilities.ForgottenChangesError, timeline.get_change_tuple, 2
+        )
+
+    def test_change_journal_memory(self):
+        event_placement = timeline_interfaces.EventPlacement(self.event.copy(), 0, 1)
+        reference = weakref.ref(event_placement)
+        timeline = timeline_interfaces.TimeLine([event_placement])
+        timeline.unregister(event_placement)
+        del event_placement
+        # The unregistered placement is kept alive by the change journal
+        self.assertIsNotNone(reference())
+        report = timeline.memory_report()
+        self.assertEqual(report.event_byte_count, 0)
+        self.assertGreater(report.change_journal_byte_count, 0)
+
+        # ... but the journal is bounded by default.
+        for start in range(2048):
+            timeline.register(
+                timeline_interfaces.EventPlacement(self.event, start, start + 1)
+            )
+        self.assertIsNone(reference())
+        self.assertRaises(
+            timeline_utilities.ForgottenChangesError, timeline.get_change_tuple, 0
+        )
+
+    def test_evict(self):
+        evicted_list = []
+        timeline = timeline_interfaces.TimeLine(
+            track_conflicts=True, on_evict=evicted_list.append
+        )
+        event_placement_0 = timeline_interfaces.EventPlacement(self.event, 0, 2)
+        event_placement_1 = timeline_interfaces.EventPlacement(self.event, 1, 3)
+        event_placement_2 = timeline_interfaces.EventPlacement(
+            core_events.Concurrence([core_events.Chronon(1, tag="b")]), 2, 4
+        )
+        for event_placement in (
+            event_placement_0,
+            event_placement_1,
+            event_placement_0,
+            event_placement_2,
+        ):
+            timeline.register(event_placement)
+        self.assertTrue(timeline.has_conflicts)
+        cursor = timeline.version
+
+        self.assertEqual(timeline.evict(1), tuple([]))
+        self.assertEqual(evicted_list, [])
+
+        evicted_tuple = timeline.evict(2)
+        self.assertEqual(len(evicted_tuple), 1)
+        self.assertIs(evicted_tuple[0], event_placement_0)
+        self.assertEqual(evicted_list, [evicted_tuple])
+        self.assertEqual(
+            [c.kind for c in timeline.get_change_tuple(cursor)], ["unregistered"] * 2
+        )
+        self.assertFalse(timeline.has_conflicts)
+        self.assertEqual(timeline.tag_to_count, {self.tag: 1, "b": 1})
+
+        timeline.evict(4)
+        self.assertEqual(timeline.event_placement_tuple, tuple([]))
+        self.assertEqual(timeline.tag_set, set([]))
+        # The duration doesn't shrink
+        self.assertEqual(timeline.duration, 4)
+
+    def test_move_playhead(self):
+        timeline = timeline_interfaces.TimeLine(horizon=2)
+        self.assertEqual(timeline.playhead, 0)
+        for start in range(4):
+            timeline.register(
+                timeline_interfaces.EventPlacement(self.event, start, start + 1)
+            )
+        self.assertEqual(timeline.move_playhead(2), tuple([]))
+        self.assertEqual(len(timeline.move_playhead(4)), 2)
+        self.assertEqual(timeline.playhead, 4)
+        self.assertEqual(
+            [ep.min_start for ep in timeline.event_placement_tuple], [2, 3]
+        )
+        self.assertRaises(ValueError, timeline.move_playhead, 3)
+
+        # Without a horizon nothing is evicted
+        timeline = self.timeline_dynamic
+        timeline.register(timeline_interfaces.EventPlacement(self.event, 0, 1))
+        self.assertEqual(timeline.move_playhead(10), tuple([]))
+        self.assertEqual(len(timeline.event_placement_tuple), 1)
+
     def test_resolve_conflicts(self):
         # First we make a simple test with only two overlapping
         # event placements. One of them should be removed when we
@@ -345,6 +908,638 @@ class TimeLineTest(unittest.TestCase):
             event_placement_2 in self.timeline_dynamic.event_placement_tuple
         )
 
+    def test_find_conflicts(self):
+        event_placement_0 = timeline_interfaces.EventPlacement(self.event, 0, 2)
+        event_placement_1 = timeline_interfaces.EventPlacement(
+            self.event.copy().set_parameter("tag", "d"), 0.5, 1
+        )
+        event_placement_2 = timeline_interfaces.EventPlacement(self.event, 1, 3)
+        event_placement_3 = timeline_interfaces.EventPlacement(self.event, 1.5, 1.5)
+        event_placement_4 = timeline_interfaces.EventPlacement(self.event, 3, 4)
+        timeline = self.timeline_dynamic
+        for event_placement in (
+            event_placement_4,
+            event_placement_3,
+            event_placement_2,
+            event_placement_1,
+            event_placement_0,
+        ):
+            timeline.register(event_placement)
+
+        conflict_iterator = timeline.find_conflicts()
+        # Changes after the call don't affect the result.
+        timeline.unregister(event_placement_2)
+        self.assertEqual(
+            [(c.left, c.right) for c in conflict_iterator],
+            [
+                (event_placement_0, event_placement_2),
+                (event_placement_0, event_placement_3),
+                (event_placement_2, event_placement_3),
+            ],
+        )
+        timeline.register(event_placement_2)
+        event_placement_tuple = timeline.event_placement_tuple
+
+        self.assertEqual(len(list(timeline.find_conflicts(lambda ep0, ep1: True))), 4)
+        self.assertEqual(list(timeline.find_conflicts(lambda ep0, ep1: False)), [])
+        # Nothing is changed (not even the order of placements).
+        self.assertEqual(timeline.event_placement_tuple, event_placement_tuple)
+
+        # The same conflicts are found as by 'conflicts'.
+        timeline_tracked = timeline_interfaces.TimeLine(
+            timeline.event_placement_tuple, track_conflicts=True
+        )
+        self.assertEqual(
+            {(id(c.left), id(c.right)) for c in timeline_tracked.find_conflicts()},
+            {(id(c.left), id(c.right)) for c in timeline_tracked.conflicts},
+        )
+
+        # Empty placements can be tracked too.
+        timeline_tracked = timeline_interfaces.TimeLine(
+            [event_placement_3, event_placement_3.copy()], track_conflicts=True
+        )
+        self.assertEqual(len(timeline_tracked.conflicts), 1)
+        self.assertEqual(len(list(timeline_tracked.find_conflicts())), 1)
+
+    def test_get_overlap_cluster_tuple(self):
+        event_placement_0 = timeline_interfaces.EventPlacement(self.event, 0, 1)
+        event_placement_1 = timeline_interfaces.EventPlacement(
+            self.event, 0.5, ranges.Range(1.5, 3)
+        )
+        event_placement_2 = timeline_interfaces.EventPlacement(self.event, 2, 4)
+        # Different tag: overlapping, but independent
+        event_placement_3 = timeline_interfaces.EventPlacement(
+            self.event.copy().set_parameter("tag", "d"), 0.3, 0.5
+        )
+        event_placement_4 = timeline_interfaces.EventPlacement(self.event, 4, 5)
+        for event_placement in (
+            event_placement_0,
+            event_placement_1,
+            event_placement_2,
+            event_placement_3,
+            event_placement_4,
+        ):
+            self.timeline_dynamic.register(event_placement)
+        self.assertEqual(
+            self.timeline_dynamic.get_overlap_cluster_tuple(),
+            (
+                (event_placement_0, event_placement_1, event_placement_2),
+                (event_placement_3,),
+                (event_placement_4,),
+            ),
+        )
+
+    def test_resolve_conflicts_with_executor(self):
+        def make_timeline():
+            event_d = self.event.copy().set_parameter("tag", "d")
+            return timeline_interfaces.TimeLine(
+                [
+                    timeline_interfaces.EventPlacement(self.event, 0, 1),
+                    timeline_interfaces.EventPlacement(self.event, 0.5, 1.5),
+                    timeline_interfaces.EventPlacement(self.event, 1, 2),
+                    timeline_interfaces.EventPlacement(event_d, 0.3, 0.5),
+                    timeline_interfaces.EventPlacement(event_d, 0.4, 3),
+                    timeline_interfaces.EventPlacement(
+                        event_d, ranges.Range(2.5, 4), 5
+                    ),
+                ]
+            )
+
+        strategy_tuple = (
+            timeline_interfaces.ShiftWithinRangeStrategy(),
+            timeline_interfaces.AlwaysLeftStrategy(),
+        )
+        expected_timeline = make_timeline()
+        expected_timeline.resolve_conflicts(strategy_tuple)
+        expected_time_list = [
+            (ep.tag_tuple, ep.start_or_start_range, ep.end_or_end_range)
+            for ep in expected_timeline.event_placement_tuple
+        ]
+        self.assertEqual(len(expected_time_list), 4)
+        for executor_class in (
+            concurrent.futures.ThreadPoolExecutor,
+            concurrent.futures.ProcessPoolExecutor,
+        ):
+            with self.subTest(executor_class=executor_class):
+                timeline = make_timeline()
+                event_placement_tuple = timeline.event_placement_tuple
+                with executor_class(max_workers=2) as executor:
+                    timeline.resolve_conflicts(strategy_tuple, executor=executor)
+                self.assertEqual(
+                    [
+                        (ep.tag_tuple, ep.start_or_start_range, ep.end_or_end_range)
+                        for ep in timeline.event_placement_tuple
+                    ],
+                    expected_time_list,
+                )
+                # The original placements are kept (and moved).
+                self.assertTrue(
+                    all(
+                        ep in event_placement_tuple
+                        for ep in timeline.event_placement_tuple
+                    )
+                )
+
+    def test_resolve_conflicts_with_executor_and_shift(self):
+        # Shifted placements may overlap with placements of other clusters.
+        for executor_class in (
+            concurrent.futures.ThreadPoolExecutor,
+            concurrent.futures.ProcessPoolExecutor,
+        ):
+            with self.subTest(executor_class=executor_class):
+                timeline = timeline_interfaces.TimeLine(
+                    [
+                        timeline_interfaces.EventPlacement(self.event, 0, 2),
+                        timeline_interfaces.EventPlacement(self.event, 1, 3),
+                        timeline_interfaces.EventPlacement(self.event, 3, 4),
+                    ]
+                )
+                with executor_class(max_workers=2) as executor:
+                    timeline.resolve_conflicts(
+                        [timeline_interfaces.ShiftLaterStrategy()], executor=executor
+                    )
+                self.assertEqual(
+                    sorted(
+                        (ep.start_or_start_range, ep.end_or_end_range)
+                        for ep in timeline.event_placement_tuple
+                    ),
+                    [(0, 2), (2, 4), (4, 5)],
+                )
+                self.assertFalse(tuple(timeline.find_conflicts()))
+
+    def test_resolve_conflicts_with_executor_unresolved(self):
+        event_placement_0 = timeline_interfaces.EventPlacement(self.event, 0, 1)
+        event_placement_1 = timeline_interfaces.EventPlacement(self.event, 0.5, 1.5)
+        self.timeline_dynamic.register(event_placement_0)
+        self.timeline_dynamic.register(event_placement_1)
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            self.assertRaises(
+                timeline_utilities.UnresolvedConflict,
+                self.timeline_dynamic.resolve_conflicts,
+                [timeline_interfaces.TagCountStrategy()],
+                executor=executor,
+            )
+        self.assertEqual(
+            self.timeline_dynamic.event_placement_tuple,
+            (event_placement_0, event_placement_1),
+        )
+
+    def test_find_free_slot(self):
+        def find(*args, timeline=self.timeline_dynamic, **kwargs):
+            slot = timeline.find_free_slot(*args, **kwargs)
+            return None if slot is None else (float(slot.start), float(slot.end))
+
+        event_d = self.event.copy().set_parameter("tag", "d")
+        event_placement_0 = timeline_interfaces.EventPlacement(self.event, 0, 2)
+        event_placement_1 = timeline_interfaces.EventPlacement(
+            self.event, ranges.Range(3, 3.5), 4
+        )
+        event_placement_2 = timeline_interfaces.EventPlacement(event_d, 2, 3.5)
+        for timeline in self.timeline_tuple:
+            for event_placement in (
+                event_placement_0,
+                event_placement_1,
+                event_placement_2,
+            ):
+                timeline.register(event_placement)
+
+        self.assertEqual(find(self.tag, 1), (2, 3))
+        self.assertEqual(find(self.tag, 1.5), (4, 5.5))
+        self.assertEqual(find(self.tag, 1, after=2.5), (4, 5))
+        self.assertEqual(find(self.tag, 1.5, before=5), None)
+        self.assertEqual(find("d", 2), (0, 2))
+        self.assertEqual(find("e", 2, after=1), (1, 3))
+        self.assertEqual(find((self.tag, "d"), 0.5), (4, 4.5))
+        self.assertEqual(find(self.tag, 6, timeline=self.timeline_static), (4, 10))
+        self.assertEqual(find(self.tag, 7, timeline=self.timeline_static), None)
+
+        # The index is updated when the time line changes.
+        event_placement_1.move_by(1)
+        self.assertEqual(find(self.tag, 1.5), (2, 3.5))
+        self.timeline_dynamic.unregister(event_placement_0)
+        self.assertEqual(find(self.tag, 4), (0, 4))
+        self.timeline_dynamic.register(event_placement_0)
+        self.assertEqual(find(self.tag, 4), (5, 9))
+
+        # Snapshots have their own index.
+        snapshot = self.timeline_dynamic.snapshot()
+        self.timeline_dynamic.unregister(event_placement_0)
+        self.assertEqual(find(self.tag, 4), (0, 4))
+        self.assertEqual(find(self.tag, 4, timeline=snapshot), (5, 9))
+
+    def test_iter_free_slots(self):
+        def get_slot_list(*args, timeline=self.timeline_static, **kwargs):
+            return [
+                (float(slot.start), float(slot.end))
+                for slot in timeline.iter_free_slots(*args, **kwargs)
+            ]
+
+        event_d = self.event.copy().set_parameter("tag", "d")
+        for timeline in self.timeline_tuple:
+            for event, start, end in (
+                (self.event, 1, 2),
+                (self.event, 2, 3),
+                (event_d, 2.5, 4),
+                (self.event, 5, 6),
+            ):
+                timeline.register(timeline_interfaces.EventPlacement(event, start, end))
+
+        self.assertEqual(get_slot_list(self.tag), [(0, 1), (3, 5), (6, 10)])
+        self.assertEqual(get_slot_list((self.tag, "d")), [(0, 1), (4, 5), (6, 10)])
+        self.assertEqual(get_slot_list(self.tag, after=4, before=8), [(4, 5), (6, 8)])
+        self.assertEqual(
+            get_slot_list("d", timeline=self.timeline_dynamic), [(0, 2.5), (4, 6)]
+        )
+        self.assertEqual(
+            get_slot_list(self.tag, timeline=self.timeline_dynamic), [(0, 1), (3, 5)]
+        )
+
+    def test_deduplicate_events(self):
+        event_d = self.event.copy().set_parameter("tag", "d")
+        event_placement_list = [
+            timeline_interfaces.EventPlacement(event, start, start + 1)
+            for start, event in enumerate(
+                (self.event, self.event.copy(), self.event.copy(), event_d, event_d)
+            )
+        ]
+        for event_placement in event_placement_list:
+            self.timeline_dynamic.register(event_placement)
+        version = self.timeline_dynamic.version
+
+        report = self.timeline_dynamic.deduplicate_events()
+        self.assertEqual(report.event_count, 4)
+        self.assertEqual(report.unique_event_count, 2)
+        self.assertEqual(report.dropped_event_count, 2)
+        self.assertGreater(report.saved_byte_count, 0)
+        self.assertTrue(all(ep.is_event_shared for ep in event_placement_list))
+        self.assertTrue(all(ep.event is self.event for ep in event_placement_list[:3]))
+        self.assertTrue(all(ep.event is event_d for ep in event_placement_list[3:]))
+        # Only the two replaced events are recorded as changes.
+        self.assertEqual(self.timeline_dynamic.version, version + 2)
+
+        report = self.timeline_dynamic.deduplicate_events()
+        self.assertEqual((report.event_count, report.unique_event_count), (2, 2))
+        self.assertEqual(report.saved_byte_count, 0)
+
+    def test_deduplicate_events_caches_digests(self):
+        event_placement_list = [
+            timeline_interfaces.EventPlacement(self.event.copy(), start, start + 1)
+            for start in range(3)
+        ]
+        for event_placement in event_placement_list:
+            self.timeline_dynamic.register(event_placement)
+        self.timeline_dynamic.deduplicate_events()
+
+        # Unchanged events aren't serialised again.
+        with unittest.mock.patch.object(pickle, "dumps", wraps=pickle.dumps) as dumps:
+            self.timeline_dynamic.deduplicate_events()
+            self.timeline_dynamic.memory_report()
+            self.assertEqual(dumps.call_count, 0)
+
+            # ... but events which may have been changed are.
+            event_placement_list[0].get_mutable_event()[0].duration = 2
+            dumps.reset_mock()
+            report = self.timeline_dynamic.deduplicate_events()
+            self.assertEqual(dumps.call_count, 1)
+        self.assertEqual((report.event_count, report.unique_event_count), (2, 2))
+
+    def test_memory_report(self):
+        report = self.timeline_dynamic.memory_report()
+        self.assertEqual(report.event_byte_count, 0)
+        self.assertEqual(report.tag_to_event_byte_count, {})
+
+        event_d = self.event.copy().set_parameter("tag", "d")
+        for event_placement in (
+            timeline_interfaces.EventPlacement(self.event, 0, 1),
+            timeline_interfaces.EventPlacement(self.event, 1, 2),
+            timeline_interfaces.EventPlacement(self.event.copy(), 2, 3),
+            timeline_interfaces.EventPlacement(event_d, ranges.Range(3, 4), 5),
+        ):
+            self.timeline_dynamic.register(event_placement)
+        report = self.timeline_dynamic.memory_report()
+
+        self.assertGreater(report.event_placement_byte_count, 0)
+        self.assertGreater(report.bound_byte_count, 0)
+        self.assertGreater(report.range_byte_count, 0)
+        self.assertEqual(set(report.tag_to_event_byte_count), {self.tag, "d"})
+        self.assertLess(
+            sum(report.tag_to_event_byte_count.values()), report.event_byte_count
+        )
+        # One event is shared and its copy is a duplicate.
+        self.assertGreater(report.shared_event_byte_count, 0)
+        self.assertGreater(report.duplicated_event_byte_count, 0)
+        self.assertEqual(
+            report.byte_count,
+            report.container_byte_count
+            + report.event_placement_byte_count
+            + report.bound_byte_count
+            + report.range_byte_count
+            + report.event_byte_count
+            + report.change_journal_byte_count,
+        )
+
+        # Shared events are only counted once.
+        self.timeline_dynamic.deduplicate_events()
+        self.assertLess(
+            self.timeline_dynamic.memory_report().event_byte_count,
+            report.event_byte_count,
+        )
+
+    def test_unique(self):
+        event_placement_0 = timeline_interfaces.EventPlacement(self.event, 0, 1)
+        event_placement_1 = timeline_interfaces.EventPlacement(self.event, 1, 2)
+        timeline = timeline_interfaces.TimeLine(
+            [event_placement_0, event_placement_1], unique=True
+        )
+        self.assertRaises(
+            timeline_utilities.DuplicateEventPlacementError,
+            timeline.register,
+            event_placement_0.copy(),
+        )
+        self.assertRaises(
+            timeline_utilities.DuplicateEventPlacementError,
+            timeline_interfaces.TimeLine,
+            [event_placement_0, event_placement_0.copy()],
+            unique=True,
+        )
+        # After moving or unregistering a placement, an equal copy of its
+        # previous state can be registered.
+        event_placement_copy = event_placement_1.copy()
+        event_placement_1.move_by(1)
+        timeline.register(event_placement_copy)
+        timeline.unregister(event_placement_0)
+        timeline.register(event_placement_0.copy())
+        self.assertEqual(len(timeline.event_placement_tuple), 3)
+        # Snapshots are unique, too.
+        self.assertRaises(
+            timeline_utilities.DuplicateEventPlacementError,
+            timeline.snapshot().register,
+            event_placement_copy.copy(),
+        )
+        # By default duplicates are allowed.
+        self.timeline_dynamic.register(event_placement_0)
+        self.timeline_dynamic.register(event_placement_0.copy())
+
+    def test_merge(self):
+        event_d = self.event.copy().set_parameter("tag", "d")
+        event_placement_0 = timeline_interfaces.EventPlacement(self.event, 0, 1)
+        event_placement_1 = timeline_interfaces.EventPlacement(self.event, 2, 3)
+        event_placement_2 = timeline_interfaces.EventPlacement(event_d, 0, 1)
+        event_placement_3 = timeline_interfaces.EventPlacement(
+            event_d, ranges.Range(0.5, 1), 2
+        )
+        # Unsorted input
+        timeline_0 = timeline_interfaces.TimeLine(
+            [event_placement_1, event_placement_0]
+        )
+        timeline_1 = timeline_interfaces.TimeLine(
+            [event_placement_2, event_placement_3]
+        )
+        timeline = timeline_interfaces.TimeLine.merge(
+            timeline_0, timeline_1, track_conflicts=True
+        )
+        expected_event_placement_tuple = (
+            event_placement_0,
+            event_placement_2,
+            event_placement_3,
+            event_placement_1,
+        )
+        self.assertEqual(len(timeline.event_placement_tuple), 4)
+        self.assertTrue(
+            all(
+                event_placement is expected_event_placement
+                for event_placement, expected_event_placement in zip(
+                    timeline.event_placement_tuple, expected_event_placement_tuple
+                )
+            )
+        )
+        self.assertEqual(len(timeline.conflicts), 1)
+        self.assertEqual(timeline.duration, 3)
+        # Input time lines don't change
+        self.assertEqual(
+            timeline_0.event_placement_tuple, (event_placement_1, event_placement_0)
+        )
+        self.assertEqual(
+            timeline_interfaces.TimeLine.merge(timeline_0, duration=10).duration, 10
+        )
+        self.assertIsInstance(
+            timeline_interfaces.ConcurrentTimeLine.merge(timeline_0),
+            timeline_interfaces.ConcurrentTimeLine,
+        )
+
+    def test_split_at(self):
+        event = core_events.Concurrence(
+            [
+                core_events.Consecution(
+                    [core_events.Chronon(1), core_events.Chronon(2)], tag=self.tag
+                )
+            ]
+        )
+        for start, end in ((0, 3), (ranges.Range(3.5, 4), 5), (6, 8)):
+            self.timeline_static.register(
+                timeline_interfaces.EventPlacement(event, start, end)
+            )
+
+        def get_time_list(segment):
+            return [
+                (float(ep.min_start), float(ep.max_end))
+                for ep in segment.event_placement_tuple
+            ]
+
+        # Each segment is exactly as long as the span between its split
+        # times, even if placements cross them.
+        segment_tuple = self.timeline_static.split_at(4, 2)
+        self.assertEqual(
+            [float(segment.duration) for segment in segment_tuple], [2, 2, 6]
+        )
+        self.assertEqual(
+            [get_time_list(segment) for segment in segment_tuple],
+            [[(0, 3)], [(1.5, 3)], [(2, 4)]],
+        )
+
+        segment_tuple = self.timeline_static.split_at(2, 7, policy="duplicate")
+        self.assertEqual(
+            [float(segment.duration) for segment in segment_tuple], [2, 5, 3]
+        )
+        self.assertEqual(
+            [get_time_list(segment) for segment in segment_tuple],
+            [[(0, 3)], [(-2, 1), (1.5, 3), (4, 6)], [(-1, 1)]],
+        )
+
+        segment_tuple = self.timeline_static.split_at(2, 7, policy="clip")
+        self.assertEqual(
+            [float(segment.duration) for segment in segment_tuple], [2, 5, 3]
+        )
+        self.assertEqual(
+            [get_time_list(segment) for segment in segment_tuple],
+            [[(0, 2)], [(0, 1), (1.5, 3), (4, 5)], [(0, 1)]],
+        )
+        # The events are cut at the same relative positions.
+        self.assertEqual(
+            [
+                [float(e.duration) for e in ep.event[0]]
+                for segment in segment_tuple
+                for ep in segment.event_placement_tuple
+            ],
+            [[1, 1], [1], [1, 2], [1, 0.5], [1.5]],
+        )
+        # The original time line doesn't change.
+        self.assertEqual(
+            get_time_list(self.timeline_static), [(0, 3), (3.5, 5), (6, 8)]
+        )
+
+    def test_split_at_error(self):
+        self.timeline_static.register(
+            timeline_interfaces.EventPlacement(self.event, ranges.Range(1, 2), 3)
+        )
+        self.assertRaises(ValueError, self.timeline_static.split_at, 0)
+        self.assertRaises(ValueError, self.timeline_static.split_at, 10)
+        self.assertRaises(
+            ValueError, self.timeline_static.split_at, 5, policy="unknown"
+        )
+        self.assertRaises(ValueError, self.timeline_static.split_at, 2.5, policy="clip")
+
+    def _register_for_analytics(self):
+        event_d = self.event.copy().set_parameter("tag", "d")
+        for event, start, end in (
+            (self.event, 0, 2),
+            (self.event, ranges.Range(1, 1.5), 3),
+            (self.event, 2, 4),
+            (event_d, 3, 4),
+            (self.event, 6, 7),
+        ):
+            for timeline in self.timeline_tuple:
+                timeline.register(timeline_interfaces.EventPlacement(event, start, end))
+
+    def test_get_max_polyphony(self):
+        self.assertEqual(self.timeline_dynamic.get_max_polyphony(), 0)
+        self._register_for_analytics()
+        self.assertEqual(self.timeline_dynamic.get_max_polyphony(self.tag), 2)
+        self.assertEqual(self.timeline_dynamic.get_max_polyphony("d"), 1)
+        self.assertEqual(self.timeline_dynamic.get_max_polyphony("e"), 0)
+        self.assertEqual(self.timeline_dynamic.get_max_polyphony(), 2)
+
+    def test_get_occupancy_ratio(self):
+        self.assertEqual(self.timeline_dynamic.get_occupancy_ratio(), 0)
+        self._register_for_analytics()
+        self.assertAlmostEqual(
+            self.timeline_dynamic.get_occupancy_ratio(self.tag), 5 / 7
+        )
+        self.assertAlmostEqual(self.timeline_static.get_occupancy_ratio("d"), 0.1)
+        self.assertAlmostEqual(self.timeline_static.get_occupancy_ratio(), 0.5)
+
+    def test_get_density_tuple(self):
+        self._register_for_analytics()
+        self.assertEqual(
+            self.timeline_static.get_density_tuple(5, self.tag),
+            (1.5, 1.5, 0, 0.5, 0),
+        )
+        self.assertEqual(
+            self.timeline_dynamic.get_density_tuple(7),
+            (1, 2, 2, 2, 0, 0, 1),
+        )
+        self.assertEqual(self.timeline_dynamic.get_density_tuple(1), (8 / 7,))
+        self.assertRaises(ValueError, self.timeline_dynamic.get_density_tuple, 0)
+
+    def test_analytics_are_clipped_to_time_line(self):
+        # E.g. segments of 'split_at' may contain placements which start
+        # before 0.
+        timeline = timeline_interfaces.TimeLine(
+            [
+                timeline_interfaces.EventPlacement(self.event, -2, 1),
+                timeline_interfaces.EventPlacement(self.event, -3, -1),
+                timeline_interfaces.EventPlacement(self.event, 0, 2),
+            ]
+        )
+        self.assertEqual(timeline.get_max_polyphony(), 2)
+        self.assertEqual(timeline.get_occupancy_ratio(), 1)
+        self.assertEqual(timeline.get_density_tuple(2), (2, 1))
+
+
+class ConflictRuleSetTest(unittest.TestCase):
+    def setUp(self):
+        def make_event_placement(tag_tuple, start, end):
+            return timeline_interfaces.EventPlacement(
+                core_events.Concurrence(
+                    [core_events.Chronon(1, tag=tag) for tag in tag_tuple]
+                ),
+                start,
+                end,
+            )
+
+        self.piano_0 = make_event_placement(("piano",), 0, 2)
+        self.piano_1 = make_event_placement(("piano",), 1, 3)
+        self.piano_2 = make_event_placement(("piano",), 1.5, 2.5)
+        self.flute = make_event_placement(("flute",), 0, 1)
+        self.piccolo = make_event_placement(("piccolo",), 0.5, 1.5)
+        self.flute_and_piccolo = make_event_placement(("flute", "piccolo"), 4, 5)
+        self.timeline = timeline_interfaces.TimeLine(
+            [
+                self.piano_0,
+                self.piano_1,
+                self.piano_2,
+                self.flute,
+                self.piccolo,
+                self.flute_and_piccolo,
+            ]
+        )
+        self.rule_set = timeline_interfaces.ConflictRuleSet(
+            {"piano": 2}, [("flute", "piccolo")]
+        )
+
+    def test_init_error(self):
+        self.assertRaises(ValueError, timeline_interfaces.ConflictRuleSet, {"piano": 0})
+
+    def test_get_capacity(self):
+        self.assertEqual(self.rule_set.get_capacity("piano"), 2)
+        self.assertEqual(self.rule_set.get_capacity("flute"), 1)
+
+    def test_find_conflicts(self):
+        # By default each tag can only be used once.
+        self.assertEqual(
+            len(list(timeline_interfaces.TimeLine().find_conflicts(self.rule_set))),
+            0,
+        )
+        self.assertEqual(
+            [
+                (c.left, c.right)
+                for c in self.timeline.find_conflicts(
+                    timeline_interfaces.ConflictRuleSet()
+                )
+            ],
+            [
+                (self.piano_0, self.piano_1),
+                (self.piano_0, self.piano_2),
+                (self.piano_1, self.piano_2),
+            ],
+        )
+        self.assertEqual(
+            [(c.left, c.right) for c in self.timeline.find_conflicts(self.rule_set)],
+            [
+                (self.flute, self.piccolo),
+                (self.piano_0, self.piano_2),
+                (self.piano_1, self.piano_2),
+            ],
+        )
+
+    def test_resolve_conflicts(self):
+        expected_event_placement_tuple = (
+            self.flute,
+            self.piano_0,
+            self.piano_1,
+            self.flute_and_piccolo,
+        )
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            for kwargs in ({}, {"executor": executor}):
+                with self.subTest(kwargs=kwargs):
+                    timeline = timeline_interfaces.TimeLine(
+                        [ep.copy() for ep in self.timeline.event_placement_tuple]
+                    )
+                    timeline.resolve_conflicts(is_conflict=self.rule_set, **kwargs)
+                    self.assertEqual(
+                        timeline.event_placement_tuple, expected_event_placement_tuple
+                    )
+
 
 class AlwaysLeftStrategyTest(unittest.TestCase):
     def test(self):
@@ -409,3 +1604,396 @@ class TagCountStrategyTest(unittest.TestCase):
         )
         self.assertTrue(event_placement_0 in timeline.event_placement_tuple)
         self.assertTrue(event_placement_1 not in timeline.event_placement_tuple)
+
+
+class WeightedIntervalSchedulingStrategyTest(unittest.TestCase):
+    def setUp(self):
+        self.event = core_events.Concurrence([core_events.Chronon(1, tag="test")])
+
+    def test_longest(self):
+        event_placement_0 = timeline_interfaces.EventPlacement(self.event, 0, 3)
+        event_placement_1 = timeline_interfaces.EventPlacement(self.event, 2, 4)
+        event_placement_2 = timeline_interfaces.EventPlacement(self.event, 3, 6)
+        event_placement_3 = timeline_interfaces.EventPlacement(self.event, 5, 5.5)
+        timeline = timeline_interfaces.TimeLine(
+            [event_placement_0, event_placement_1, event_placement_2, event_placement_3]
+        )
+        timeline.resolve_conflicts(
+            [timeline_interfaces.WeightedIntervalSchedulingStrategy()]
+        )
+        self.assertEqual(
+            timeline.event_placement_tuple, (event_placement_0, event_placement_2)
+        )
+
+    def test_weight(self):
+        event_placement_0 = timeline_interfaces.EventPlacement(self.event, 0, 10)
+        event_placement_1 = timeline_interfaces.EventPlacement(self.event, 0, 4)
+        event_placement_2 = timeline_interfaces.EventPlacement(self.event, 5, 9)
+
+        timeline = timeline_interfaces.TimeLine(
+            [event_placement_0, event_placement_1, event_placement_2]
+        )
+        timeline.resolve_conflicts(
+            [timeline_interfaces.WeightedIntervalSchedulingStrategy()]
+        )
+        self.assertEqual(timeline.event_placement_tuple, (event_placement_0,))
+
+        timeline = timeline_interfaces.TimeLine(
+            [event_placement_0, event_placement_1, event_placement_2]
+        )
+        timeline.resolve_conflicts(
+            [timeline_interfaces.WeightedIntervalSchedulingStrategy(lambda _: 1)]
+        )
+        self.assertEqual(
+            timeline.event_placement_tuple, (event_placement_1, event_placement_2)
+        )
+
+    def test_multiple_tags(self):
+        event_ab = core_events.Concurrence(
+            [core_events.Chronon(1, tag="a"), core_events.Chronon(1, tag="b")]
+        )
+        event_a = core_events.Concurrence([core_events.Chronon(1, tag="a")])
+        event_b = core_events.Concurrence([core_events.Chronon(1, tag="b")])
+        event_placement_0 = timeline_interfaces.EventPlacement(event_ab, 0, 2)
+        event_placement_1 = timeline_interfaces.EventPlacement(event_a, 1, 5)
+        event_placement_2 = timeline_interfaces.EventPlacement(event_b, 1, 3)
+        timeline = timeline_interfaces.TimeLine(
+            [event_placement_0, event_placement_1, event_placement_2]
+        )
+        timeline.resolve_conflicts(
+            [timeline_interfaces.WeightedIntervalSchedulingStrategy()]
+        )
+        # 'event_placement_0' is dropped for tag 'a', therefore
+        # 'event_placement_2' doesn't have a conflict anymore.
+        self.assertEqual(
+            timeline.event_placement_tuple, (event_placement_2, event_placement_1)
+        )
+
+    def test_rule_set(self):
+        event_placement_0 = timeline_interfaces.EventPlacement(self.event, 0, 4)
+        event_placement_1 = timeline_interfaces.EventPlacement(self.event, 1, 3)
+        event_placement_2 = timeline_interfaces.EventPlacement(self.event, 2, 6)
+        event_placement_3 = timeline_interfaces.EventPlacement(self.event, 4, 5)
+        timeline = timeline_interfaces.TimeLine(
+            [event_placement_0, event_placement_1, event_placement_2, event_placement_3]
+        )
+        rule_set = timeline_interfaces.ConflictRuleSet({"test": 2})
+        timeline.resolve_conflicts(
+            [timeline_interfaces.WeightedIntervalSchedulingStrategy()], rule_set
+        )
+        # Two placements may sound at the same time: the longest solution
+        # only drops the shortest of the three overlapping placements.
+        self.assertEqual(
+            timeline.event_placement_tuple,
+            (event_placement_0, event_placement_2, event_placement_3),
+        )
+        self.assertFalse(tuple(timeline.find_conflicts(rule_set)))
+
+        # Groups are mutually exclusive.
+        event_flute = core_events.Concurrence([core_events.Chronon(1, tag="flute")])
+        event_piccolo = core_events.Concurrence([core_events.Chronon(1, tag="piccolo")])
+        event_placement_0 = timeline_interfaces.EventPlacement(event_flute, 0, 2)
+        event_placement_1 = timeline_interfaces.EventPlacement(event_piccolo, 1, 4)
+        timeline = timeline_interfaces.TimeLine([event_placement_0, event_placement_1])
+        timeline.resolve_conflicts(
+            [timeline_interfaces.WeightedIntervalSchedulingStrategy()],
+            timeline_interfaces.ConflictRuleSet(
+                tag_group_sequence=[("flute", "piccolo")]
+            ),
+        )
+        self.assertEqual(timeline.event_placement_tuple, (event_placement_1,))
+
+    def test_rule_set_groups_first(self):
+        # Groups are processed before their tags: otherwise the capacity
+        # of 'b' would keep placements which the group drops again.
+        timeline = timeline_interfaces.TimeLine(
+            [
+                timeline_interfaces.EventPlacement(
+                    core_events.Concurrence([core_events.Chronon(1, tag=tag)]),
+                    start,
+                    end,
+                )
+                for tag, start, end in (
+                    ("b", 8, 12),
+                    ("b", 2, 5),
+                    ("b", 1, 2),
+                    ("c", 7, 11),
+                    ("c", 5, 8),
+                    ("a", 5, 8),
+                )
+            ]
+        )
+        rule_set = timeline_interfaces.ConflictRuleSet({"a": 2}, [("b", "c")])
+        timeline.resolve_conflicts(
+            [timeline_interfaces.WeightedIntervalSchedulingStrategy()], rule_set
+        )
+        self.assertEqual(
+            sum(float(ep.duration) for ep in timeline.event_placement_tuple), 14
+        )
+        self.assertFalse(tuple(timeline.find_conflicts(rule_set)))
+
+
+class ShiftWithinRangeStrategyTest(unittest.TestCase):
+    def setUp(self):
+        self.event = core_events.Concurrence([core_events.Chronon(1, tag="test")])
+
+    def test_shift(self):
+        event_placement_0 = timeline_interfaces.EventPlacement(
+            self.event, 0, ranges.Range(1, 2)
+        )
+        event_placement_1 = timeline_interfaces.EventPlacement(
+            self.event, ranges.Range(0.5, 1.5), 3
+        )
+        # Not overlapping with the others: this one keeps its ranges.
+        event_placement_2 = timeline_interfaces.EventPlacement(
+            self.event, ranges.Range(3, 4), 5
+        )
+        timeline = timeline_interfaces.TimeLine(
+            [event_placement_0, event_placement_1, event_placement_2]
+        )
+        timeline.resolve_conflicts([timeline_interfaces.ShiftWithinRangeStrategy()])
+        self.assertEqual(len(timeline.event_placement_tuple), 3)
+        self.assertEqual(event_placement_0.start_or_start_range, 0)
+        self.assertEqual(event_placement_0.end_or_end_range, 1)
+        self.assertEqual(event_placement_1.start_or_start_range, 1)
+        self.assertEqual(event_placement_1.end_or_end_range, 3)
+        self.assertEqual(
+            event_placement_2.start_or_start_range,
+            ranges.Range(
+                core_parameters.DirectDuration(3), core_parameters.DirectDuration(4)
+            ),
+        )
+
+        # The start is pushed after the minimal end, but the
+        # placement keeps its minimal duration.
+        event_placement_0 = timeline_interfaces.EventPlacement(self.event, 0, 2)
+        event_placement_1 = timeline_interfaces.EventPlacement(
+            self.event, ranges.Range(0, 3), ranges.Range(1, 5)
+        )
+        timeline = timeline_interfaces.TimeLine([event_placement_0, event_placement_1])
+        timeline.resolve_conflicts([timeline_interfaces.ShiftWithinRangeStrategy()])
+        self.assertEqual(len(timeline.event_placement_tuple), 2)
+        self.assertEqual(event_placement_1.start_or_start_range, 2)
+        self.assertEqual(event_placement_1.end_or_end_range, 3)
+
+    def test_fall_through(self):
+        event_placement_0 = timeline_interfaces.EventPlacement(self.event, 0, 2)
+        event_placement_1 = timeline_interfaces.EventPlacement(
+            self.event, ranges.Range(0.5, 1.5), 3
+        )
+        timeline = timeline_interfaces.TimeLine([event_placement_0, event_placement_1])
+        self.assertRaises(
+            timeline_utilities.UnresolvedConflict,
+            timeline.resolve_conflicts,
+            [timeline_interfaces.ShiftWithinRangeStrategy()],
+        )
+        timeline.resolve_conflicts(
+            [
+                timeline_interfaces.ShiftWithinRangeStrategy(),
+                timeline_interfaces.AlwaysLeftStrategy(),
+            ]
+        )
+        self.assertEqual(timeline.event_placement_tuple, (event_placement_0,))
+        self.assertEqual(event_placement_0.end_or_end_range, 2)
+
+    def test_rule_set(self):
+        event_placement_0 = timeline_interfaces.EventPlacement(self.event, 0, 2)
+        event_placement_1 = timeline_interfaces.EventPlacement(self.event, 0, 2)
+        event_placement_2 = timeline_interfaces.EventPlacement(
+            self.event, ranges.Range(1, 3), ranges.Range(3, 5)
+        )
+        timeline = timeline_interfaces.TimeLine(
+            [event_placement_0, event_placement_1, event_placement_2]
+        )
+        rule_set = timeline_interfaces.ConflictRuleSet({"test": 2})
+        timeline.resolve_conflicts(
+            [timeline_interfaces.ShiftWithinRangeStrategy()], rule_set
+        )
+        # Two placements may sound at the same time: only the third one
+        # needs to wait.
+        self.assertEqual(len(timeline.event_placement_tuple), 3)
+        self.assertEqual(event_placement_0.start_or_start_range, 0)
+        self.assertEqual(event_placement_1.start_or_start_range, 0)
+        self.assertEqual(event_placement_2.start_or_start_range, 2)
+        self.assertEqual(event_placement_2.end_or_end_range, 4)
+        self.assertFalse(tuple(timeline.find_conflicts(rule_set)))
+
+        # Groups are mutually exclusive.
+        event_placement_0 = timeline_interfaces.EventPlacement(
+            core_events.Concurrence([core_events.Chronon(1, tag="flute")]), 0, 2
+        )
+        event_placement_1 = timeline_interfaces.EventPlacement(
+            core_events.Concurrence([core_events.Chronon(1, tag="piccolo")]),
+            ranges.Range(1, 3),
+            ranges.Range(3, 5),
+        )
+        timeline = timeline_interfaces.TimeLine([event_placement_0, event_placement_1])
+        rule_set = timeline_interfaces.ConflictRuleSet(
+            tag_group_sequence=[("flute", "piccolo")]
+        )
+        timeline.resolve_conflicts(
+            [timeline_interfaces.ShiftWithinRangeStrategy()], rule_set
+        )
+        self.assertEqual(event_placement_1.start_or_start_range, 2)
+        self.assertEqual(event_placement_1.end_or_end_range, 4)
+        self.assertFalse(tuple(timeline.find_conflicts(rule_set)))
+
+
+class ShiftLaterStrategyTest(unittest.TestCase):
+    def setUp(self):
+        self.event_a = core_events.Concurrence([core_events.Chronon(1, tag="a")])
+        self.event_b = core_events.Concurrence([core_events.Chronon(1, tag="b")])
+
+    def _make_timeline(self):
+        return timeline_interfaces.TimeLine(
+            [
+                timeline_interfaces.EventPlacement(self.event_a, 0, 2),
+                timeline_interfaces.EventPlacement(
+                    self.event_a, 1, ranges.Range(2, 2.5)
+                ),
+                timeline_interfaces.EventPlacement(self.event_a, 4, 5),
+                timeline_interfaces.EventPlacement(self.event_b, 1, 2),
+                timeline_interfaces.EventPlacement(self.event_b, 3, 4),
+            ]
+        )
+
+    def _get_start_and_end_list(self, timeline):
+        return [
+            (float(ep.min_start), float(ep.max_end))
+            for ep in timeline.event_placement_tuple
+        ]
+
+    def test_shift(self):
+        timeline = self._make_timeline()
+        timeline.resolve_conflicts([timeline_interfaces.ShiftLaterStrategy()])
+        # The following placement of the same tag is shifted too, but
+        # placements of other tags stay where they are.
+        self.assertEqual(
+            self._get_start_and_end_list(timeline),
+            [(0, 2), (1, 2), (2, 3.5), (3, 4), (5, 6)],
+        )
+        self.assertEqual(
+            timeline.event_placement_tuple[2].end_or_end_range,
+            ranges.Range(
+                core_parameters.DirectDuration(3), core_parameters.DirectDuration(3.5)
+            ),
+        )
+
+    def test_shift_aligned(self):
+        timeline = self._make_timeline()
+        timeline.resolve_conflicts([timeline_interfaces.ShiftLaterStrategy(True)])
+        self.assertEqual(
+            self._get_start_and_end_list(timeline),
+            [(0, 2), (1, 2), (2, 3.5), (4, 5), (5, 6)],
+        )
+
+    def test_fall_through(self):
+        event_placement_0 = timeline_interfaces.EventPlacement(self.event_a, 0, 2)
+        event_placement_1 = timeline_interfaces.EventPlacement(self.event_a, 1, 3)
+        timeline = timeline_interfaces.TimeLine(
+            [event_placement_0, event_placement_1], duration=3
+        )
+        self.assertRaises(
+            timeline_utilities.UnresolvedConflict,
+            timeline.resolve_conflicts,
+            [timeline_interfaces.ShiftLaterStrategy()],
+        )
+        self.assertEqual(event_placement_1.start_or_start_range, 1)
+        timeline.resolve_conflicts(
+            [
+                timeline_interfaces.ShiftLaterStrategy(),
+                timeline_interfaces.AlwaysLeftStrategy(),
+            ]
+        )
+        self.assertEqual(timeline.event_placement_tuple, (event_placement_0,))
+
+    def test_rule_set(self):
+        event_c = core_events.Concurrence([core_events.Chronon(1, tag="c")])
+        timeline = timeline_interfaces.TimeLine(
+            [
+                timeline_interfaces.EventPlacement(self.event_a, start, start + 3)
+                for start in (0, 1, 2)
+            ]
+            + [
+                timeline_interfaces.EventPlacement(self.event_b, 0, 2),
+                timeline_interfaces.EventPlacement(event_c, 1, 2),
+            ]
+        )
+        rule_set = timeline_interfaces.ConflictRuleSet({"a": 2}, [("b", "c")])
+        timeline.resolve_conflicts([timeline_interfaces.ShiftLaterStrategy()], rule_set)
+        # Only the third placement of tag 'a' needs to wait until the
+        # first one ends, and 'c' can't sound together with 'b'.
+        self.assertEqual(
+            sorted(self._get_start_and_end_list(timeline)),
+            [(0, 2), (0, 3), (1, 4), (2, 3), (3, 6)],
+        )
+        self.assertFalse(tuple(timeline.find_conflicts(rule_set)))
+
+
+class ConcurrentTimeLineTest(unittest.TestCase):
+    def test_register_from_multiple_threads(self):
+        tag_tuple = tuple(f"tag{i}" for i in range(8))
+        timeline = timeline_interfaces.ConcurrentTimeLine(stripe_count=4)
+
+        def produce(tag: str):
+            event = core_events.Concurrence([core_events.Chronon(1, tag=tag)])
+            for i in range(100):
+                timeline.register(timeline_interfaces.EventPlacement(event, i, i + 1))
+
+        thread_list = [threading.Thread(target=produce, args=(t,)) for t in tag_tuple]
+        for thread in thread_list:
+            thread.start()
+        for thread in thread_list:
+            thread.join()
+
+        event_placement_tuple = timeline.event_placement_tuple
+        self.assertEqual(len(event_placement_tuple), 800)
+        # As long as nothing changes, readers get the same snapshot.
+        self.assertIs(timeline.event_placement_tuple, event_placement_tuple)
+        self.assertEqual(timeline.tag_set, set(tag_tuple))
+        self.assertEqual(timeline.duration, 100)
+
+        timeline.unregister(event_placement_tuple[0])
+        self.assertEqual(len(timeline.event_placement_tuple), 799)
+
+    def test_private_helpers_merge(self):
+        # Inherited code which only uses private helpers sees all
+        # placements which were registered from other threads.
+        event = core_events.Concurrence([core_events.Chronon(1, tag="a")])
+        timeline = timeline_interfaces.ConcurrentTimeLine()
+        thread_list = [
+            threading.Thread(
+                target=timeline.register,
+                args=(timeline_interfaces.EventPlacement(event, i, i + 1),),
+            )
+            for i in range(4)
+        ]
+        for thread in thread_list:
+            thread.start()
+        for thread in thread_list:
+            thread.join()
+        self.assertEqual(len(timeline._get_unique_event_placement_tuple()), 4)
+        self.assertEqual(timeline._get_gap_index().get_free_start("a", 0, 1), 4)
+
+    def test_unique(self):
+        event = core_events.Concurrence([core_events.Chronon(1, tag="a")])
+        timeline = timeline_interfaces.ConcurrentTimeLine(unique=True)
+        timeline.register(timeline_interfaces.EventPlacement(event, 0, 2))
+        self.assertRaises(
+            timeline_utilities.DuplicateEventPlacementError,
+            timeline.register,
+            timeline_interfaces.EventPlacement(event, 0, 2),
+        )
+        self.assertEqual(len(timeline.event_placement_tuple), 1)
+
+    def test_copy(self):
+        event = core_events.Concurrence([core_events.Chronon(1, tag="a")])
+        timeline = timeline_interfaces.ConcurrentTimeLine(track_conflicts=True)
+        timeline.register(timeline_interfaces.EventPlacement(event, 0, 2))
+        timeline.register(timeline_interfaces.EventPlacement(event, 1, 3))
+        timeline_copy = timeline.copy()
+        self.assertEqual(len(timeline_copy.event_placement_tuple), 2)
+        self.assertTrue(timeline_copy.has_conflicts)
+        timeline_copy.resolve_conflicts()
+        self.assertFalse(timeline_copy.has_conflicts)
+        self.assertTrue(timeline.has_conflicts)